@@ -0,0 +1,115 @@
+import random
+import threading
+from typing import Dict, Iterable, List
+
+class AccountNumberAllocator:
+    """
+    O(1) allocator of unused account numbers.
+
+    Keeps every free number of the range in a list together with its position,
+    so allocating (a uniformly random pick swapped to the end and popped),
+    releasing (append) and reserving a specific number (swap-remove) are all
+    constant-time regardless of how full the bank is. Picks come from the
+    operating system's random source, so numbers cannot be predicted from
+    previously issued ones.
+    """
+
+    def __init__(self, low: int = 10000, high: int = 99999):
+        """
+        Initialize the allocator with every number of the range free.
+
+        Args:
+            low (int): Smallest account number (inclusive). Defaults to 10000.
+            high (int): Largest account number (inclusive). Defaults to 99999.
+        """
+        self.low = low
+        self.high = high
+        self._random = random.SystemRandom()
+        self._lock = threading.Lock()
+        self._free: List[int] = []
+        self._position: Dict[int, int] = {}
+        self.rebuild(())
+
+    def rebuild(self, used: Iterable[int]) -> None:
+        """
+        Reset the free list to every number of the range not in `used`.
+
+        Args:
+            used (Iterable[int]): Account numbers that are taken.
+        """
+        taken = set(used)
+        free = [number for number in range(self.low, self.high + 1) if number not in taken]
+        with self._lock:
+            self._free = free
+            self._position = {number: index for index, number in enumerate(free)}
+
+    def allocate(self) -> int:
+        """
+        Take a random free account number.
+
+        Returns:
+            int: The allocated number.
+
+        Raises:
+            ValueError: If every number of the range is in use ("Bank full").
+        """
+        with self._lock:
+            if not self._free:
+                raise ValueError("Bank full")
+            index = self._random.randrange(len(self._free))
+            self._swap_to_end(index)
+            number = self._free.pop()
+            del self._position[number]
+            return number
+
+    def reserve(self, number: int) -> bool:
+        """
+        Mark a specific number as used, e.g. an account added from storage.
+
+        Args:
+            number (int): The account number.
+
+        Returns:
+            bool: True if it was free, False if it was already in use or out of range.
+        """
+        with self._lock:
+            index = self._position.get(number)
+            if index is None:
+                return False
+            self._swap_to_end(index)
+            self._free.pop()
+            del self._position[number]
+            return True
+
+    def release(self, number: int) -> None:
+        """
+        Return a number to the free list after its account was removed.
+
+        Args:
+            number (int): The account number.
+        """
+        if not self.low <= number <= self.high:
+            return
+        with self._lock:
+            if number not in self._position:
+                self._position[number] = len(self._free)
+                self._free.append(number)
+
+    def free_count(self) -> int:
+        """
+        Returns the number of unused account numbers.
+
+        Returns:
+            int: Free numbers left in the range.
+        """
+        return len(self._free)
+
+    def _swap_to_end(self, index: int) -> None:
+        """
+        Swap the free number at `index` with the last one. Caller holds the lock.
+        """
+        last = len(self._free) - 1
+        if index != last:
+            moved = self._free[last]
+            self._free[index], self._free[last] = moved, self._free[index]
+            self._position[moved] = index
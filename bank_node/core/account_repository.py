@@ -1,5 +1,7 @@
-from typing import Dict, List, Optional
+import threading
+from typing import Dict, List, Optional, Any, Set, Tuple
 from bank_node.core.bank_account import BankAccount
+from bank_node.core.account_number_allocator import AccountNumberAllocator
 from bank_node.persistence.i_data_store import IDataStore
 
 class AccountRepository:
@@ -7,6 +9,20 @@ class AccountRepository:
     Repository for managing BankAccount entities.
     Abstracts the data persistence layer using IDataStore to provide
     a collection-like interface for accessing accounts.
+
+    Safe to use from several threads: structural changes and snapshots are
+    guarded by an internal lock, and saves are serialized so an older
+    snapshot can never overwrite a newer one.
+
+    The total capital and account count are maintained incrementally, so
+    reading them is O(1); balance changes made through `Bank` are reported
+    via `record_balance_change`.
+
+    Unused account numbers are tracked by an `AccountNumberAllocator` that
+    is rebuilt on load and kept in step with every add and remove.
+
+    Accounts added, changed or removed since the last save are tracked, so
+    data stores supporting `IDataStore.save_changes` only write those.
     """
     def __init__(self, data_store: IDataStore):
         """
@@ -17,6 +33,13 @@ class AccountRepository:
         """
         self._data_store = data_store
         self._accounts: Dict[int, BankAccount] = {}
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._total_capital = 0
+        self._number_allocator = AccountNumberAllocator()
+        # Account numbers changed or removed since the last save
+        self._dirty: Set[int] = set()
+        self._removed: Set[int] = set()
 
     def add_account(self, account: BankAccount) -> None:
         """
@@ -26,9 +49,18 @@ class AccountRepository:
             account (BankAccount): The account object to add.
         
         Side Effects:
-            Updates the internal memory cache. Does not auto-save to disk.
+            Updates the internal memory cache and the aggregates. Does not
+            auto-save to disk.
         """
-        self._accounts[account.number] = account
+        with self._lock:
+            previous = self._accounts.get(account.number)
+            if previous is not None:
+                self._total_capital -= previous.balance
+            self._accounts[account.number] = account
+            self._total_capital += account.balance
+            self._dirty.add(account.number)
+            self._removed.discard(account.number)
+        self._number_allocator.reserve(account.number)
 
     def get_account(self, number: int) -> Optional[BankAccount]:
         """
@@ -50,10 +82,95 @@ class AccountRepository:
             number (int): The account number to remove.
 
         Side Effects:
-            Removes the account from internal memory. Does not auto-save to disk.
+            Removes the account from internal memory and the aggregates. Does
+            not auto-save to disk.
+        """
+        with self._lock:
+            account = self._accounts.pop(number, None)
+            if account is not None:
+                self._total_capital -= account.balance
+                self._dirty.discard(number)
+                self._removed.add(number)
+        if account is not None:
+            self._number_allocator.release(number)
+
+    def allocate_number(self) -> int:
+        """
+        Reserve a random unused account number in O(1).
+
+        Returns:
+            int: The number, to be used for a new account passed to `add_account`.
+
+        Raises:
+            ValueError: If all account numbers are in use ("Bank full").
+        """
+        return self._number_allocator.allocate()
+
+    def release_number(self, number: int) -> None:
+        """
+        Return a number from `allocate_number` that was not used for an account.
+
+        Args:
+            number (int): The account number.
+        """
+        self._number_allocator.release(number)
+
+    def record_balance_change(self, delta: int, number: Optional[int] = None) -> None:
+        """
+        Apply a committed deposit or withdrawal to the total capital.
+
+        Args:
+            delta (int): The change of an account balance (negative for withdrawals).
+            number (Optional[int]): The changed account, marked dirty for the next save.
+        """
+        with self._lock:
+            self._total_capital += delta
+            if number is not None:
+                self._dirty.add(number)
+
+    def get_total_capital(self) -> int:
+        """
+        Returns the sum of all account balances in O(1).
+
+        Returns:
+            int: The total capital held by the managed accounts.
         """
-        if number in self._accounts:
-            del self._accounts[number]
+        return self._total_capital
+
+    def get_account_count(self) -> int:
+        """
+        Returns the number of managed accounts in O(1).
+
+        Returns:
+            int: The account count.
+        """
+        return len(self._accounts)
+
+    def verify_aggregates(self, repair: bool = False) -> Dict[str, Any]:
+        """
+        Compare the incremental aggregates with a full recomputation.
+
+        Only meaningful while no transaction is in flight, since a balance
+        change is applied to the account before it is recorded here.
+
+        Args:
+            repair (bool): Replace the incremental total with the recomputed one.
+
+        Returns:
+            Dict[str, Any]: Incremental and recomputed capital, the account
+            count, and whether the capital figures agree ("consistent").
+        """
+        with self._lock:
+            recomputed = sum(account.balance for account in self._accounts.values())
+            result = {
+                "total_capital": self._total_capital,
+                "recomputed_capital": recomputed,
+                "account_count": len(self._accounts),
+                "consistent": recomputed == self._total_capital,
+            }
+            if repair:
+                self._total_capital = recomputed
+        return result
 
     def get_all_accounts(self) -> List[BankAccount]:
         """
@@ -62,7 +179,8 @@ class AccountRepository:
         Returns:
             List[BankAccount]: A list of all managed BankAccount objects.
         """
-        return list(self._accounts.values())
+        with self._lock:
+            return list(self._accounts.values())
 
     def load(self) -> None:
         """
@@ -73,7 +191,7 @@ class AccountRepository:
             Clears existing memory and repopulates it from the data store.
         """
         data = self._data_store.load_data()
-        self._accounts.clear()
+        accounts: Dict[int, BankAccount] = {}
         
         # Expecting data to be a dictionary where keys are account numbers (str) and values are account data
         # or just a list/dict of accounts.
@@ -87,20 +205,62 @@ class AccountRepository:
                 # The key in JSON might be a string, but account number is int
                 # BankAccount.from_dict expects the dict to contain 'number'
                 account = BankAccount.from_dict(account_data)
-                self._accounts[account.number] = account
+                accounts[account.number] = account
             except (ValueError, TypeError):
                 # Skip invalid entries
                 continue
 
+        with self._lock:
+            self._accounts = accounts
+            self._total_capital = sum(account.balance for account in accounts.values())
+            self._dirty = set()
+            self._removed = set()
+        self._number_allocator.rebuild(accounts.keys())
+
+    def append_changes(self, changes: List[Tuple[str, Any]]) -> bool:
+        """
+        Persists individual bank events if the data store supports it.
+
+        Args:
+            changes (List[Tuple[str, Any]]): (event_type, data) tuples as notified by the Bank.
+
+        Returns:
+            bool: True if the store persisted the changes, False if the caller
+            has to `save()` the entire state instead.
+        """
+        return self._data_store.append_changes(changes)
+
     def save(self) -> None:
         """
-        Saves all accounts to the data store.
-        Converts BankAccount objects to dictionaries and persists them.
+        Saves the accounts to the data store.
+
+        Only accounts changed or removed since the last save are written if
+        the store supports `save_changes`; otherwise all accounts are
+        converted to dictionaries and persisted.
 
         Side Effects:
             Writes data to the underlying storage medium (file/db).
         """
-        data = {}
-        for number, account in self._accounts.items():
-            data[str(number)] = account.to_dict()
-        self._data_store.save_data(data)
+        with self._save_lock:
+            with self._lock:
+                dirty, self._dirty = self._dirty, set()
+                removed, self._removed = self._removed, set()
+            try:
+                changed = {}
+                for number in dirty:
+                    account = self.get_account(number)
+                    if account is not None:
+                        changed[str(number)] = account.to_dict()
+                if self._data_store.save_changes(changed, [str(number) for number in removed]):
+                    return
+
+                data = {}
+                for account in self.get_all_accounts():
+                    data[str(account.number)] = account.to_dict()
+                self._data_store.save_data(data)
+            except Exception:
+                # Keep the changes for the next save
+                with self._lock:
+                    self._dirty |= {n for n in dirty if n not in self._removed}
+                    self._removed |= {n for n in removed if n not in self._dirty}
+                raise
@@ -1,9 +1,10 @@
-import random
+import logging
 import threading
-from typing import Optional, List, Any
+from typing import Optional, Tuple, Any, List
 from bank_node.core.config_manager import ConfigManager
 from bank_node.core.account_repository import AccountRepository
 from bank_node.core.bank_account import BankAccount
+from bank_node.core.event_dispatcher import EventDispatcher, Event
 
 class Bank:
     """
@@ -11,6 +12,18 @@ class Bank:
     Manages accounts via AccountRepository, handles configuration, and provides
     a unified interface for transactions and account management. Implements
     the Observer pattern for event notifications.
+
+    Locking: balance changes only take the affected account's own lock, so
+    transactions on different accounts run in parallel. A structural lock
+    serializes account creation and removal. Events are published while
+    those locks are still held, so they are queued in the order the changes
+    happened; account numbers are reused as soon as an account is removed,
+    and a late transaction event would otherwise reach the journal after the
+    removal and be applied to the account that took the number over.
+
+    Events are delivered asynchronously: `notify` only queues them on an
+    `EventDispatcher`, whose thread calls the observers, so observer cost
+    (e.g. saving to disk) is not part of transaction latency.
     """
     _instance = None
 
@@ -35,8 +48,23 @@ class Bank:
             return
         
         self.config_manager = ConfigManager()
-        self._lock = threading.RLock()
-        self._observers: List[Any] = []
+        # Serializes create/remove; deposits and withdrawals never take it
+        self._structure_lock = threading.Lock()
+        self._observers_lock = threading.Lock()
+        # Replaced on (un)subscribe, so notify can iterate it without a lock
+        self._observers: Tuple[Any, ...] = ()
+        self.logger = logging.getLogger("Bank")
+
+        events_config = self.config_manager.get("events", {})
+        self.async_events = events_config.get("async_dispatch", True)
+        self.event_dispatcher = EventDispatcher(
+            self._deliver_events,
+            capacity=events_config.get("queue_capacity", 10000),
+            max_batch=events_config.get("max_batch", 256),
+            overflow_policy=events_config.get("overflow_policy", "block"),
+            on_drop=self._events_dropped,
+            block_timeout=events_config.get("block_timeout", 5.0)
+        )
         # In a real app, repo might be injected or created here based on config.
         # For this step, we allow injection for easier testing, or assume it's set later.
         self.account_repository = account_repository
@@ -55,12 +83,15 @@ class Bank:
         """
         Adds an observer to the list for event notifications.
 
+        Observers that also implement `update_batch(events)` receive each
+        delivered batch of (event_type, data) tuples in a single call instead.
+
         Args:
             observer (Any): The observer object (must implement `update(event_type, data)`).
         """
-        with self._lock:
+        with self._observers_lock:
             if observer not in self._observers:
-                self._observers.append(observer)
+                self._observers = self._observers + (observer,)
 
     def unsubscribe(self, observer: Any):
         """
@@ -69,51 +100,127 @@ class Bank:
         Args:
             observer (Any): The observer object to remove.
         """
-        with self._lock:
+        with self._observers_lock:
             if observer in self._observers:
-                self._observers.remove(observer)
+                self._observers = tuple(o for o in self._observers if o is not observer)
 
     def notify(self, event_type: str, data: Any = None):
         """
         Notifies all observers of an event.
 
+        Queues the event for the dispatcher thread and returns at once, unless
+        `events.async_dispatch` is off, in which case observers are called
+        inline. Called while holding the lock of the changed account (and the
+        structure lock for creations and removals), so inline observers must
+        not call back into the bank.
+
         Args:
             event_type (str): The type/name of the event (e.g., "transaction", "account_created").
             data (Any, optional): Additional data associated with the event.
+
+        Raises:
+            ValueError: If the event queue stayed full for `events.block_timeout`
+                seconds. The event is not published, so the caller undoes its
+                change before the lock is released.
+        """
+        if not self._observers:
+            return
+        if self.async_events:
+            try:
+                self.event_dispatcher.publish(event_type, data)
+            except TimeoutError:
+                raise ValueError("Bank is busy, try again later.")
+        else:
+            self._deliver_events([(event_type, data)])
+
+    def flush_events(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every event notified so far has been delivered to the observers.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait; None waits indefinitely.
+
+        Returns:
+            bool: True if all events were delivered in time.
+        """
+        return self.event_dispatcher.flush(timeout)
+
+    def _events_dropped(self, count: int) -> None:
+        """
+        Tell observers that events were dropped by the "drop" overflow policy.
+
+        Observers implementing `events_dropped(count)` are called, so they can
+        recover (e.g. `AutoSaver` schedules a save from the repository state).
+
+        Args:
+            count (int): Number of dropped events.
+        """
+        self.logger.warning(f"Dropped {count} bank event(s): event queue full.")
+        for observer in self._observers:
+            handler = getattr(observer, "events_dropped", None)
+            if handler is None:
+                continue
+            try:
+                handler(count)
+            except Exception as e:
+                self.logger.error(f"Observer {observer!r} failed: {e}", exc_info=True)
+
+    def _deliver_events(self, events: List[Event]) -> None:
+        """
+        Hand a batch of events to every observer.
+
+        A failing observer is logged and does not keep the others from
+        receiving the batch.
+
+        Args:
+            events (List[Event]): The (event_type, data) tuples, in notify order.
         """
-        observers_copy = self._observers[:] 
-        for observer in observers_copy:
-            observer.update(event_type, data)
+        for observer in self._observers:
+            try:
+                update_batch = getattr(observer, "update_batch", None)
+                if update_batch is not None:
+                    update_batch(events)
+                else:
+                    for event_type, data in events:
+                        observer.update(event_type, data)
+            except Exception as e:
+                self.logger.error(f"Observer {observer!r} failed: {e}", exc_info=True)
 
     def create_account(self) -> int:
         """
-        Generates a unique 5-digit account number and creates a new BankAccount.
+        Allocates a random unused 5-digit account number and creates a new BankAccount.
 
         Returns:
             int: The unique account number of the created account.
 
         Raises:
             RuntimeError: If the account repository is not initialized.
+            ValueError: If every account number is in use ("Bank full"), or
+                the event queue is full ("Bank is busy").
             
         Side Effects:
             Adds the new account to the repository and notifies observers.
         """
-        with self._lock:
+        with self._structure_lock:
             if not self.account_repository:
                 raise RuntimeError("Account repository not initialized.")
 
-            # Try generating a unique number
-            while True:
-                number = random.randint(10000, 99999)
-                if self.account_repository.get_account(number) is None:
-                    break
-            
+            # O(1) pick from the repository's free list of numbers
+            number = self.account_repository.allocate_number()
+
+            # Published before the account becomes reachable, so its creation
+            # is queued ahead of any transaction on it
+            try:
+                self.notify("account_created", {"account_number": number})
+            except ValueError:
+                self.account_repository.release_number(number)
+                raise
+
             # Default balance 0
             account = BankAccount(number, 0)
             self.account_repository.add_account(account)
             # self.account_repository.save() # Removed in favor of Observer
-            self.notify("account_created", {"account_number": number})
-            return number
+        return number
 
     def get_balance(self, account_number: int) -> int:
         """
@@ -144,19 +251,26 @@ class Bank:
             int: The new balance of the account.
 
         Raises:
-            ValueError: If the account doesn't exist or amount is invalid.
+            ValueError: If the account doesn't exist, amount is invalid, or the
+                event queue is full ("Bank is busy"); the balance is then unchanged.
             RuntimeError: If the repository is not initialized.
 
         Side Effects:
             Updates account balance and notifies observers of the transaction.
         """
-        with self._lock:
-            account = self._get_account_or_raise(account_number)
+        account = self._get_account_or_raise(account_number)
+        # Serialized by the account's own lock only, which stays held until
+        # the event is queued
+        with account.lock:
             new_balance = account.deposit(amount)
-            # if self.account_repository:
-            #     self.account_repository.save()
-            self.notify("transaction", {"type": "deposit", "account": account_number, "amount": amount})
-            return new_balance
+            try:
+                self.notify("transaction", {"type": "deposit", "account": account_number, "amount": amount})
+            except ValueError:
+                # Not published, so nobody may see it
+                account.balance -= amount
+                raise
+            self.account_repository.record_balance_change(amount, account_number)
+        return new_balance
 
     def withdraw(self, account_number: int, amount: int) -> int:
         """
@@ -170,19 +284,26 @@ class Bank:
             int: The new balance of the account.
 
         Raises:
-            ValueError: If account missing, amount invalid, or insufficient funds.
+            ValueError: If account missing, amount invalid, insufficient funds, or
+                the event queue is full ("Bank is busy"); the balance is then unchanged.
             RuntimeError: If the repository is not initialized.
 
         Side Effects:
             Updates account balance and notifies observers of the transaction.
         """
-        with self._lock:
-            account = self._get_account_or_raise(account_number)
+        account = self._get_account_or_raise(account_number)
+        # Serialized by the account's own lock only, which stays held until
+        # the event is queued
+        with account.lock:
             new_balance = account.withdraw(amount)
-            # if self.account_repository:
-            #     self.account_repository.save()
-            self.notify("transaction", {"type": "withdraw", "account": account_number, "amount": amount})
-            return new_balance
+            try:
+                self.notify("transaction", {"type": "withdraw", "account": account_number, "amount": amount})
+            except ValueError:
+                # Not published, so nobody may see it
+                account.balance += amount
+                raise
+            self.account_repository.record_balance_change(-amount, account_number)
+        return new_balance
 
     def remove_account(self, account_number: int) -> None:
         """
@@ -192,31 +313,40 @@ class Bank:
             account_number (int): The account number to remove.
 
         Raises:
-            ValueError: If the account does not exist or has a non-zero balance.
+            ValueError: If the account does not exist, has a non-zero balance,
+                or the event queue is full ("Bank is busy").
             RuntimeError: If the repository is not initialized.
 
         Side Effects:
             Removes the account from the repository and notifies observers.
         """
-        with self._lock:
+        with self._structure_lock:
             account = self._get_account_or_raise(account_number)
-            if account.balance > 0:
-                raise ValueError("Cannot delete account with funds.")
-            
+            # Close under the account lock so a concurrent deposit cannot
+            # land in an account that is being removed
+            with account.lock:
+                if account.balance > 0:
+                    raise ValueError("Cannot delete account with funds.")
+                account.closed = True
+                # Before the number can be handed out again
+                try:
+                    self.notify("account_removed", {"account_number": account_number})
+                except ValueError:
+                    account.closed = False
+                    raise
+
             self.account_repository.remove_account(account_number)
-            self.notify("account_removed", {"account_number": account_number})
 
     def get_total_capital(self) -> int:
         """
-        Sums all account balances to calculate the bank's total capital.
+        Returns the bank's total capital, maintained incrementally by the repository.
 
         Returns:
             int: The sum of balances of all accounts.
         """
         if not self.account_repository:
             return 0
-        accounts = self.account_repository.get_all_accounts()
-        return sum(acc.balance for acc in accounts)
+        return self.account_repository.get_total_capital()
 
     def get_client_count(self) -> int:
         """
@@ -227,7 +357,7 @@ class Bank:
         """
         if not self.account_repository:
             return 0
-        return len(self.account_repository.get_all_accounts())
+        return self.account_repository.get_account_count()
 
     def _get_account_or_raise(self, account_number: int) -> BankAccount:
         """
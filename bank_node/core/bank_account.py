@@ -1,5 +1,8 @@
 import threading
 
+# Largest balance (and amount) an account can hold: persisted as a signed 64-bit integer
+MAX_BALANCE = 2 ** 63 - 1
+
 class BankAccount:
     """
     Represents a bank account with thread-safe balance operations.
@@ -19,7 +22,10 @@ class BankAccount:
         self._validate_account_number(number)
         self.number = number
         self.balance = balance
-        self.lock = threading.Lock()
+        # Reentrant: Bank holds it across a balance change and its event
+        self.lock = threading.RLock()
+        # Set (under `lock`) when the account is removed from the bank
+        self.closed = False
 
     def _validate_account_number(self, number: int):
         """
@@ -45,7 +51,8 @@ class BankAccount:
             int: The new balance after the deposit.
             
         Raises:
-            ValueError: If the amount is not positive.
+            ValueError: If the amount is not positive, the balance would exceed
+                `MAX_BALANCE` or the account is closed.
 
         Example:
             >>> account.deposit(100)
@@ -53,8 +60,14 @@ class BankAccount:
         """
         if amount <= 0:
             raise ValueError("Deposit amount must be positive.")
+        if amount > MAX_BALANCE:
+            raise ValueError("Deposit amount is too large.")
         
         with self.lock:
+            if self.closed:
+                raise ValueError(f"Account {self.number} is closed.")
+            if self.balance > MAX_BALANCE - amount:
+                raise ValueError("Balance limit exceeded.")
             self.balance += amount
             return self.balance
 
@@ -69,7 +82,8 @@ class BankAccount:
             int: The new balance after the withdrawal.
             
         Raises:
-            ValueError: If the amount is not positive or funds are insufficient.
+            ValueError: If the amount is not positive, funds are insufficient
+                or the account is closed.
 
         Example:
             >>> account.withdraw(50)
@@ -77,8 +91,12 @@ class BankAccount:
         """
         if amount <= 0:
             raise ValueError("Withdrawal amount must be positive.")
+        if amount > MAX_BALANCE:
+            raise ValueError("Withdrawal amount is too large.")
         
         with self.lock:
+            if self.closed:
+                raise ValueError(f"Account {self.number} is closed.")
             if self.balance < amount:
                 raise ValueError("Insufficient funds.")
             self.balance -= amount
@@ -0,0 +1,230 @@
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+Event = Tuple[str, Any]
+
+class EventDispatcher:
+    """
+    Bounded event queue drained by a single background delivery thread.
+
+    `publish` appends an event in O(1) and returns; the dispatcher thread takes
+    up to `max_batch` queued events at a time and hands them to `deliver`, so
+    the cost of observers never lands on the publishing thread. When the queue
+    is full the `overflow_policy` decides what happens: "block" makes the
+    publisher wait for space (backpressure) and never loses an event, but
+    gives up after `block_timeout` seconds with a `TimeoutError`, so a stalled
+    observer cannot hang publishers for good; "drop" drops the event at once
+    and reports it through `on_drop`, so observers that must see every change
+    (persistence) can recover. Dropped and timed-out events are counted in
+    `stats`.
+    """
+
+    def __init__(self, deliver: Callable[[List[Event]], None], capacity: int = 10000,
+                 max_batch: int = 256, overflow_policy: str = "block",
+                 on_drop: Optional[Callable[[int], None]] = None,
+                 block_timeout: Optional[float] = 5.0):
+        """
+        Initialize the EventDispatcher.
+
+        The delivery thread is started on the first `publish`.
+
+        Args:
+            deliver (Callable[[List[Event]], None]): Called on the dispatcher
+                thread with each batch of (event_type, data) tuples, in order.
+            capacity (int): Maximum number of queued, undelivered events.
+            max_batch (int): Maximum number of events passed to one `deliver` call.
+            overflow_policy (str): "block" or "drop" (see class docstring).
+            on_drop (Optional[Callable[[int], None]]): Called on the publishing
+                thread with the number of events the "drop" policy dropped.
+            block_timeout (Optional[float]): Maximum seconds the "block" policy
+                waits for space; None waits indefinitely.
+
+        Raises:
+            ValueError: If `overflow_policy` is not "block" or "drop".
+        """
+        if overflow_policy not in ("block", "drop"):
+            raise ValueError(f"Unknown overflow policy: {overflow_policy}")
+        self.deliver = deliver
+        self.capacity = capacity
+        self.max_batch = max_batch
+        self.overflow_policy = overflow_policy
+        self.on_drop = on_drop
+        self.block_timeout = block_timeout
+        self.logger = logging.getLogger("EventDispatcher")
+
+        self._cond = threading.Condition(threading.Lock())
+        self._queue: Deque[Event] = deque()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+        # Events are numbered in publish order; flush waits on these counters
+        self._published = 0
+        self._delivered = 0
+
+        # Statistics
+        self._dropped = 0
+        self._blocked = 0
+        self._timeouts = 0
+        self._batches = 0
+        self._errors = 0
+        self._max_depth = 0
+
+    def publish(self, event_type: str, data: Any = None) -> bool:
+        """
+        Queue an event for delivery.
+
+        Under the "block" policy this waits while the queue is full, for at
+        most `block_timeout` seconds. Once the dispatcher is closed, events are
+        delivered on the calling thread instead.
+
+        Args:
+            event_type (str): The type/name of the event.
+            data (Any, optional): Additional data associated with the event.
+
+        Returns:
+            bool: True if the event was queued or delivered, False if the
+            "drop" policy dropped it (after `on_drop` was called).
+
+        Raises:
+            TimeoutError: If the "block" policy found no space within
+                `block_timeout`; the event is not queued.
+        """
+        with self._cond:
+            if not self._closed:
+                if self._thread is None:
+                    self._start()
+
+                # An observer publishing from the dispatcher thread must never
+                # wait for itself to make room
+                full = (len(self._queue) >= self.capacity
+                        and threading.current_thread() is not self._thread)
+                if full and self.overflow_policy == "drop":
+                    self._dropped += 1
+                else:
+                    if full:
+                        self._blocked += 1
+                        if self.block_timeout is not None:
+                            deadline = time.monotonic() + self.block_timeout
+                    while (len(self._queue) >= self.capacity and not self._closed
+                           and threading.current_thread() is not self._thread):
+                        if self.block_timeout is None:
+                            self._cond.wait()
+                            continue
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._timeouts += 1
+                            self.logger.warning(f"Event queue still full after {self.block_timeout}s; "
+                                                f"rejecting {event_type!r} event.")
+                            raise TimeoutError("Event queue full")
+                        self._cond.wait(remaining)
+                    if not self._closed:
+                        self._queue.append((event_type, data))
+                        self._published += 1
+                        self._max_depth = max(self._max_depth, len(self._queue))
+                        self._cond.notify_all()
+                        return True
+            closed = self._closed
+
+        if closed:
+            self.deliver([(event_type, data)])
+            return True
+        if self.on_drop is not None:
+            self.on_drop(1)
+        return False
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every event published before this call has been delivered.
+
+        Must not be called from an observer (the dispatcher thread).
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait; None waits indefinitely.
+
+        Returns:
+            bool: True if all those events were delivered in time.
+        """
+        with self._cond:
+            target = self._published
+            return self._cond.wait_for(lambda: self._delivered >= target, timeout)
+
+    def close(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Deliver the queued events and stop the dispatcher thread.
+
+        Events published afterwards are delivered on the publishing thread.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait for the queue to drain.
+
+        Returns:
+            bool: True if every queued event was delivered.
+        """
+        drained = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        return drained
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return dispatcher statistics.
+
+        Returns:
+            Dict[str, Any]: Current and maximum queue depth, capacity, and
+            published, delivered, dropped, blocked-publisher, timed-out
+            publisher, batch and observer error counts.
+        """
+        with self._cond:
+            return {
+                "queued": len(self._queue),
+                "max_depth": self._max_depth,
+                "capacity": self.capacity,
+                "published": self._published,
+                "delivered": self._delivered,
+                "dropped": self._dropped,
+                "blocked": self._blocked,
+                "timeouts": self._timeouts,
+                "batches": self._batches,
+                "errors": self._errors,
+            }
+
+    def _start(self) -> None:
+        """
+        Start the dispatcher thread. Caller holds the lock.
+        """
+        self._thread = threading.Thread(target=self._run, name="EventDispatcher", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """
+        Dispatcher loop: take batches off the queue and deliver them until closed.
+        """
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                count = min(len(self._queue), self.max_batch)
+                batch = [self._queue.popleft() for _ in range(count)]
+                # Wake producers blocked on a full queue
+                self._cond.notify_all()
+
+            try:
+                self.deliver(batch)
+            except Exception as e:
+                with self._cond:
+                    self._errors += 1
+                self.logger.error(f"Event delivery failed: {e}", exc_info=True)
+
+            with self._cond:
+                self._delivered += count
+                self._batches += 1
+                self._cond.notify_all()
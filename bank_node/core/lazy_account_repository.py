@@ -0,0 +1,329 @@
+import logging
+import weakref
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Set
+from bank_node.core.account_repository import AccountRepository
+from bank_node.core.bank_account import BankAccount
+from bank_node.persistence.sqlite_data_store import SqliteDataStore
+
+class LazyAccountRepository(AccountRepository):
+    """
+    AccountRepository that keeps only a bounded working set of accounts in memory.
+
+    Accounts are read from SQLite on first access into an LRU cache of at
+    most `cache_size` accounts. Evicted accounts with unsaved changes are
+    written back before they are dropped. Loading only reads the account
+    numbers (for the number allocator) and the aggregates the store keeps in
+    its 'bank_stats' table, so startup does not materialize the ledger.
+
+    An account object still referenced elsewhere (e.g. by a transaction in
+    progress) stays reachable through a weak map after eviction, so there is
+    never more than one live object per account.
+    """
+
+    def __init__(self, data_store: SqliteDataStore, cache_size: int = 10000):
+        """
+        Initialize the LazyAccountRepository.
+
+        Args:
+            data_store (SqliteDataStore): The SQLite store to read accounts from.
+            cache_size (int): Maximum number of accounts kept in memory.
+        """
+        super().__init__(data_store)
+        self.cache_size = cache_size
+        self.logger = logging.getLogger("LazyAccountRepository")
+        # Resident working set in LRU order (most recently used last)
+        self._accounts: "OrderedDict[int, BankAccount]" = OrderedDict()
+        # Every account object alive in the process, resident or not
+        self._live: "weakref.WeakValueDictionary[int, BankAccount]" = weakref.WeakValueDictionary()
+        # Removed accounts whose DELETE a running save has not committed yet
+        self._removing: Set[int] = set()
+        self._account_count = 0
+        self._misses = 0
+        self._evictions = 0
+        self._write_backs = 0
+
+    def add_account(self, account: BankAccount) -> None:
+        """
+        Adds an account to the repository.
+
+        Args:
+            account (BankAccount): The account object to add.
+
+        Side Effects:
+            Updates the working set and the aggregates, possibly evicting
+            (and writing back) the least recently used accounts.
+        """
+        with self._lock:
+            previous = self._live.get(account.number)
+            if previous is not None:
+                self._total_capital -= previous.balance
+            else:
+                self._account_count += 1
+            self._accounts[account.number] = account
+            self._accounts.move_to_end(account.number)
+            self._live[account.number] = account
+            self._total_capital += account.balance
+            self._dirty.add(account.number)
+            self._removed.discard(account.number)
+            self._removing.discard(account.number)
+            evicted = self._evict()
+        self._number_allocator.reserve(account.number)
+        self._write_back(evicted)
+
+    def get_account(self, number: int) -> Optional[BankAccount]:
+        """
+        Retrieves an account by its number, reading it from SQLite if it is
+        not in memory.
+
+        Args:
+            number (int): The account number to look up.
+
+        Returns:
+            Optional[BankAccount]: The account object if found, otherwise None.
+        """
+        with self._lock:
+            account = self._accounts.get(number)
+            if account is not None:
+                self._accounts.move_to_end(number)
+                return account
+            account = self._live.get(number)
+            if account is None and self._is_removed(number):
+                return None
+
+        if account is None:
+            data = self._data_store.load_account(str(number))
+            if data is None:
+                return None
+            account = BankAccount.from_dict(data)
+
+        with self._lock:
+            self._misses += 1
+            if self._is_removed(number):
+                # Removed while it was being read, or its row is still being deleted
+                return None
+            # Another thread may have loaded it meanwhile; keep the first object
+            account = self._live.setdefault(number, account)
+            self._accounts[number] = account
+            self._accounts.move_to_end(number)
+            evicted = self._evict()
+        self._write_back(evicted)
+        return account
+
+    def remove_account(self, number: int) -> None:
+        """
+        Removes an account from the repository.
+
+        Args:
+            number (int): The account number to remove.
+
+        Side Effects:
+            Removes the account from memory and the aggregates; the row is
+            deleted on the next save.
+        """
+        account = self.get_account(number)
+        if account is None:
+            return
+        with self._lock:
+            self._accounts.pop(number, None)
+            self._live.pop(number, None)
+            self._total_capital -= account.balance
+            self._account_count -= 1
+            self._dirty.discard(number)
+            self._removed.add(number)
+        self._number_allocator.release(number)
+
+    def record_balance_change(self, delta: int, number: Optional[int] = None) -> None:
+        """
+        Apply a committed deposit or withdrawal to the total capital.
+
+        The changed account is put back into the working set if it had been
+        evicted while the transaction was running, so the change is saved.
+        Called under the account's lock, so nothing is evicted (and written
+        back) here; the working set shrinks back on the next load.
+
+        Args:
+            delta (int): The change of an account balance (negative for withdrawals).
+            number (Optional[int]): The changed account, marked dirty for the next save.
+        """
+        with self._lock:
+            self._total_capital += delta
+            if number is not None:
+                self._dirty.add(number)
+                account = self._live.get(number)
+                if account is not None and number not in self._accounts:
+                    self._accounts[number] = account
+
+    def get_account_count(self) -> int:
+        """
+        Returns the number of managed accounts in O(1).
+
+        Returns:
+            int: The account count, including accounts not in memory.
+        """
+        return self._account_count
+
+    def verify_aggregates(self, repair: bool = False) -> Dict[str, Any]:
+        """
+        Compare the incremental aggregates with a full recomputation.
+
+        Reads every account from SQLite, so it is expensive on large ledgers.
+        Only meaningful while no transaction is in flight.
+
+        Args:
+            repair (bool): Replace the incremental total with the recomputed one.
+
+        Returns:
+            Dict[str, Any]: Incremental and recomputed capital, the account
+            count, and whether the capital figures agree ("consistent").
+        """
+        accounts = self.get_all_accounts()
+        recomputed = sum(account.balance for account in accounts)
+        with self._lock:
+            result = {
+                "total_capital": self._total_capital,
+                "recomputed_capital": recomputed,
+                "account_count": len(accounts),
+                "consistent": recomputed == self._total_capital,
+            }
+            if repair:
+                self._total_capital = recomputed
+        return result
+
+    def get_all_accounts(self) -> List[BankAccount]:
+        """
+        Returns a list of all accounts, reading those not in memory from SQLite.
+
+        Accounts read for this call are not added to the working set.
+
+        Returns:
+            List[BankAccount]: A list of all managed BankAccount objects.
+        """
+        data = self._data_store.load_data()
+        with self._lock:
+            accounts = {number: account for number, account in self._live.items()}
+            removed = self._removed | self._removing
+        for account_data in data.values():
+            number = account_data['number']
+            if number not in accounts and number not in removed:
+                accounts[number] = BankAccount.from_dict(account_data)
+        return list(accounts.values())
+
+    def load(self) -> None:
+        """
+        Prepares the repository from the store without loading any account.
+
+        Rebuilds the number allocator from the stored account numbers and
+        takes the account count and total capital from the store.
+
+        Side Effects:
+            Clears the working set.
+        """
+        numbers = self._data_store.load_account_ids()
+        count, total_capital = self._data_store.load_aggregates()
+        with self._lock:
+            self._accounts = OrderedDict()
+            self._live = weakref.WeakValueDictionary()
+            self._account_count = count
+            self._total_capital = total_capital
+            self._dirty = set()
+            self._removed = set()
+            self._removing = set()
+        self._number_allocator.rebuild(numbers)
+
+    def save(self) -> None:
+        """
+        Saves the accounts changed or removed since the last save.
+
+        Side Effects:
+            Writes the changed rows to SQLite.
+        """
+        with self._save_lock:
+            with self._lock:
+                dirty, self._dirty = self._dirty, set()
+                removed, self._removed = self._removed, set()
+                # Until the DELETE commits, a cache miss would still find the row
+                self._removing = set(removed)
+                changed = [self._live.get(number) for number in dirty]
+            try:
+                self._data_store.save_changes(
+                    {str(account.number): account.to_dict() for account in changed if account is not None},
+                    [str(number) for number in removed]
+                )
+            except Exception:
+                # Keep the changes for the next save
+                with self._lock:
+                    self._dirty |= {n for n in dirty if n not in self._removed}
+                    self._removed |= {n for n in removed if n not in self._dirty}
+                    self._removing = set()
+                raise
+            with self._lock:
+                self._removing = set()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return working set statistics.
+
+        Returns:
+            Dict[str, Any]: Resident and live account counts, the cache size,
+            and store reads (misses), evictions and eviction write-backs.
+        """
+        with self._lock:
+            return {
+                "resident": len(self._accounts),
+                "live": len(self._live),
+                "cache_size": self.cache_size,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "write_backs": self._write_backs,
+            }
+
+    def _is_removed(self, number: int) -> bool:
+        """
+        Check whether an account was removed but its row may still be stored.
+        Caller holds the lock.
+        """
+        return number in self._removed or number in self._removing
+
+    def _evict(self) -> List[BankAccount]:
+        """
+        Drop least recently used accounts beyond `cache_size`. Caller holds the lock.
+
+        Returns:
+            List[BankAccount]: Evicted accounts with unsaved changes, to be
+            passed to `_write_back` after the lock is released.
+        """
+        evicted = []
+        while len(self._accounts) > self.cache_size:
+            number, account = self._accounts.popitem(last=False)
+            self._evictions += 1
+            if number in self._dirty:
+                self._dirty.discard(number)
+                evicted.append(account)
+        return evicted
+
+    def _write_back(self, evicted: List[BankAccount]) -> None:
+        """
+        Save evicted accounts with unsaved changes.
+
+        Serialized with `save` so an older state never overwrites a newer one.
+        On failure the accounts stay dirty and are kept alive in the working
+        set until a later save succeeds.
+        """
+        if not evicted:
+            return
+        with self._save_lock:
+            try:
+                self._data_store.save_changes(
+                    {str(account.number): account.to_dict() for account in evicted}, []
+                )
+            except Exception as e:
+                self.logger.error(f"Writing back evicted accounts failed: {e}", exc_info=True)
+                with self._lock:
+                    for account in evicted:
+                        if not self._is_removed(account.number):
+                            self._dirty.add(account.number)
+                            self._accounts[account.number] = account
+                return
+        with self._lock:
+            self._write_backs += len(evicted)
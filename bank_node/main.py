@@ -11,10 +11,21 @@ import time
 from bank_node.core.config_manager import ConfigManager
 from bank_node.core.bank import Bank
 from bank_node.core.account_repository import AccountRepository
+from bank_node.core.lazy_account_repository import LazyAccountRepository
 from bank_node.persistence.json_data_store import JsonDataStore
 from bank_node.persistence.sqlite_data_store import SqliteDataStore
+from bank_node.persistence.journal_data_store import JournalDataStore
 from bank_node.persistence.auto_saver import AutoSaver
 from bank_node.network.tcp_server import TcpServer
+from bank_node.network.async_tcp_server import AsyncTcpServer
+from bank_node.network.client_handler import get_command_factory
+from bank_node.network.connection_pool import get_connection_pool
+from bank_node.network.async_proxy_transport import get_async_proxy_transport
+from bank_node.utils.ip_helper import (
+    refresh_local_addresses,
+    start_local_address_refresher,
+    stop_local_address_refresher,
+)
 
 def setup_logging(config: ConfigManager):
     """
@@ -56,10 +67,10 @@ def main():
     Orchestrates the startup of the Bank Peer-to-Peer Node:
     1. Loads configuration.
     2. Initializes logging.
-    3. Sets up the persistence layer (JSON or SQLite).
+    3. Sets up the persistence layer (JSON, SQLite or journal).
     4. Initializes the Bank facade and AccountRepository.
     5. Sets up the AutoSaver observer.
-    6. Starts the TCP server.
+    6. Starts the TCP server using the configured engine (threaded or asyncio).
     
     Handles the main application lifecycle and graceful shutdown on interrupts.
 
@@ -86,37 +97,69 @@ def main():
         
         if store_type == "sqlite":
             db_path = persistence_config.get("file_path", "bank_data.db")
-            data_store = SqliteDataStore(db_path)
-            logger.info(f"Using SQLite persistence: {db_path}")
+            data_store = SqliteDataStore(db_path, persistence_config.get("sqlite_synchronous", "NORMAL"))
+            logger.info(f"Using SQLite persistence: {db_path} (WAL, synchronous={data_store.synchronous})")
+        elif store_type == "journal":
+            db_path = persistence_config.get("file_path", "bank_data.json")
+            data_store = JournalDataStore(
+                db_path,
+                fsync=persistence_config.get("journal_fsync", True),
+                snapshot_every=persistence_config.get("snapshot_every", 10000)
+            )
+            logger.info(f"Using journal persistence: {db_path} (journal {data_store.journal_path})")
         else:
             db_path = persistence_config.get("file_path", "bank_data.json")
             data_store = JsonDataStore(db_path)
             logger.info(f"Using JSON persistence: {db_path}")
 
-        account_repository = AccountRepository(data_store)
+        if persistence_config.get("lazy_load", False) and store_type == "sqlite":
+            cache_size = persistence_config.get("cache_size", 10000)
+            account_repository = LazyAccountRepository(data_store, cache_size)
+            logger.info(f"Lazy loading enabled, keeping at most {cache_size} accounts in memory.")
+        else:
+            if persistence_config.get("lazy_load", False):
+                logger.warning("persistence.lazy_load requires SQLite persistence; loading all accounts.")
+            account_repository = AccountRepository(data_store)
         
         # Load existing data
         logger.info(f"Loading data from {db_path}...")
         account_repository.load()
-        logger.info(f"Loaded {len(account_repository.get_all_accounts())} accounts.")
+        logger.info(f"Loaded {account_repository.get_account_count()} accounts.")
 
         # 4. Initialize Bank (Facade)
         bank = Bank(account_repository)
+        if store_type == "journal" and bank.event_dispatcher.overflow_policy != "block":
+            # Every event is a journal record; a dropped one would be lost for good
+            logger.warning("Journal persistence requires events.overflow_policy \"block\"; using it.")
+            bank.event_dispatcher.overflow_policy = "block"
         
         # 5. Initialize AutoSaver (Observer)
         auto_saver = AutoSaver(account_repository)
         bank.subscribe(auto_saver)
-        logger.info("AutoSaver initialized and subscribed to Bank events.")
+        logger.info(f"AutoSaver initialized and subscribed to Bank events "
+                    f"(flush interval {auto_saver.flush_interval * 1000:.0f} ms, max batch {auto_saver.max_batch}).")
+
+        # Build the shared, frozen command dispatch table once
+        get_command_factory()
+
+        # Resolve local interface addresses once, then keep them current in
+        # the background, off the request path
+        logger.info(f"Local addresses: {sorted(refresh_local_addresses())}")
+        start_local_address_refresher()
 
         # 6. Initialize TCP Server
         server_config = config_manager.get("server", {})
         host = server_config.get("ip", "127.0.0.1")
         port = server_config.get("port", 65525)
+        engine = server_config.get("engine", "threaded").lower()
         
-        server = TcpServer(host, port)
+        if engine == "asyncio":
+            server = AsyncTcpServer(host, port)
+        else:
+            server = TcpServer(host, port)
         
         # 7. Start Server
-        logger.info(f"Starting TCP Server on {host}:{port}...")
+        logger.info(f"Starting TCP Server ({engine} engine) on {host}:{port}...")
         server.start()
 
     except KeyboardInterrupt:
@@ -126,6 +169,17 @@ def main():
     finally:
         if 'server' in locals() and server.is_running:
             server.stop()
+        # Deliver pending bank events (e.g. the final AutoSaver save)
+        if not Bank().event_dispatcher.close():
+            logger.warning("Not all bank events were delivered before shutdown.")
+        if 'auto_saver' in locals():
+            auto_saver.close()
+            logger.info(f"AutoSaver stats: {auto_saver.stats()}")
+        if 'data_store' in locals():
+            data_store.close()
+        get_connection_pool().close_all()
+        get_async_proxy_transport().close()
+        stop_local_address_refresher()
         logger.info("Application stopped.")
 
 if __name__ == "__main__":
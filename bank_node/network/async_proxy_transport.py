@@ -0,0 +1,317 @@
+import asyncio
+import threading
+import logging
+from collections import deque
+from typing import Deque, Dict, List, Tuple, Optional, Any
+from bank_node.core.config_manager import ConfigManager
+
+class _PeerChannel:
+    """
+    One persistent, pipelined connection to a peer.
+
+    Requests are written back to back without waiting for replies; the reader
+    task resolves the pending futures strictly in FIFO order, which matches
+    the order in which a bank node answers the lines of one connection.
+    """
+
+    def __init__(self, key: Tuple[str, int], reader: asyncio.StreamReader,
+                 writer: asyncio.StreamWriter, now: float):
+        """
+        Initialize the _PeerChannel.
+
+        Args:
+            key (Tuple[str, int]): The peer's (host, port).
+            reader (asyncio.StreamReader): The connection's reader.
+            writer (asyncio.StreamWriter): The connection's writer.
+            now (float): The event loop time at creation.
+        """
+        self.key = key
+        self.reader = reader
+        self.writer = writer
+        self.pending: Deque[asyncio.Future] = deque()
+        self.closed = False
+        self.last_used = now
+
+class AsyncProxyTransport:
+    """
+    Asyncio transport multiplexing forwarded commands over persistent connections.
+
+    A single background thread runs an event loop that keeps up to
+    `connections_per_peer` pipelined connections open to every peer, so any
+    number of requests can be in flight without a thread blocked on each
+    socket. Both call styles are supported: `send_command` blocks the calling
+    thread, `send_command_async` can be awaited from any event loop.
+
+    Because replies are matched to requests in FIFO order, a request that
+    times out or a connection that breaks fails every request queued behind
+    it on the same connection; the connection is then closed and replaced.
+    """
+
+    def __init__(self, connections_per_peer: int = 4, max_line_length: int = 65536,
+                 idle_timeout: float = 30.0):
+        """
+        Initialize the AsyncProxyTransport.
+
+        Args:
+            connections_per_peer (int): Maximum pipelined connections per peer.
+            max_line_length (int): Maximum accepted reply length in bytes.
+            idle_timeout (float): Seconds after which an idle connection is replaced.
+        """
+        self.connections_per_peer = max(1, connections_per_peer)
+        self.max_line_length = max_line_length
+        self.idle_timeout = idle_timeout
+        self.logger = logging.getLogger("AsyncProxyTransport")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+        # Only touched from the event loop thread
+        self._channels: Dict[Tuple[str, int], List[_PeerChannel]] = {}
+        self._connect_locks: Dict[Tuple[str, int], asyncio.Lock] = {}
+        self._requests = 0
+        self._connections_opened = 0
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Start the event loop thread on first use.
+
+        Returns:
+            asyncio.AbstractEventLoop: The transport's event loop.
+        """
+        if self._loop is None:
+            with self._start_lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    self._thread = threading.Thread(target=loop.run_forever,
+                                                    name="AsyncProxyTransport", daemon=True)
+                    self._thread.start()
+                    self._loop = loop
+        return self._loop
+
+    def send_command(self, host: str, port: int, command_string: str, timeout: float) -> Optional[str]:
+        """
+        Send a command to a peer and block until its reply arrives.
+
+        Args:
+            host (str): The peer's IP address.
+            port (int): The peer's port.
+            command_string (str): The raw command string to send.
+            timeout (float): Connect timeout and maximum wait for the reply.
+
+        Returns:
+            Optional[str]: The stripped reply line, or None if the peer closed
+            the connection before answering.
+
+        Raises:
+            TimeoutError: If the connection or the reply timed out.
+            OSError: If the connection failed or was reset.
+            RuntimeError: If called from the transport's own event loop thread.
+        """
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("send_command would block the transport loop; await send_command_async")
+        future = asyncio.run_coroutine_threadsafe(self._request(host, port, command_string, timeout), loop)
+        return future.result()
+
+    async def send_command_async(self, host: str, port: int, command_string: str, timeout: float) -> Optional[str]:
+        """
+        Send a command to a peer and await its reply from any event loop.
+
+        Args:
+            host (str): The peer's IP address.
+            port (int): The peer's port.
+            command_string (str): The raw command string to send.
+            timeout (float): Connect timeout and maximum wait for the reply.
+
+        Returns:
+            Optional[str]: The stripped reply line, or None if the peer closed
+            the connection before answering.
+
+        Raises:
+            TimeoutError: If the connection or the reply timed out.
+            OSError: If the connection failed or was reset.
+        """
+        loop = self._ensure_loop()
+        coro = self._request(host, port, command_string, timeout)
+        if asyncio.get_running_loop() is loop:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+    async def _request(self, host: str, port: int, command_string: str, timeout: float) -> Optional[str]:
+        """
+        Pipeline one request on a channel and wait for its FIFO-matched reply.
+        Runs on the transport loop; see `send_command` for arguments.
+        """
+        channel = await self._get_channel((host, port), timeout)
+        future = self._loop.create_future()
+        channel.pending.append(future)
+        channel.last_used = self._loop.time()
+        self._requests += 1
+        try:
+            channel.writer.write(f"{command_string}\n".encode('utf-8'))
+            await channel.writer.drain()
+            await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            # Every reply queued behind this one is stuck as well
+            self._close_channel(channel, TimeoutError(f"Reply from {host}:{port} timed out"))
+            future.exception()
+            raise TimeoutError(f"Reply from {host}:{port} timed out")
+        except OSError as e:
+            self._close_channel(channel, e)
+            if future.done():
+                future.exception()
+            raise
+        return future.result()
+
+    async def _get_channel(self, key: Tuple[str, int], timeout: float) -> _PeerChannel:
+        """
+        Pick the least loaded open channel to a peer, connecting a new one if
+        all are busy and the per-peer limit allows.
+        """
+        now = self._loop.time()
+        channels = self._channels.setdefault(key, [])
+        for channel in list(channels):
+            if not channel.pending and now - channel.last_used >= self.idle_timeout:
+                self._close_channel(channel, None)
+
+        best = min(channels, key=lambda c: len(c.pending), default=None)
+        if best is not None and (not best.pending or len(channels) >= self.connections_per_peer):
+            return best
+
+        lock = self._connect_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            channels = self._channels.setdefault(key, [])
+            idle = next((c for c in channels if not c.pending), None)
+            if idle is not None:
+                return idle
+            if len(channels) >= self.connections_per_peer:
+                return min(channels, key=lambda c: len(c.pending))
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(key[0], key[1], limit=self.max_line_length), timeout)
+            channel = _PeerChannel(key, reader, writer, self._loop.time())
+            channels.append(channel)
+            self._connections_opened += 1
+            self._loop.create_task(self._read_replies(channel))
+            return channel
+
+    async def _read_replies(self, channel: _PeerChannel) -> None:
+        """
+        Resolve the channel's pending requests in order as reply lines arrive.
+        """
+        error: Optional[BaseException] = None
+        try:
+            while not channel.closed:
+                line = await channel.reader.readline()
+                if not line:
+                    break
+                if not line.endswith(b"\n"):
+                    error = EOFError("Connection closed mid-response")
+                    break
+                if not channel.pending:
+                    error = ConnectionError("Unsolicited data from peer")
+                    break
+                future = channel.pending.popleft()
+                if not future.done():
+                    future.set_result(line.decode('utf-8', errors='replace').strip())
+        except (ValueError, asyncio.LimitOverrunError):
+            error = ValueError("Response line too long")
+        except OSError as e:
+            error = e
+        finally:
+            self._close_channel(channel, error)
+
+    def _close_channel(self, channel: _PeerChannel, error: Optional[BaseException]) -> None:
+        """
+        Close a channel and fail its pending requests.
+
+        Args:
+            channel (_PeerChannel): The channel to close.
+            error (Optional[BaseException]): Raised in pending requests; None
+                resolves them with None ("closed by peer").
+        """
+        if channel.closed:
+            return
+        channel.closed = True
+        channels = self._channels.get(channel.key)
+        if channels and channel in channels:
+            channels.remove(channel)
+        channel.writer.close()
+        while channel.pending:
+            future = channel.pending.popleft()
+            if not future.done():
+                if error is None:
+                    future.set_result(None)
+                else:
+                    future.set_exception(error)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return transport statistics.
+
+        Returns:
+            Dict[str, Any]: Open connections and in-flight requests per peer,
+            total requests sent and connections opened.
+        """
+        if self._loop is None:
+            return {"peers": {}, "requests": 0, "connections_opened": 0}
+
+        async def collect() -> Dict[str, Any]:
+            return {
+                "peers": {
+                    f"{host}:{port}": {
+                        "connections": len(channels),
+                        "in_flight": sum(len(c.pending) for c in channels),
+                    }
+                    for (host, port), channels in self._channels.items() if channels
+                },
+                "requests": self._requests,
+                "connections_opened": self._connections_opened,
+            }
+        return asyncio.run_coroutine_threadsafe(collect(), self._loop).result()
+
+    def close(self) -> None:
+        """
+        Close all connections and stop the event loop thread.
+
+        Side Effects:
+            Pending requests fail with ConnectionAbortedError.
+        """
+        with self._start_lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+
+        async def shutdown() -> None:
+            for channels in list(self._channels.values()):
+                for channel in list(channels):
+                    self._close_channel(channel, ConnectionAbortedError("Transport closed"))
+            self._channels.clear()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join()
+        loop.close()
+
+_transport_lock = threading.Lock()
+_shared_transport: Optional[AsyncProxyTransport] = None
+
+def get_async_proxy_transport() -> AsyncProxyTransport:
+    """
+    Return the process-wide AsyncProxyTransport configured from `config.json`.
+
+    The event loop thread is only started by the first request.
+
+    Returns:
+        AsyncProxyTransport: The transport shared by all proxy clients.
+    """
+    global _shared_transport
+    if _shared_transport is None:
+        with _transport_lock:
+            if _shared_transport is None:
+                network_config = ConfigManager().get("network", {})
+                _shared_transport = AsyncProxyTransport(
+                    connections_per_peer=network_config.get("proxy_pipeline_connections", 4),
+                    max_line_length=network_config.get("max_line_length", 65536),
+                    idle_timeout=network_config.get("proxy_idle_timeout", 30.0)
+                )
+    return _shared_transport
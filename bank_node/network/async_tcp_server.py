@@ -0,0 +1,368 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Set, Dict, Any, Awaitable, Callable
+
+from bank_node.core.config_manager import ConfigManager
+from bank_node.network.client_handler import (
+    get_command_factory,
+    clean_telnet_input,
+    encode_response,
+    process_message,
+    process_message_async,
+    is_proxied_message,
+)
+from bank_node.network.line_framer import LineFramer
+from bank_node.network.proxy_client import get_proxy_stats
+from bank_node.protocol.deadline import split_deadline
+
+class _ExecutorLane:
+    """
+    A class of command work with its own executor, queue bound and statistics.
+
+    Only used from the event loop thread, apart from the wait-time update
+    made by the executor thread that picks a task up.
+    """
+
+    def __init__(self, name: str, workers: int, max_pending: Optional[int] = None,
+                 max_wait: Optional[float] = None, overflow_response: str = "ER Server busy"):
+        """
+        Initialize the _ExecutorLane.
+
+        Args:
+            name (str): Name of the class of work ("local" or "proxy").
+            workers (int): Number of executor threads.
+            max_pending (Optional[int]): Maximum tasks submitted but not finished;
+                None for no limit.
+            max_wait (Optional[float]): Seconds a task may wait for a worker
+                before it is answered with `overflow_response` instead of run.
+            overflow_response (str): Response for rejected tasks.
+        """
+        self.name = name
+        self.workers = workers
+        self.max_pending = max_pending
+        self.max_wait_allowed = max_wait
+        self.overflow_response = overflow_response
+        self.executor = ThreadPoolExecutor(max_workers=workers,
+                                           thread_name_prefix=f"AsyncTcpServer-{name}")
+        self.pending = 0
+        self.rejected = 0
+        self.completed = 0
+        self.avg_wait = 0.0
+        self.max_wait = 0.0
+
+    def is_full(self) -> bool:
+        """
+        Check whether the lane refuses new work.
+
+        Returns:
+            bool: True if `max_pending` tasks are already pending.
+        """
+        return self.max_pending is not None and self.pending >= self.max_pending
+
+    async def run_async(self, fn: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """
+        Await `fn(*args)` on the event loop, counted against the lane's
+        pending limit but without taking an executor thread, or return
+        `overflow_response` if the lane is full.
+        """
+        if self.is_full():
+            self.rejected += 1
+            return self.overflow_response
+        self.pending += 1
+        try:
+            return await fn(*args)
+        finally:
+            self.pending -= 1
+            self.completed += 1
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run `fn(*args)` on the lane's executor and await the result, or return
+        `overflow_response` if the lane is full or the task waited too long.
+        """
+        if self.is_full():
+            self.rejected += 1
+            return self.overflow_response
+        submitted = time.monotonic()
+
+        def timed() -> Any:
+            waited = time.monotonic() - submitted
+            self.avg_wait = 0.8 * self.avg_wait + 0.2 * waited
+            self.max_wait = max(self.max_wait, waited)
+            if self.max_wait_allowed is not None and waited > self.max_wait_allowed:
+                self.rejected += 1
+                return self.overflow_response
+            return fn(*args)
+
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, timed)
+        finally:
+            self.pending -= 1
+            self.completed += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return lane statistics.
+
+        Returns:
+            Dict[str, Any]: Workers, queue depth (tasks waiting for a worker),
+            pending limit, completed and rejected counts, and average/maximum
+            queue wait.
+        """
+        return {
+            "workers": self.workers,
+            "queue_depth": max(0, self.pending - self.workers),
+            "max_pending": self.max_pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_ms": round(self.avg_wait * 1000, 3),
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+        }
+
+class AsyncTcpServer:
+    """
+    Event-loop based TCP server serving the bank protocol on a single thread.
+
+    An alternative to the thread-per-connection `TcpServer`: every connection
+    is a coroutine on one asyncio loop, while the blocking bank, persistence
+    and proxy work of each command runs on a bounded thread pool executor.
+    Commands are dispatched through the same `CommandFactory` as `TcpServer`.
+
+    Commands for accounts on other nodes run on a separate, bounded proxy
+    executor, so slow peers never occupy the workers serving local commands;
+    when the proxy lane is full the command is answered with `ER` at once.
+    With `network.proxy_transport` set to "async", those commands are awaited
+    on the loop instead and hold no thread while the peer answers.
+
+    Framing, write coalescing and statistics logging follow `TcpServer`: input
+    goes through a `LineFramer`, responses produced from one read go out in
+    one write, and lane and proxy statistics are logged every
+    `server.stats_interval`.
+    """
+
+    def __init__(self, host: str, port: int):
+        """
+        Initialize the asyncio TCP server with a host and port.
+
+        Args:
+            host (str): The hostname or IP address to bind to.
+            port (int): The port number to listen on.
+
+        Side Effects:
+            Reads server and network settings from the configuration, but does
+            not start listening.
+        """
+        self.host = host
+        self.port = port
+        self.is_running = False
+        self.logger = logging.getLogger("AsyncTcpServer")
+
+        config = ConfigManager()
+        server_config = config.get("server", {})
+        network_config = config.get("network", {})
+        self.backlog = server_config.get("backlog", 1024)
+        self.executor_workers = server_config.get("executor_workers", 32)
+        self.proxy_executor_workers = server_config.get("proxy_executor_workers", 16)
+        self.proxy_max_pending = self.proxy_executor_workers + network_config.get("proxy_max_queue", 64)
+        self.proxy_queue_timeout = network_config.get("proxy_queue_timeout", 1.0)
+        self.async_proxy = network_config.get("proxy_transport", "pool") == "async"
+        self.client_timeout = network_config.get("client_timeout", 60.0)
+        self.recv_size = network_config.get("recv_size", 4096)
+        self.max_line_length = network_config.get("max_line_length", 65536)
+        self.flush_bytes = network_config.get("write_flush_bytes", 65536)
+        self.flush_latency = network_config.get("write_flush_latency_ms", 20) / 1000.0
+        self.stats_interval = server_config.get("stats_interval", 60.0)
+        # Peers (machine clients) whose input skips Telnet cleaning
+        self.raw_clients = set(network_config.get("raw_clients", []))
+
+        self.factory = get_command_factory()
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._lanes: Dict[str, _ExecutorLane] = {}
+        self._writers: Set[asyncio.StreamWriter] = set()
+
+    def start(self):
+        """
+        Start the server and block until `stop()` is called.
+
+        Raises:
+            OSError: If socket binding or listening fails.
+
+        Side Effects:
+            - Runs an asyncio event loop in the calling thread.
+            - Starts the executor threads used for local and proxied commands.
+        """
+        asyncio.run(self._serve())
+
+    async def _serve(self):
+        """
+        Bind the listening socket and serve connections until stopped.
+
+        Side Effects:
+            - Binds to a network port.
+            - Closes all open client connections on shutdown.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        self._lanes = {
+            "local": _ExecutorLane("local", self.executor_workers),
+            "proxy": _ExecutorLane("proxy", self.proxy_executor_workers, self.proxy_max_pending,
+                                   self.proxy_queue_timeout, "ER Proxy capacity exceeded"),
+        }
+
+        server = await asyncio.start_server(
+            self._handle_client,
+            self.host,
+            self.port,
+            backlog=self.backlog
+        )
+        self.is_running = True
+        self.logger.info(f"Async server started on {self.host}:{self.port} "
+                         f"with {self.executor_workers} local and "
+                         f"{self.proxy_executor_workers} proxy executor workers")
+        stats_task = asyncio.ensure_future(self._log_stats()) if self.stats_interval else None
+
+        try:
+            async with server:
+                await self._stop_event.wait()
+        finally:
+            self.is_running = False
+            if stats_task is not None:
+                stats_task.cancel()
+            for writer in list(self._writers):
+                writer.close()
+            for lane in self._lanes.values():
+                lane.executor.shutdown(wait=False)
+            self.logger.info("Async server stopped")
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Serve a single client connection.
+
+        Reads chunks into a `LineFramer`, executes each complete command on
+        its lane and writes the responses back in request order, coalescing
+        those produced from one read into one write.
+
+        Args:
+            reader (asyncio.StreamReader): The connection's read side.
+            writer (asyncio.StreamWriter): The connection's write side.
+
+        Side Effects:
+            - Reads/Writes to the network socket.
+            - Closes the connection on exit.
+        """
+        address = writer.get_extra_info("peername")
+        clean_telnet = address[0] not in self.raw_clients
+        framer = LineFramer(self.max_line_length)
+        out = bytearray()
+        out_since = 0.0
+        self._writers.add(writer)
+        self.logger.debug(f"Connection from {address} established.")
+
+        async def flush() -> None:
+            if out:
+                writer.write(out)
+                out.clear()
+                await writer.drain()
+
+        try:
+            while self.is_running:
+                try:
+                    data = await asyncio.wait_for(reader.read(self.recv_size), self.client_timeout)
+                except asyncio.TimeoutError:
+                    self.logger.warning(f"Connection from {address} timed out.")
+                    break
+
+                if not data:
+                    # Client disconnected (a trailing partial line is discarded)
+                    break
+
+                # Deadlines sent with these lines count from now
+                received_at = time.monotonic()
+                for message in framer.feed(data):
+                    response = None
+                    if message is None:
+                        self.logger.warning(f"Line too long from {address}, discarded.")
+                        response = "ER Line too long"
+                    else:
+                        message, deadline = split_deadline(message.rstrip('\r'), received_at)
+                        if clean_telnet:
+                            message = clean_telnet_input(message)
+                        if not message.strip():
+                            continue
+
+                        proxied = is_proxied_message(message)
+                        # Replies queued before a command that may block must not wait for it
+                        if out and (proxied or time.monotonic() - out_since >= self.flush_latency):
+                            await flush()
+                        if proxied:
+                            lane = self._lanes["proxy"]
+                            if self.async_proxy:
+                                response = await lane.run_async(process_message_async, self.factory,
+                                                                message, self.logger, deadline)
+                        else:
+                            lane = self._lanes["local"]
+                        if response is None:
+                            response = await lane.run(process_message, self.factory, message,
+                                                      self.logger, deadline)
+                    if response:
+                        if not out:
+                            out_since = time.monotonic()
+                        out += encode_response(response)
+                        if len(out) >= self.flush_bytes:
+                            await flush()
+
+                # Everything produced by this read goes out in one write
+                await flush()
+
+        except (ConnectionResetError, BrokenPipeError):
+            self.logger.debug(f"Connection from {address} reset.")
+        except Exception as e:
+            self.logger.error(f"Error handling client {address}: {e}", exc_info=True)
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
+            self.logger.debug(f"Connection from {address} closed.")
+
+    async def _log_stats(self):
+        """
+        Log lane and proxy statistics every `stats_interval` seconds.
+        """
+        while True:
+            await asyncio.sleep(self.stats_interval)
+            self.logger.info(f"Executor lane stats: {self.get_stats()}")
+            self.logger.info(f"Proxy stats: {get_proxy_stats()}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return per-class executor statistics.
+
+        Returns:
+            Dict[str, Any]: `_ExecutorLane.stats` for the "local" and "proxy" lanes.
+        """
+        return {name: lane.stats() for name, lane in self._lanes.items()}
+
+    def stop(self):
+        """
+        Stop the server and close all connections.
+
+        Safe to call from any thread.
+
+        Side Effects:
+            Signals the event loop to shut the server down.
+        """
+        loop = self._loop
+        if loop is not None and not loop.is_closed() and self._stop_event is not None:
+            try:
+                loop.call_soon_threadsafe(self._stop_event.set)
+            except RuntimeError:
+                # Loop already closed
+                pass
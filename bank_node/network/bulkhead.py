@@ -0,0 +1,151 @@
+import threading
+import time
+from typing import Dict, Optional, Any
+from bank_node.core.config_manager import ConfigManager
+
+class Bulkhead:
+    """
+    Bounded concurrency budget with a bounded, time-limited wait queue.
+
+    At most `max_concurrent` callers hold a slot at once; up to `max_queue`
+    more may wait for one, each for at most `max_wait` seconds. Anyone beyond
+    that is rejected immediately, so a slow dependency can only ever tie up a
+    fixed number of threads.
+    """
+
+    def __init__(self, name: str, max_concurrent: int, max_queue: int = 0, max_wait: float = 1.0):
+        """
+        Initialize the Bulkhead.
+
+        Args:
+            name (str): Name of the class of work, used in statistics.
+            max_concurrent (int): Maximum number of concurrent slot holders.
+            max_queue (int): Maximum number of callers waiting for a slot.
+            max_wait (float): Seconds a queued caller waits before giving up.
+        """
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self._cond = threading.Condition(threading.Lock())
+        self._active = 0
+        self._queued = 0
+
+        # Statistics
+        self._admitted = 0
+        self._rejected = 0
+        self._timed_out = 0
+        self._avg_wait = 0.0
+        self._max_wait_seen = 0.0
+
+    def try_acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Take a slot, waiting in the queue if the budget is exhausted.
+
+        Args:
+            timeout (Optional[float]): Shorter wait limit than `max_wait` for
+                this caller, e.g. its remaining deadline.
+
+        Returns:
+            bool: True if a slot was taken (release it with `release`), False if
+            the queue was full or the wait timed out.
+        """
+        with self._cond:
+            if self._active < self.max_concurrent and not self._queued:
+                self._active += 1
+                self._admitted += 1
+                return True
+            if self._queued >= self.max_queue:
+                self._rejected += 1
+                return False
+
+            self._queued += 1
+            started = time.monotonic()
+            wait = self.max_wait if timeout is None else min(self.max_wait, timeout)
+            deadline = started + wait
+            try:
+                while self._active >= self.max_concurrent:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timed_out += 1
+                        return False
+                    self._cond.wait(remaining)
+            finally:
+                self._queued -= 1
+
+            waited = time.monotonic() - started
+            self._avg_wait = 0.8 * self._avg_wait + 0.2 * waited
+            self._max_wait_seen = max(self._max_wait_seen, waited)
+            self._active += 1
+            self._admitted += 1
+            return True
+
+    def try_acquire_nowait(self) -> bool:
+        """
+        Take a slot only if one is free and nobody is queued for it.
+
+        Returns:
+            bool: True if a slot was taken (release it with `release`).
+        """
+        with self._cond:
+            if self._active < self.max_concurrent and not self._queued:
+                self._active += 1
+                self._admitted += 1
+                return True
+            return False
+
+    def release(self) -> None:
+        """
+        Return a slot taken with `try_acquire`.
+        """
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return bulkhead statistics.
+
+        Returns:
+            Dict[str, Any]: Active and queued callers, limits, admitted,
+            rejected and timed-out counts, and average/maximum wait of queued callers.
+        """
+        with self._cond:
+            return {
+                "name": self.name,
+                "active": self._active,
+                "queued": self._queued,
+                "max_concurrent": self.max_concurrent,
+                "max_queue": self.max_queue,
+                "admitted": self._admitted,
+                "rejected": self._rejected,
+                "timed_out": self._timed_out,
+                "avg_wait_ms": round(self._avg_wait * 1000, 3),
+                "max_wait_ms": round(self._max_wait_seen * 1000, 3),
+            }
+
+_bulkhead_lock = threading.Lock()
+_proxy_bulkhead: Optional[Bulkhead] = None
+
+def get_proxy_bulkhead() -> Bulkhead:
+    """
+    Return the process-wide bulkhead for outbound proxy work.
+
+    Sized by `network.proxy_max_concurrent`, `network.proxy_max_queue` and
+    `network.proxy_queue_timeout`.
+
+    Returns:
+        Bulkhead: The bulkhead shared by all proxy clients.
+    """
+    global _proxy_bulkhead
+    if _proxy_bulkhead is None:
+        with _bulkhead_lock:
+            if _proxy_bulkhead is None:
+                network_config = ConfigManager().get("network", {})
+                _proxy_bulkhead = Bulkhead(
+                    "proxy",
+                    max_concurrent=network_config.get("proxy_max_concurrent", 32),
+                    max_queue=network_config.get("proxy_max_queue", 64),
+                    max_wait=network_config.get("proxy_queue_timeout", 1.0)
+                )
+    return _proxy_bulkhead
@@ -0,0 +1,234 @@
+import threading
+import time
+import logging
+from typing import Dict, Tuple, Optional, Any
+from bank_node.core.config_manager import ConfigManager
+
+class CircuitBreaker:
+    """
+    Circuit breaker guarding calls to a single peer.
+
+    Closed: calls pass. After `failure_threshold` consecutive failures the
+    breaker opens and calls fail fast. Once `reset_timeout` seconds have
+    passed it goes half-open and lets a single probe through; the probe's
+    outcome either closes the breaker again or re-opens it. A probe whose
+    outcome is never recorded (e.g. it was shed by a deadline) is given up
+    after another `reset_timeout`, so the next call probes again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 10.0):
+        """
+        Initialize the CircuitBreaker.
+
+        Args:
+            failure_threshold (int): Consecutive failures that trip the breaker.
+            reset_timeout (float): Seconds the breaker stays open before a probe is allowed.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.rejected = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self._probe_started = 0.0
+
+    def allow_request(self, now: float) -> bool:
+        """
+        Decide whether a call may proceed. Not thread-safe on its own.
+
+        Args:
+            now (float): The current monotonic time.
+
+        Returns:
+            bool: True if the call may go to the peer.
+        """
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN and now - self.opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+            self._probe_in_flight = False
+        if self.state == self.HALF_OPEN and (not self._probe_in_flight
+                                             or now - self._probe_started >= self.reset_timeout):
+            self._probe_in_flight = True
+            self._probe_started = now
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        """
+        Record a successful call and close the breaker.
+        """
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self, now: float) -> bool:
+        """
+        Record a failed call.
+
+        Args:
+            now (float): The current monotonic time.
+
+        Returns:
+            bool: True if this failure (re-)opened the breaker.
+        """
+        self.failures += 1
+        self._probe_in_flight = False
+        if self.state == self.HALF_OPEN or (self.state == self.CLOSED and self.failures >= self.failure_threshold):
+            self.state = self.OPEN
+            self.opened_at = now
+            self.trips += 1
+            return True
+        return False
+
+class PeerHealthRegistry:
+    """
+    Tracks the health of every peer bank node the proxy talks to.
+
+    Combines a `CircuitBreaker` per (host, port) with a short-lived negative
+    cache of peers that refused connections, so forwards to a dead peer fail
+    fast with `ER` instead of tying up a handler for the full proxy timeout.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 10.0, refused_ttl: float = 2.0):
+        """
+        Initialize the PeerHealthRegistry.
+
+        Args:
+            failure_threshold (int): Consecutive failures that trip a peer's breaker.
+            reset_timeout (float): Seconds an open breaker waits before a half-open probe.
+            refused_ttl (float): Seconds a refused connection is remembered.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.refused_ttl = refused_ttl
+        self.logger = logging.getLogger("PeerHealth")
+        self._breakers: Dict[Tuple[str, int], CircuitBreaker] = {}
+        self._refused_until: Dict[Tuple[str, int], float] = {}
+        self._lock = threading.Lock()
+
+    def check(self, host: str, port: int) -> Optional[str]:
+        """
+        Decide whether a call to a peer should be attempted.
+
+        Args:
+            host (str): The peer's IP address.
+            port (int): The peer's port.
+
+        Returns:
+            Optional[str]: None if the call may proceed, otherwise the reason it is shed.
+        """
+        key = (host, port)
+        now = time.monotonic()
+        with self._lock:
+            refused_until = self._refused_until.get(key)
+            if refused_until is not None:
+                if now < refused_until:
+                    return "Peer unavailable (connection refused)"
+                del self._refused_until[key]
+
+            breaker = self._breakers.get(key)
+            if breaker is not None and not breaker.allow_request(now):
+                return "Peer unavailable (circuit open)"
+        return None
+
+    def record_success(self, host: str, port: int) -> None:
+        """
+        Record a successful exchange with a peer.
+
+        Args:
+            host (str): The peer's IP address.
+            port (int): The peer's port.
+        """
+        with self._lock:
+            breaker = self._breakers.get((host, port))
+            if breaker is not None and breaker.state != CircuitBreaker.CLOSED:
+                self.logger.info(f"Circuit for {host}:{port} closed")
+            if breaker is not None:
+                breaker.record_success()
+
+    def is_probing(self, host: str, port: int) -> bool:
+        """
+        Check whether a call to a peer is its breaker's half-open probe.
+
+        Args:
+            host (str): The peer's IP address.
+            port (int): The peer's port.
+
+        Returns:
+            bool: True if the peer's breaker is half-open.
+        """
+        with self._lock:
+            breaker = self._breakers.get((host, port))
+            return breaker is not None and breaker.state == CircuitBreaker.HALF_OPEN
+
+    def record_failure(self, host: str, port: int, refused: bool = False) -> None:
+        """
+        Record a failed exchange (timeout, refusal, network error) with a peer.
+
+        Args:
+            host (str): The peer's IP address.
+            port (int): The peer's port.
+            refused (bool): True if the connection was actively refused.
+        """
+        key = (host, port)
+        now = time.monotonic()
+        with self._lock:
+            if refused and self.refused_ttl > 0:
+                self._refused_until[key] = now + self.refused_ttl
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = self._breakers[key] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            if breaker.record_failure(now):
+                self.logger.warning(f"Circuit for {host}:{port} opened after {breaker.failures} "
+                                    f"consecutive failures (trip #{breaker.trips})")
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the breaker state of every known peer.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Per "host:port": state, consecutive
+            failures, trip count, shed calls and whether a refusal is cached.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {
+                f"{host}:{port}": {
+                    "state": breaker.state,
+                    "failures": breaker.failures,
+                    "trips": breaker.trips,
+                    "rejected": breaker.rejected,
+                    "refused_cached": self._refused_until.get((host, port), 0.0) > now,
+                }
+                for (host, port), breaker in self._breakers.items()
+            }
+
+_registry_lock = threading.Lock()
+_shared_registry: Optional[PeerHealthRegistry] = None
+
+def get_peer_health() -> PeerHealthRegistry:
+    """
+    Return the process-wide PeerHealthRegistry configured from `config.json`.
+
+    Returns:
+        PeerHealthRegistry: The registry shared by all proxy clients.
+    """
+    global _shared_registry
+    if _shared_registry is None:
+        with _registry_lock:
+            if _shared_registry is None:
+                network_config = ConfigManager().get("network", {})
+                _shared_registry = PeerHealthRegistry(
+                    failure_threshold=network_config.get("breaker_failure_threshold", 5),
+                    reset_timeout=network_config.get("breaker_reset_timeout", 10.0),
+                    refused_ttl=network_config.get("refused_peer_ttl", 2.0)
+                )
+    return _shared_registry
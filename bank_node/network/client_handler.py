@@ -2,13 +2,18 @@ import threading
 import socket
 import logging
 import re
-from typing import Tuple
+import time
+from contextlib import nullcontext
+from typing import Tuple, Dict, Any, Optional
 
 from bank_node.core.bank import Bank
 from bank_node.core.config_manager import ConfigManager
 from bank_node.protocol.command_factory import CommandFactory
-from bank_node.protocol.command_parser import CommandParser
 from bank_node.protocol.command_enum import CommandType
+from bank_node.protocol.account_router import get_account_router
+from bank_node.protocol.deadline import split_deadline
+from bank_node.network.line_framer import LineFramer
+from bank_node.network.worker_pool import WorkerPool
 
 # Import all available commands
 from bank_node.protocol.commands.bc_command import BCCommand
@@ -20,55 +25,274 @@ from bank_node.protocol.commands.ar_command import ARCommand
 from bank_node.protocol.commands.ba_command import BACommand
 from bank_node.protocol.commands.bn_command import BNCommand
 
-class ClientHandler(threading.Thread):
+# Commands addressing an account, which are forwarded when it is remote
+_ROUTED_CODES = frozenset({
+    CommandType.AD.value, CommandType.AW.value, CommandType.AB.value, CommandType.AR.value
+})
+
+def register_commands(factory: CommandFactory) -> None:
+    """
+    Register all supported protocol commands with a factory.
+
+    Shared by every server engine so they dispatch the same command set.
+
+    Args:
+        factory (CommandFactory): The factory to populate.
+
+    Side Effects:
+        Calls `factory.register_command` for each supported command type.
+    """
+    factory.register_command(CommandType.BC.value, BCCommand)
+    factory.register_command(CommandType.AC.value, ACCommand)
+    factory.register_command(CommandType.AD.value, ADCommand)
+    factory.register_command(CommandType.AW.value, AWCommand)
+    factory.register_command(CommandType.AB.value, ABCommand)
+    factory.register_command(CommandType.AR.value, ARCommand)
+    factory.register_command(CommandType.BA.value, BACommand)
+    factory.register_command(CommandType.BN.value, BNCommand)
+
+# ANSI escape sequences sent by terminal clients (arrow keys, colours, ...)
+_ANSI_ESCAPE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+_factory_lock = threading.Lock()
+_shared_factory: Optional[CommandFactory] = None
+
+def get_command_factory() -> CommandFactory:
+    """
+    Return the process-wide, frozen command dispatch table.
+
+    The factory is built and frozen on first use (normally at startup) and
+    then shared by every connection of every server engine.
+
+    Returns:
+        CommandFactory: The shared frozen factory bound to the Bank singleton.
+    """
+    global _shared_factory
+    if _shared_factory is None:
+        with _factory_lock:
+            if _shared_factory is None:
+                factory = CommandFactory(Bank())
+                register_commands(factory)
+                factory.freeze()
+                _shared_factory = factory
+    return _shared_factory
+
+def clean_telnet_input(text: str) -> str:
+    """
+    Clean input string by handling backspaces and removing ANSI escape sequences.
+
+    Lines without ESC, BS or DEL bytes (every machine client) are returned
+    untouched without further processing.
+
+    Args:
+        text (str): The raw input string.
+
+    Returns:
+        str: The cleaned string.
+
+    Example:
+        >>> clean_telnet_input("abc\\x08d")
+        "abd"
+    """
+    has_escape = '\x1b' in text
+    if not has_escape and '\x08' not in text and '\x7f' not in text:
+        return text
+
+    # Strip ANSI escape sequences
+    if has_escape:
+        text = _ANSI_ESCAPE.sub('', text)
+        if '\x08' not in text and '\x7f' not in text:
+            return text
+
+    result = []
+    for char in text:
+        if char == '\x08' or char == '\x7f':
+            if result:
+                result.pop()
+        else:
+            result.append(char)
+    return "".join(result)
+
+def encode_response(response: str) -> bytes:
     """
-    Handles individual client connections in a separate thread.
+    Encode a response as a CRLF-terminated UTF-8 line.
+
+    Args:
+        response (str): The response produced by a command.
+
+    Returns:
+        bytes: The wire representation of the response.
+    """
+    # Normalize line endings to CRLF for Telnet clients
+    response = response.replace('\r\n', '\n').replace('\n', '\r\n')
+    return (response + '\r\n').encode('utf-8')
+
+def is_proxied_message(message: str) -> bool:
+    """
+    Check whether a message addresses an account held by another node.
+
+    Uses the shared `AccountRouter`, so the check costs a cache lookup and
+    lets servers schedule proxied commands separately from local ones.
+
+    Args:
+        message (str): The cleaned command string.
+
+    Returns:
+        bool: True for AD/AW/AB/AR commands whose account is remote.
+    """
+    parts = message.split(None, 2)
+    if len(parts) < 2 or parts[0] not in _ROUTED_CODES:
+        return False
+    try:
+        return not get_account_router().resolve(parts[1]).is_local
+    except ValueError:
+        # Invalid address: the command fails validation locally
+        return False
+
+def process_message(factory: CommandFactory, message: str, logger: logging.Logger,
+                    deadline: Optional[float] = None) -> str:
     """
+    Parse and execute a single message.
+
+    Args:
+        factory (CommandFactory): The factory used to resolve the command.
+        message (str): The command string received from the client.
+        logger (logging.Logger): The connection logger used for diagnostics.
+        deadline (Optional[float]): Absolute `time.monotonic()` deadline sent
+            with the message (see `protocol/deadline.py`), if any.
+
+    Returns:
+        str: The response string.
 
-    def __init__(self, client_socket: socket.socket, address: Tuple[str, int]):
+    Side Effects:
+        Executes the command using the CommandFactory.
+    """
+    try:
+        parts = message.split()
+        # A single dict lookup both validates the code and resolves the command
+        command = factory.get_command(parts[0], parts[1:]) if parts else None
+        
+        if command is None:
+            logger.warning(f"Invalid command format received: '{message}'")
+            return "ER Invalid command format"
+        
+        try:
+            result = command.execute(deadline)
+            return result
+        except Exception as exec_err:
+            logger.error(f"Command execution error for '{message}': {exec_err}", exc_info=True)
+            return f"ER Execution failed: {str(exec_err)}"
+            
+    except Exception as e:
+        logger.error(f"Unexpected error processing message '{message}': {e}", exc_info=True)
+        return f"ER Internal error: {str(e)}"
+
+async def process_message_async(factory: CommandFactory, message: str, logger: logging.Logger,
+                                deadline: Optional[float] = None) -> Optional[str]:
+    """
+    Parse and execute a message addressed to a remote account on an event loop.
+
+    The forward is awaited (see `BaseCommand.execute_async`), so it does not
+    hold a thread while the peer answers.
+
+    Args:
+        factory (CommandFactory): The factory used to resolve the command.
+        message (str): The command string received from the client.
+        logger (logging.Logger): The connection logger used for diagnostics.
+        deadline (Optional[float]): Absolute `time.monotonic()` deadline sent
+            with the message, if any.
+
+    Returns:
+        Optional[str]: The response string, or None if the command turned out
+        not to be forwarded and must be run with `process_message`.
+    """
+    try:
+        parts = message.split()
+        command = factory.get_command(parts[0], parts[1:]) if parts else None
+
+        if command is None:
+            logger.warning(f"Invalid command format received: '{message}'")
+            return "ER Invalid command format"
+
+        try:
+            return await command.execute_async(deadline)
+        except Exception as exec_err:
+            logger.error(f"Command execution error for '{message}': {exec_err}", exc_info=True)
+            return f"ER Execution failed: {str(exec_err)}"
+
+    except Exception as e:
+        logger.error(f"Unexpected error processing message '{message}': {e}", exc_info=True)
+        return f"ER Internal error: {str(e)}"
+
+class ClientHandler:
+    """
+    Handles an individual client connection; `run` serves it on a worker
+    thread of the server's WorkerPool.
+    """
+
+    # Network settings shared by all handlers, read from the configuration once
+    _settings: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def _get_settings(cls) -> Dict[str, Any]:
         """
-        Initialize the ClientHandler thread.
+        Return the network settings used by every handler.
+
+        Returns:
+            Dict[str, Any]: The `network` section of the configuration.
+
+        Side Effects:
+            Reads the configuration on first call only.
+        """
+        if cls._settings is None:
+            cls._settings = ConfigManager().get("network", {})
+        return cls._settings
+
+    def __init__(self, client_socket: socket.socket, address: Tuple[str, int], clean_telnet: bool = True,
+                 factory: Optional[CommandFactory] = None, worker_pool: Optional[WorkerPool] = None):
+        """
+        Initialize the ClientHandler.
 
         Args:
             client_socket (socket.socket): The client's socket connection.
             address (Tuple[str, int]): The client's address (IP, Port).
+            clean_telnet (bool): Whether to strip Telnet control sequences from
+                input. Disabled for peer-to-peer links. Defaults to True.
+            factory (Optional[CommandFactory]): The dispatch table to use.
+                Defaults to the shared frozen factory.
+            worker_pool (Optional[WorkerPool]): The pool running this handler;
+                proxied commands run inside its `blocking()` section, so they
+                do not hold up connections waiting for a worker.
 
         Side Effects:
-            - Initializes Bank, ConfigManager, and CommandFactory.
-            - Registers commands.
             - Sets socket timeout based on configuration.
+            - Allocates the reusable receive buffer and line framer.
         """
-        super().__init__()
         self.client_socket = client_socket
         self.address = address
         self.running = True
-        self.buffer = ""
+        self.clean_telnet = clean_telnet
+        self.worker_pool = worker_pool
         
-        # Initialize Bank and Factory
-        self.bank = Bank()
-        self.factory = CommandFactory(self.bank)
-        self._register_commands()
+        # Shared, frozen dispatch table
+        self.factory = factory or get_command_factory()
+        self.bank = self.factory.bank
         
         # Set a timeout for the socket operations (e.g., 60 seconds)
-        config = ConfigManager()
-        timeout = config.get("network", {}).get("client_timeout", 60.0)
+        network_config = self._get_settings()
+        timeout = network_config.get("client_timeout", 60.0)
         self.client_socket.settimeout(timeout)
 
-    def _register_commands(self):
-        """
-        Register all supported commands with the factory.
-        
-        Side Effects:
-            Calls `self.factory.register_command` for each supported command type.
-        """
-        self.factory.register_command(CommandType.BC.value, BCCommand)
-        self.factory.register_command(CommandType.AC.value, ACCommand)
-        self.factory.register_command(CommandType.AD.value, ADCommand)
-        self.factory.register_command(CommandType.AW.value, AWCommand)
-        self.factory.register_command(CommandType.AB.value, ABCommand)
-        self.factory.register_command(CommandType.AR.value, ARCommand)
-        self.factory.register_command(CommandType.BA.value, BACommand)
-        self.factory.register_command(CommandType.BN.value, BNCommand)
+        # Reusable receive buffer; complete lines are framed at byte level
+        self._recv_buffer = bytearray(network_config.get("recv_size", 4096))
+        self._recv_view = memoryview(self._recv_buffer)
+        self.framer = LineFramer(network_config.get("max_line_length", 65536))
+
+        # Responses produced from one read are coalesced into a single write
+        self._out_buffer = bytearray()
+        self._out_since = 0.0
+        self.flush_bytes = network_config.get("write_flush_bytes", 65536)
+        self.flush_latency = network_config.get("write_flush_latency_ms", 20) / 1000.0
 
     def _clean_telnet_input(self, text: str) -> str:
         """
@@ -84,25 +308,14 @@ class ClientHandler(threading.Thread):
             >>> handler._clean_telnet_input("abc\\x08d")
             "abd"
         """
-        # Strip ANSI escape sequences
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        text = ansi_escape.sub('', text)
-
-        result = []
-        for char in text:
-            if char == '\x08' or char == '\x7f':
-                if result:
-                    result.pop()
-            else:
-                result.append(char)
-        return "".join(result)
+        return clean_telnet_input(text)
 
     def run(self):
         """
         Main execution loop for handling client communication.
 
-        Reads data from the socket, processes buffering, handles line endings,
-        executes commands, and sends responses.
+        Reads data into a reusable buffer, frames complete lines, handles line
+        endings, executes commands, and sends responses.
 
         Side Effects:
             - Reads/Writes to the network socket.
@@ -115,39 +328,54 @@ class ClientHandler(threading.Thread):
         try:
             while self.running:
                 try:
-                    data = self.client_socket.recv(1024)
-                    if not data:
+                    received = self.client_socket.recv_into(self._recv_view)
+                    if not received:
                         # Client disconnected
                         self.logger.info(f"Client {self.address} disconnected.")
                         break
                     
-                    try:
-                        self.buffer += data.decode('utf-8')
-                    except UnicodeDecodeError as e:
-                        self.logger.warning(f"Decoding error from {self.address}: {e}")
-                        continue
-                    
+                    # Deadlines sent with these lines count from now
+                    received_at = time.monotonic()
+
                     # Process complete messages delimited by newline
-                    while '\n' in self.buffer:
-                        message, self.buffer = self.buffer.split('\n', 1)
+                    for message in self.framer.feed(self._recv_view[:received]):
+                        if message is None:
+                            self.logger.warning(f"Line too long from {self.address}, discarded.")
+                            self._queue_response("ER Line too long")
+                            continue
+
                         # Handle Windows line endings (\r\n) by stripping \r
                         message = message.rstrip('\r')
+
+                        # Take off a propagated deadline before cleaning would strip it
+                        message, deadline = split_deadline(message, received_at)
                         
                         # Handle Telnet backspaces
-                        message = self._clean_telnet_input(message)
+                        if self.clean_telnet:
+                            message = self._clean_telnet_input(message)
                         
                         if not message.strip():
                             # Ignore empty lines (keep-alives or stray newlines)
                             continue
 
                         self.logger.debug(f"Received: {message}")
-                        response = self._process_message(message)
+                        # A proxied command can block for up to the proxy timeout;
+                        # replies queued before it must not wait for it
+                        proxied = is_proxied_message(message)
+                        if self._out_buffer and (
+                                proxied or time.monotonic() - self._out_since >= self.flush_latency):
+                            self._flush_responses()
+                        section = (self.worker_pool.blocking() if proxied and self.worker_pool
+                                   else nullcontext())
+                        with section:
+                            response = self._process_message(message, deadline)
                         
                         if response:
                             self.logger.debug(f"Sending: {response}")
-                            # Normalize line endings to CRLF for Telnet clients
-                            response = response.replace('\r\n', '\n').replace('\n', '\r\n')
-                            self.client_socket.sendall((response + '\r\n').encode('utf-8'))
+                            self._queue_response(response)
+
+                    # Everything produced by this read goes out in one write
+                    self._flush_responses()
                             
                 except socket.timeout:
                     self.logger.warning(f"Connection from {self.address} timed out.")
@@ -161,12 +389,44 @@ class ClientHandler(threading.Thread):
             self.client_socket.close()
             self.logger.info(f"Connection from {self.address} closed.")
 
-    def _process_message(self, message: str) -> str:
+    def _queue_response(self, response: str) -> None:
+        """
+        Append a response to the outgoing buffer, flushing it when it grows past
+        `flush_bytes` or has been held for longer than `flush_latency`. `run`
+        also flushes before a command that may block (a proxied one), so the
+        latency cap holds while it executes.
+
+        Args:
+            response (str): The response line to send.
+
+        Side Effects:
+            May write the buffered responses to the socket.
+        """
+        if not self._out_buffer:
+            self._out_since = time.monotonic()
+        self._out_buffer += encode_response(response)
+        if (len(self._out_buffer) >= self.flush_bytes
+                or time.monotonic() - self._out_since >= self.flush_latency):
+            self._flush_responses()
+
+    def _flush_responses(self) -> None:
+        """
+        Send all buffered responses with a single `sendall`.
+
+        Side Effects:
+            Writes to the network socket and empties the outgoing buffer.
+        """
+        if self._out_buffer:
+            self.client_socket.sendall(self._out_buffer)
+            self._out_buffer.clear()
+
+    def _process_message(self, message: str, deadline: Optional[float] = None) -> str:
         """
         Parse and execute a single message.
 
         Args:
             message (str): The command string received from the client.
+            deadline (Optional[float]): Absolute deadline sent with the message, if any.
 
         Returns:
             str: The response string.
@@ -174,26 +434,4 @@ class ClientHandler(threading.Thread):
         Side Effects:
             Executes the command using the CommandFactory.
         """
-        try:
-            command_code, args = CommandParser.parse(message)
-            
-            if not command_code:
-                self.logger.warning(f"Invalid command format received: '{message}'")
-                return "ER Invalid command format"
-            
-            command = self.factory.get_command(command_code, args)
-            
-            if command:
-                try:
-                    result = command.execute()
-                    return result
-                except Exception as exec_err:
-                    self.logger.error(f"Command execution error for '{message}': {exec_err}", exc_info=True)
-                    return f"ER Execution failed: {str(exec_err)}"
-            else:
-                self.logger.warning(f"Unknown command received: '{command_code}'")
-                return f"ER Unknown command: {command_code}"
-                
-        except Exception as e:
-            self.logger.error(f"Unexpected error processing message '{message}': {e}", exc_info=True)
-            return f"ER Internal error: {str(e)}"
+        return process_message(self.factory, message, self.logger, deadline)
@@ -0,0 +1,346 @@
+import socket
+import threading
+import time
+import logging
+from collections import deque
+from typing import Deque, Dict, Tuple, Optional, Any
+from bank_node.core.config_manager import ConfigManager
+from bank_node.network.line_framer import LineFramer
+
+class PoolExhaustedError(OSError):
+    """
+    Raised when every connection a peer may have is checked out and none is
+    returned in time.
+    """
+
+class PeerConnection:
+    """
+    A TCP connection to a peer bank node that can be kept alive and reused.
+
+    Responses are read through a buffered line reader, so a reply split over
+    several TCP segments is reassembled and bytes belonging to a following
+    line are kept for the next read instead of being lost.
+    """
+
+    def __init__(self, sock: socket.socket, host: str, port: int,
+                 recv_size: int = 4096, max_line_length: int = 65536):
+        """
+        Initialize the PeerConnection.
+
+        Args:
+            sock (socket.socket): The connected socket.
+            host (str): The peer's IP address.
+            port (int): The peer's port.
+            recv_size (int): Size of the reusable receive buffer.
+            max_line_length (int): Maximum accepted response line length in bytes.
+        """
+        self.sock = sock
+        self.host = host
+        self.port = port
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self._recv_view = memoryview(bytearray(recv_size))
+        self._framer = LineFramer(max_line_length)
+        self._lines: Deque[Optional[str]] = deque()
+
+    def read_line(self) -> Optional[str]:
+        """
+        Read exactly one newline-terminated response line.
+
+        Returns:
+            Optional[str]: The line without its CR/LF terminator, or None if the
+            peer closed the connection before a complete line arrived.
+
+        Raises:
+            socket.timeout: If the socket timeout expires while waiting.
+            EOFError: If the peer closed the connection in the middle of a line.
+            ValueError: If the peer sent a line longer than the allowed maximum.
+        """
+        while not self._lines:
+            received = self.sock.recv_into(self._recv_view)
+            if not received:
+                if self._framer.pending():
+                    # The peer started answering, so the command was processed
+                    raise EOFError("Connection closed mid-response")
+                return None
+            self._lines.extend(self._framer.feed(self._recv_view[:received]))
+
+        line = self._lines.popleft()
+        if line is None:
+            raise ValueError("Response line too long")
+        return line.rstrip('\r')
+
+    def has_buffered_data(self) -> bool:
+        """
+        Check whether bytes beyond the last returned line are buffered.
+
+        Returns:
+            bool: True if unread lines or a partial line are pending.
+        """
+        return bool(self._lines) or self._framer.pending() > 0
+
+    def is_healthy(self) -> bool:
+        """
+        Check that an idle connection was not closed by the peer.
+
+        An idle keep-alive socket must not be readable: readability means the
+        peer sent EOF/RST or unsolicited data, either way it cannot be reused.
+
+        Returns:
+            bool: True if the connection looks usable.
+        """
+        if self.has_buffered_data():
+            return False
+        try:
+            self.sock.setblocking(False)
+            try:
+                self.sock.recv(1, socket.MSG_PEEK)
+            except BlockingIOError:
+                return True
+            finally:
+                self.sock.setblocking(True)
+            return False
+        except OSError:
+            return False
+
+    def close(self) -> None:
+        """
+        Close the underlying socket.
+        """
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+class ConnectionPool:
+    """
+    Per-(host, port) pool of keep-alive connections to peer bank nodes.
+
+    Connections are checked out for one request/response exchange and then
+    returned. Idle connections older than `idle_timeout` are evicted, at most
+    `max_idle_per_peer` are kept per peer, and every checkout runs a cheap
+    health check so sockets closed by the peer are never handed out.
+
+    At most `max_per_peer` connections to one peer are checked out at a time;
+    further checkouts wait for one to be released or discarded.
+    """
+
+    def __init__(self, max_idle_per_peer: int = 8, idle_timeout: float = 30.0,
+                 max_per_peer: Optional[int] = None):
+        """
+        Initialize the ConnectionPool.
+
+        Args:
+            max_idle_per_peer (int): Maximum number of idle connections kept per peer.
+            idle_timeout (float): Seconds after which an idle connection is closed.
+            max_per_peer (Optional[int]): Maximum number of connections checked
+                out per peer at once; None for no limit.
+        """
+        self.max_idle_per_peer = max_idle_per_peer
+        self.idle_timeout = idle_timeout
+        self.max_per_peer = max_per_peer
+        self.logger = logging.getLogger("ConnectionPool")
+        self._idle: Dict[Tuple[str, int], Deque[PeerConnection]] = {}
+        self._checked_out: Dict[Tuple[str, int], int] = {}
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._last_sweep = time.monotonic()
+
+        # Statistics
+        self._created = 0
+        self._reused = 0
+        self._evicted = 0
+        self._exhausted = 0
+
+    def acquire(self, host: str, port: int, timeout: float) -> Tuple[PeerConnection, bool]:
+        """
+        Check out a connection to a peer, reusing an idle one when possible.
+
+        The connection must be handed back with `release` or `discard`.
+
+        Args:
+            host (str): The peer's IP address.
+            port (int): The peer's port.
+            timeout (float): Connect timeout and socket timeout for the
+                connection, and the longest wait for a free slot when
+                `max_per_peer` connections are checked out.
+
+        Returns:
+            Tuple[PeerConnection, bool]: The connection and whether it was reused
+            from the pool (False for a freshly opened connection).
+
+        Raises:
+            PoolExhaustedError: If no slot became free within `timeout`.
+            OSError: If a new connection cannot be established.
+        """
+        key = (host, port)
+        with self._cond:
+            if self.max_per_peer is not None:
+                deadline = time.monotonic() + timeout
+                while self._checked_out.get(key, 0) >= self.max_per_peer:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._exhausted += 1
+                        raise PoolExhaustedError(
+                            f"All {self.max_per_peer} connections to {host}:{port} are in use")
+                    self._cond.wait(remaining)
+            self._checked_out[key] = self._checked_out.get(key, 0) + 1
+
+        try:
+            now = time.monotonic()
+            while True:
+                with self._lock:
+                    idle = self._idle.get(key)
+                    conn = idle.pop() if idle else None
+                if conn is None:
+                    break
+                if now - conn.last_used < self.idle_timeout and conn.is_healthy():
+                    conn.sock.settimeout(timeout)
+                    with self._lock:
+                        self._reused += 1
+                    return conn, True
+                conn.close()
+                with self._lock:
+                    self._evicted += 1
+
+            sock = socket.create_connection((host, port), timeout=timeout)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            with self._lock:
+                self._created += 1
+            return PeerConnection(sock, host, port), False
+        except BaseException:
+            self._check_in(key)
+            raise
+
+    def release(self, conn: PeerConnection) -> None:
+        """
+        Return a connection to the pool after a successful exchange.
+
+        Args:
+            conn (PeerConnection): The connection to return.
+
+        Side Effects:
+            Closes the connection instead if it holds unread data (the
+            request/response stream is out of step) or the peer already has
+            `max_idle_per_peer` idle connections; may evict stale connections.
+        """
+        key = (conn.host, conn.port)
+        self._check_in(key)
+        if conn.has_buffered_data():
+            conn.close()
+            return
+        conn.last_used = time.monotonic()
+        with self._lock:
+            idle = self._idle.setdefault(key, deque())
+            if len(idle) < self.max_idle_per_peer:
+                idle.append(conn)
+                conn = None
+        if conn is not None:
+            conn.close()
+        self._sweep_if_due()
+
+    def discard(self, conn: PeerConnection) -> None:
+        """
+        Close a connection that must not be reused (error, protocol desync).
+
+        Args:
+            conn (PeerConnection): The connection to close.
+        """
+        self._check_in((conn.host, conn.port))
+        conn.close()
+
+    def _check_in(self, key: Tuple[str, int]) -> None:
+        """
+        Free the checkout slot of a connection to a peer and wake one waiter.
+        """
+        with self._cond:
+            count = self._checked_out.get(key, 0) - 1
+            if count > 0:
+                self._checked_out[key] = count
+            else:
+                self._checked_out.pop(key, None)
+            self._cond.notify()
+
+    def evict_idle(self) -> int:
+        """
+        Close every idle connection older than `idle_timeout`.
+
+        Returns:
+            int: The number of connections evicted.
+        """
+        now = time.monotonic()
+        expired = []
+        with self._lock:
+            self._last_sweep = now
+            for key, idle in list(self._idle.items()):
+                keep = deque(c for c in idle if now - c.last_used < self.idle_timeout)
+                expired.extend(c for c in idle if now - c.last_used >= self.idle_timeout)
+                if keep:
+                    self._idle[key] = keep
+                else:
+                    del self._idle[key]
+            self._evicted += len(expired)
+        for conn in expired:
+            conn.close()
+        return len(expired)
+
+    def _sweep_if_due(self) -> None:
+        """
+        Run `evict_idle` at most once per half idle timeout.
+        """
+        if time.monotonic() - self._last_sweep >= self.idle_timeout / 2:
+            self.evict_idle()
+
+    def close_all(self) -> None:
+        """
+        Close all idle connections.
+
+        Side Effects:
+            Empties the pool.
+        """
+        with self._lock:
+            conns = [c for idle in self._idle.values() for c in idle]
+            self._idle.clear()
+        for conn in conns:
+            conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return pool statistics.
+
+        Returns:
+            Dict[str, Any]: Idle and checked-out connections per peer, the
+            checkout limit, and created/reused/evicted/exhausted counts.
+        """
+        with self._lock:
+            return {
+                "idle": {f"{host}:{port}": len(idle) for (host, port), idle in self._idle.items()},
+                "checked_out": {f"{host}:{port}": n for (host, port), n in self._checked_out.items()},
+                "max_per_peer": self.max_per_peer,
+                "created": self._created,
+                "reused": self._reused,
+                "evicted": self._evicted,
+                "exhausted": self._exhausted,
+            }
+
+_pool_lock = threading.Lock()
+_shared_pool: Optional[ConnectionPool] = None
+
+def get_connection_pool() -> ConnectionPool:
+    """
+    Return the process-wide peer connection pool configured from `config.json`.
+
+    Returns:
+        ConnectionPool: The pool shared by all client handlers.
+    """
+    global _shared_pool
+    if _shared_pool is None:
+        with _pool_lock:
+            if _shared_pool is None:
+                network_config = ConfigManager().get("network", {})
+                _shared_pool = ConnectionPool(
+                    max_idle_per_peer=network_config.get("proxy_pool_size", 8),
+                    idle_timeout=network_config.get("proxy_idle_timeout", 30.0),
+                    max_per_peer=network_config.get("proxy_pool_max_per_peer", 16)
+                )
+    return _shared_pool
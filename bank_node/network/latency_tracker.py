@@ -0,0 +1,192 @@
+import threading
+from collections import deque
+from typing import Deque, Dict, Tuple, Optional, Any
+from bank_node.core.config_manager import ConfigManager
+
+class PeerLatency:
+    """
+    Round-trip latency statistics of a single peer.
+    """
+
+    def __init__(self, window: int):
+        """
+        Initialize the PeerLatency.
+
+        Args:
+            window (int): Number of recent samples kept for percentiles.
+        """
+        self.ewma: Optional[float] = None
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def percentile(self, q: float) -> float:
+        """
+        Return the q-th percentile of the recent samples.
+
+        Args:
+            q (float): Percentile in the range 0-100.
+
+        Returns:
+            float: The sample at that percentile (nearest rank).
+        """
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, max(0, int(round(q / 100.0 * len(ordered))) - 1))
+        return ordered[index]
+
+class LatencyTracker:
+    """
+    Tracks per-peer round-trip latency and derives deadlines from it.
+
+    Each peer keeps an EWMA and a sliding window of recent samples. Once
+    `min_samples` have been observed, connect and read timeouts are set to
+    `multiplier` times the larger of the EWMA and the p95, clamped between
+    `min_timeout` and the caller's static ceiling, so fast LAN peers are given
+    up on quickly while slow peers keep the patience they need.
+
+    A call that times out is recorded as a censored sample: the round trip
+    took at least the timeout, so that lower bound enters the statistics. A
+    peer whose latency rises beyond its derived timeout therefore gets a
+    longer timeout after each one, up to the ceiling, instead of timing out
+    for good.
+    """
+
+    def __init__(self, window: int = 128, alpha: float = 0.2, multiplier: float = 4.0,
+                 min_timeout: float = 0.5, min_samples: int = 8):
+        """
+        Initialize the LatencyTracker.
+
+        Args:
+            window (int): Samples kept per peer for percentile estimates.
+            alpha (float): EWMA smoothing factor.
+            multiplier (float): Safety factor applied to the observed latency.
+            min_timeout (float): Lower bound for derived timeouts, in seconds.
+            min_samples (int): Samples required before timeouts become adaptive.
+        """
+        self.window = window
+        self.alpha = alpha
+        self.multiplier = multiplier
+        self.min_timeout = min_timeout
+        self.min_samples = min_samples
+        self._peers: Dict[Tuple[str, int], PeerLatency] = {}
+        self._lock = threading.Lock()
+
+    def record(self, host: str, port: int, seconds: float) -> None:
+        """
+        Record one successful round trip to a peer.
+
+        Args:
+            host (str): The peer's IP address.
+            port (int): The peer's port.
+            seconds (float): The measured round-trip time.
+        """
+        with self._lock:
+            peer = self._peers.get((host, port))
+            if peer is None:
+                peer = self._peers[(host, port)] = PeerLatency(self.window)
+            peer.ewma = seconds if peer.ewma is None else (1 - self.alpha) * peer.ewma + self.alpha * seconds
+            peer.samples.append(seconds)
+
+    def record_timeout(self, host: str, port: int, timeout: float) -> None:
+        """
+        Record a round trip to a peer that timed out.
+
+        Args:
+            host (str): The peer's IP address.
+            port (int): The peer's port.
+            timeout (float): The timeout that expired, a lower bound of the latency.
+        """
+        self.record(host, port, timeout)
+
+    def timeout_for(self, host: str, port: int, ceiling: float) -> float:
+        """
+        Return the connect/read timeout to use for the next call to a peer.
+
+        Args:
+            host (str): The peer's IP address.
+            port (int): The peer's port.
+            ceiling (float): The static maximum (e.g. `network.proxy_timeout`).
+
+        Returns:
+            float: The adaptive timeout, or `ceiling` while too few samples exist.
+        """
+        with self._lock:
+            peer = self._peers.get((host, port))
+            if peer is None or len(peer.samples) < self.min_samples:
+                return ceiling
+            observed = max(peer.ewma, peer.percentile(95))
+        return min(ceiling, max(self.min_timeout, observed * self.multiplier))
+
+    def hedge_delay(self, host: str, port: int) -> Optional[float]:
+        """
+        Return how long to wait before sending a hedged duplicate request.
+
+        Args:
+            host (str): The peer's IP address.
+            port (int): The peer's port.
+
+        Returns:
+            Optional[float]: The peer's p95 latency, or None while too few samples exist.
+        """
+        with self._lock:
+            peer = self._peers.get((host, port))
+            if peer is None or len(peer.samples) < self.min_samples:
+                return None
+            return peer.percentile(95)
+
+    def record_hedge(self, host: str, port: int, won: bool) -> None:
+        """
+        Record that a hedged duplicate request was sent to a peer.
+
+        Args:
+            host (str): The peer's IP address.
+            port (int): The peer's port.
+            won (bool): True if the duplicate answered before the original.
+        """
+        with self._lock:
+            peer = self._peers.get((host, port))
+            if peer is not None:
+                peer.hedges += 1
+                peer.hedge_wins += int(won)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return latency statistics for every known peer.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Per "host:port": sample count, EWMA, p50
+            and p95 in milliseconds, and hedged requests sent and won.
+        """
+        with self._lock:
+            return {
+                f"{host}:{port}": {
+                    "samples": len(peer.samples),
+                    "ewma_ms": round(peer.ewma * 1000, 3),
+                    "p50_ms": round(peer.percentile(50) * 1000, 3),
+                    "p95_ms": round(peer.percentile(95) * 1000, 3),
+                    "hedges": peer.hedges,
+                    "hedge_wins": peer.hedge_wins,
+                }
+                for (host, port), peer in self._peers.items() if peer.samples
+            }
+
+_tracker_lock = threading.Lock()
+_shared_tracker: Optional[LatencyTracker] = None
+
+def get_latency_tracker() -> LatencyTracker:
+    """
+    Return the process-wide LatencyTracker configured from `config.json`.
+
+    Returns:
+        LatencyTracker: The tracker shared by all proxy clients.
+    """
+    global _shared_tracker
+    if _shared_tracker is None:
+        with _tracker_lock:
+            if _shared_tracker is None:
+                network_config = ConfigManager().get("network", {})
+                _shared_tracker = LatencyTracker(
+                    multiplier=network_config.get("adaptive_timeout_multiplier", 4.0),
+                    min_timeout=network_config.get("adaptive_timeout_min", 0.5)
+                )
+    return _shared_tracker
@@ -0,0 +1,82 @@
+from typing import List, Optional
+
+class LineFramer:
+    """
+    Incremental newline framer working on raw bytes.
+
+    Received chunks are appended to a single reusable `bytearray`; complete
+    lines are located with `find` and decoded exactly once, so a pipelined
+    burst costs linear time and a multibyte UTF-8 character split across two
+    chunks is decoded correctly.
+
+    A line longer than `max_line_length` is discarded up to its terminating
+    newline and reported as `None`, which bounds the buffer for clients that
+    never send a newline.
+    """
+
+    def __init__(self, max_line_length: int = 65536, encoding: str = "utf-8"):
+        """
+        Initialize the LineFramer.
+
+        Args:
+            max_line_length (int): Maximum accepted line length in bytes (excluding the newline).
+            encoding (str): Encoding used to decode complete lines.
+        """
+        self.max_line_length = max_line_length
+        self.encoding = encoding
+        self._buffer = bytearray()
+        # Offset up to which the buffer is known to contain no newline
+        self._scan_from = 0
+        # True while skipping the remainder of an over-long line
+        self._discarding = False
+
+    def feed(self, data) -> List[Optional[str]]:
+        """
+        Append received bytes and return every line they complete.
+
+        Args:
+            data (bytes | bytearray | memoryview): The received chunk.
+
+        Returns:
+            List[Optional[str]]: Decoded lines without the trailing newline,
+            in arrival order. `None` marks a line that exceeded
+            `max_line_length` and was dropped. Undecodable bytes are replaced
+            with U+FFFD.
+        """
+        buffer = self._buffer
+        buffer += data
+        lines: List[Optional[str]] = []
+        start = 0
+
+        with memoryview(buffer) as view:
+            pos = buffer.find(b'\n', self._scan_from)
+            while pos != -1:
+                if self._discarding:
+                    self._discarding = False
+                    lines.append(None)
+                elif pos - start > self.max_line_length:
+                    lines.append(None)
+                else:
+                    lines.append(str(view[start:pos], self.encoding, 'replace'))
+                start = pos + 1
+                pos = buffer.find(b'\n', start)
+
+        if start:
+            del buffer[:start]
+
+        if len(buffer) > self.max_line_length:
+            # No newline in sight: drop what we have and skip to the next one
+            self._discarding = True
+            buffer.clear()
+
+        self._scan_from = len(buffer)
+        return lines
+
+    def pending(self) -> int:
+        """
+        Return the number of buffered bytes that do not yet form a complete line.
+
+        Returns:
+            int: Size of the partial line held in the buffer.
+        """
+        return len(self._buffer)
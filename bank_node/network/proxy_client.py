@@ -1,29 +1,171 @@
+import asyncio
 import socket
+import threading
+import time
 import logging
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout, wait, FIRST_COMPLETED
+from typing import Any, Dict, NamedTuple, Optional, Set, Tuple
+from bank_node.core.config_manager import ConfigManager
+from bank_node.network.connection_pool import (
+    ConnectionPool, PeerConnection, PoolExhaustedError, get_connection_pool
+)
+from bank_node.network.circuit_breaker import PeerHealthRegistry, get_peer_health
+from bank_node.network.latency_tracker import LatencyTracker, get_latency_tracker
+from bank_node.network.response_cache import ResponseCache, get_response_cache
+from bank_node.network.single_flight import SingleFlight, get_single_flight
+from bank_node.network.async_proxy_transport import AsyncProxyTransport, get_async_proxy_transport
+from bank_node.network.bulkhead import Bulkhead, get_proxy_bulkhead
+from bank_node.protocol.deadline import get_current_deadline, format_deadline
+
+# Forwarded commands that modify a remote account
+_WRITE_CODES = frozenset({"AD", "AW", "AR"})
+# Forwarded commands that only read, and may be cached and coalesced
+_READ_CODES = frozenset({"AB", "BA", "BN"})
+
+class ProxyRequest(NamedTuple):
+    """
+    A command to forward to the node holding the account.
+    """
+    host: str
+    port: int
+    command_string: str
+    # Read-only commands may be raced by a duplicate request
+    hedge: bool = False
+
+_hedge_lock = threading.Lock()
+_hedge_executor: Optional[ThreadPoolExecutor] = None
+
+def _get_hedge_executor() -> ThreadPoolExecutor:
+    """
+    Return the shared executor that runs hedged read requests.
+
+    Returns:
+        ThreadPoolExecutor: Executor sized by `network.hedge_workers`.
+    """
+    global _hedge_executor
+    if _hedge_executor is None:
+        with _hedge_lock:
+            if _hedge_executor is None:
+                workers = ConfigManager().get("network", {}).get("hedge_workers", 16)
+                _hedge_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ProxyHedge")
+    return _hedge_executor
+
+def get_proxy_stats() -> Dict[str, Any]:
+    """
+    Return statistics of the process-wide proxy components, as logged by the
+    servers every `server.stats_interval`.
+
+    Returns:
+        Dict[str, Any]: "bulkhead" (`Bulkhead.stats`), "peers" (the circuit
+        breakers' `PeerHealthRegistry.snapshot`), "latency"
+        (`LatencyTracker.snapshot`), "cache" (`ResponseCache.stats`) and
+        "single_flight" (`SingleFlight.stats`).
+    """
+    return {
+        "bulkhead": get_proxy_bulkhead().stats(),
+        "peers": get_peer_health().snapshot(),
+        "latency": get_latency_tracker().snapshot(),
+        "cache": get_response_cache().stats(),
+        "single_flight": get_single_flight().stats(),
+    }
 
 class ProxyClient:
     """
     Handles outgoing connections to other bank nodes.
+
+    Connections are taken from a keep-alive `ConnectionPool` shared by all
+    client handlers, so consecutive forwards to the same peer skip the TCP
+    handshake. Calls to peers whose circuit breaker is open, or that recently
+    refused a connection, fail fast without touching the network.
+
+    The configured timeout is a ceiling: once enough round trips to a peer
+    have been measured, connect and read timeouts are derived from that
+    peer's observed latency by the shared `LatencyTracker`. Timeouts are
+    recorded there as well, so a peer that slows down gets longer timeouts,
+    and the half-open probe of a tripped peer always waits the full ceiling.
+
+    Replies to read-only commands are served from the shared `ResponseCache`
+    while fresh (opt-in per command code); forwarded writes invalidate the
+    affected entries. Identical read-only forwards that are in flight at the
+    same time share a single network call through `SingleFlight`, unless a
+    forwarded write has completed in between.
+
+    With the async transport, `send_command_async` forwards from an event
+    loop (the `AsyncTcpServer` proxy lane) without holding a thread.
+
+    With `network.proxy_transport` set to "async", exchanges are pipelined over
+    the shared `AsyncProxyTransport` instead of checking out a pooled socket,
+    so waiting for a peer no longer ties up a connection per request.
+
+    Every network exchange holds a slot of the proxy `Bulkhead`; when the
+    proxy budget and its queue are exhausted the call is answered with `ER`
+    at once, so slow peers cannot absorb the threads serving local commands.
+
+    The deadline of the command being executed bounds every wait; with
+    `network.propagate_deadline` enabled the remaining budget is appended to
+    the forwarded command so the next hop stops when the client has given up.
     """
-    
-    def __init__(self, timeout: float = 5.0):
+
+    def __init__(self, timeout: float = 5.0, pool: Optional[ConnectionPool] = None,
+                 peer_health: Optional[PeerHealthRegistry] = None,
+                 latency: Optional[LatencyTracker] = None,
+                 cache: Optional[ResponseCache] = None,
+                 single_flight: Optional[SingleFlight] = None,
+                 transport: Optional[AsyncProxyTransport] = None,
+                 bulkhead: Optional[Bulkhead] = None):
         """
         Initialize the ProxyClient.
 
         Args:
-            timeout (float): Connection timeout in seconds. Defaults to 5.0.
+            timeout (float): Maximum connect/read timeout in seconds. Defaults to 5.0.
+            pool (Optional[ConnectionPool]): The connection pool to use.
+                Defaults to the process-wide shared pool.
+            peer_health (Optional[PeerHealthRegistry]): Circuit breaker registry.
+                Defaults to the process-wide shared registry.
+            latency (Optional[LatencyTracker]): Per-peer latency statistics.
+                Defaults to the process-wide shared tracker.
+            cache (Optional[ResponseCache]): Cache for read-only replies.
+                Defaults to the process-wide shared cache.
+            single_flight (Optional[SingleFlight]): Coalescer for read-only forwards.
+                Defaults to the process-wide shared instance.
+            transport (Optional[AsyncProxyTransport]): Multiplexed transport to use
+                instead of the connection pool. Defaults to the shared transport
+                if `network.proxy_transport` is "async", otherwise None.
+            bulkhead (Optional[Bulkhead]): Concurrency budget for proxy work.
+                Defaults to the process-wide proxy bulkhead.
         """
         self.timeout = timeout
+        self.pool = pool or get_connection_pool()
+        self.peer_health = peer_health or get_peer_health()
+        self.latency = latency or get_latency_tracker()
+        self.cache = cache or get_response_cache()
+        self.single_flight = single_flight or get_single_flight()
+        if transport is None and ConfigManager().get("network", {}).get("proxy_transport", "pool") == "async":
+            transport = get_async_proxy_transport()
+        self.transport = transport
+        self.bulkhead = bulkhead or get_proxy_bulkhead()
+        self.propagate_deadline = ConfigManager().get("network", {}).get("propagate_deadline", False)
         self.logger = logging.getLogger("ProxyClient")
 
-    def send_command(self, target_ip: str, port: int, command_string: str) -> str:
+    def send_command(self, target_ip: str, port: int, command_string: str, hedge: bool = False) -> str:
         """
         Send a command to a remote bank node and return the response.
 
+        A pooled connection that turns out to have been closed by the peer is
+        discarded and the command is retried once on a fresh connection.
+        Network failures are reported to the peer's circuit breaker; while it
+        is open the call returns an `ER` response immediately.
+
+        With `hedge` set and enough latency samples for the peer, a duplicate
+        request is sent on a second connection if no reply has arrived after
+        the peer's p95 latency, and the first reply wins. Only read-only
+        commands may be hedged.
+
         Args:
             target_ip (str): The IP address of the target node.
             port (int): The port number of the target node.
             command_string (str): The raw command string to send.
+            hedge (bool): Allow a hedged duplicate request. Defaults to False.
 
         Returns:
             str: The response from the remote node, or an error message starting with 'ER'.
@@ -32,20 +174,493 @@ class ProxyClient:
             None: Exceptions are caught and returned as error strings.
 
         Side Effects:
-            - Opens a TCP connection to the target.
+            - Opens or reuses a TCP connection to the target.
             - Sends data over the network.
+            - Updates the peer's circuit breaker state and latency statistics.
+            - Reads, fills or invalidates the response cache.
+            - May share the network call of an identical in-flight read.
+        """
+        deadline = self._start_deadline()
+        code, _, rest = command_string.partition(" ")
+        if code in _WRITE_CODES:
+            # Invalidate on both sides of the write so a read that overlapped
+            # it cannot re-populate the cache with the old balance
+            account_id = rest.partition(" ")[0]
+            self.cache.invalidate_account(target_ip, port, account_id)
+            try:
+                return self._forward(target_ip, port, command_string, False, deadline)
+            finally:
+                self.cache.invalidate_account(target_ip, port, account_id)
+
+        if code not in _READ_CODES:
+            return self._forward(target_ip, port, command_string, hedge, deadline)
+
+        # A flight started before a write finished may return the old
+        # balance; keying on the invalidation generation keeps later reads out
+        generation = self.cache.generation()
+        if self.cache.is_cacheable(command_string):
+            cached = self.cache.get(target_ip, port, command_string)
+            if cached is not None:
+                return cached
+        return self.single_flight.do(
+            (target_ip, port, command_string, generation),
+            lambda: self._fetch(target_ip, port, command_string, hedge, deadline, generation)
+        )
+
+    async def send_command_async(self, target_ip: str, port: int, command_string: str,
+                                 hedge: bool = False) -> str:
+        """
+        Send a command to a remote bank node from an event loop.
+
+        The awaitable counterpart of `send_command`, with the same caching,
+        coalescing, circuit breaking, deadlines and hedging; the exchange runs
+        on the `AsyncProxyTransport`, so no thread is held while the peer answers.
+
+        Args:
+            target_ip (str): The IP address of the target node.
+            port (int): The port number of the target node.
+            command_string (str): The raw command string to send.
+            hedge (bool): Allow a hedged duplicate request. Defaults to False.
+
+        Returns:
+            str: The response from the remote node, or an error message starting with 'ER'.
+
+        Raises:
+            RuntimeError: If the client has no async transport
+                (`network.proxy_transport` is not "async").
+
+        Side Effects:
+            Same as `send_command`.
         """
+        if self.transport is None:
+            raise RuntimeError("send_command_async requires the async proxy transport")
+        deadline = self._start_deadline()
+        code, _, rest = command_string.partition(" ")
+        if code in _WRITE_CODES:
+            account_id = rest.partition(" ")[0]
+            self.cache.invalidate_account(target_ip, port, account_id)
+            try:
+                return await self._forward_async(target_ip, port, command_string, False, deadline)
+            finally:
+                self.cache.invalidate_account(target_ip, port, account_id)
+
+        if code not in _READ_CODES:
+            return await self._forward_async(target_ip, port, command_string, hedge, deadline)
+
+        generation = self.cache.generation()
+        if self.cache.is_cacheable(command_string):
+            cached = self.cache.get(target_ip, port, command_string)
+            if cached is not None:
+                return cached
+        return await self.single_flight.do_async(
+            (target_ip, port, command_string, generation),
+            lambda: self._fetch_async(target_ip, port, command_string, hedge, deadline, generation)
+        )
+
+    def _start_deadline(self) -> Optional[float]:
+        """
+        Return the deadline of the current request, starting one if deadlines
+        are propagated and the request arrived without one.
+
+        Returns:
+            Optional[float]: Absolute `time.monotonic()` deadline, if any.
+        """
+        deadline = get_current_deadline()
+        if deadline is None and self.propagate_deadline:
+            # Start the budget here so every later hop shares this timeout
+            deadline = time.monotonic() + self.timeout
+        return deadline
+
+    def _fetch(self, target_ip: str, port: int, command_string: str, hedge: bool,
+               deadline: Optional[float], generation: int) -> str:
+        """
+        Forward a read-only command and cache a successful reply.
+
+        Args:
+            target_ip (str): The IP address of the target node.
+            port (int): The port number of the target node.
+            command_string (str): The raw command string to send.
+            hedge (bool): Allow a hedged duplicate request.
+            deadline (Optional[float]): Absolute deadline of the request, if any.
+            generation (int): The cache generation read before the flight started.
+
+        Returns:
+            str: The response from the remote node, or an error message starting with 'ER'.
+        """
+        response = self._forward(target_ip, port, command_string, hedge, deadline)
+        if not response.startswith("ER"):
+            self.cache.put(target_ip, port, command_string, response, generation)
+        return response
+
+    async def _fetch_async(self, target_ip: str, port: int, command_string: str, hedge: bool,
+                           deadline: Optional[float], generation: int) -> str:
+        """
+        Awaitable counterpart of `_fetch`.
+        """
+        response = await self._forward_async(target_ip, port, command_string, hedge, deadline)
+        if not response.startswith("ER"):
+            self.cache.put(target_ip, port, command_string, response, generation)
+        return response
+
+    def _forward(self, target_ip: str, port: int, command_string: str, hedge: bool,
+                 deadline: Optional[float]) -> str:
+        """
+        Send a command to a peer unless its circuit is open, the proxy budget
+        is exhausted or the request's deadline has passed.
+
+        Args:
+            target_ip (str): The IP address of the target node.
+            port (int): The port number of the target node.
+            command_string (str): The raw command string to send.
+            hedge (bool): Allow a hedged duplicate request.
+            deadline (Optional[float]): Absolute deadline of the request, if any.
+
+        Returns:
+            str: The response from the remote node, or an error message starting with 'ER'.
+        """
+        refusal, queue_timeout = self._admission(target_ip, port, deadline)
+        if refusal:
+            return refusal
+
+        if not self.bulkhead.try_acquire(queue_timeout):
+            self.logger.warning(f"Proxy capacity exhausted, rejecting command to {target_ip}:{port}")
+            return "ER Proxy capacity exceeded"
+        try:
+            if hedge:
+                delay = self.latency.hedge_delay(target_ip, port)
+                if delay is not None:
+                    return self._send_hedged(target_ip, port, command_string, delay, deadline)
+            return self._send(target_ip, port, command_string, deadline)
+        finally:
+            self.bulkhead.release()
+
+    async def _forward_async(self, target_ip: str, port: int, command_string: str, hedge: bool,
+                             deadline: Optional[float]) -> str:
+        """
+        Awaitable counterpart of `_forward`.
+
+        A free proxy slot is taken on the event loop; only a caller that has
+        to queue for one waits on a thread of the loop's default executor.
+        """
+        refusal, queue_timeout = self._admission(target_ip, port, deadline)
+        if refusal:
+            return refusal
+
+        if not self.bulkhead.try_acquire_nowait():
+            admitted = await asyncio.get_running_loop().run_in_executor(
+                None, self.bulkhead.try_acquire, queue_timeout)
+            if not admitted:
+                self.logger.warning(f"Proxy capacity exhausted, rejecting command to {target_ip}:{port}")
+                return "ER Proxy capacity exceeded"
         try:
-            with socket.create_connection((target_ip, port), timeout=self.timeout) as sock:
-                sock.sendall(f"{command_string}\n".encode('utf-8'))
-                response = sock.recv(4096).decode('utf-8').strip()
+            if hedge:
+                delay = self.latency.hedge_delay(target_ip, port)
+                if delay is not None:
+                    return await self._send_hedged_async(target_ip, port, command_string, delay, deadline)
+            return await self._send_async(target_ip, port, command_string, deadline)
+        finally:
+            self.bulkhead.release()
+
+    def _admission(self, target_ip: str, port: int,
+                   deadline: Optional[float]) -> Tuple[Optional[str], Optional[float]]:
+        """
+        Check the peer's health and the request's deadline before forwarding.
+
+        Returns:
+            Tuple[Optional[str], Optional[float]]: The `ER` response if the
+            command is shed (else None), and the longest time the caller may
+            queue for a proxy slot (None for no deadline).
+        """
+        shed_reason = self.peer_health.check(target_ip, port)
+        if shed_reason:
+            self.logger.debug(f"Shedding command to {target_ip}:{port}: {shed_reason}")
+            return f"ER {shed_reason}", None
+
+        queue_timeout = None
+        if deadline is not None:
+            queue_timeout = deadline - time.monotonic()
+            if queue_timeout <= 0:
+                return "ER Deadline exceeded", None
+        return None, queue_timeout
+
+    def _send_hedged(self, target_ip: str, port: int, command_string: str, delay: float,
+                     deadline: Optional[float]) -> str:
+        """
+        Send a read-only command, duplicating it if the reply is late.
+
+        The duplicate is a second peer exchange, so it is only sent if it can
+        take a proxy bulkhead slot of its own without waiting. Waiting for the
+        replies ends at the request's deadline (or after the timeout ceiling
+        without one), even if the hedge executor has not started them yet.
+
+        Args:
+            target_ip (str): The IP address of the target node.
+            port (int): The port number of the target node.
+            command_string (str): The raw command string to send.
+            delay (float): Seconds to wait before sending the duplicate.
+            deadline (Optional[float]): Absolute deadline of the request, if any.
+
+        Returns:
+            str: The first successful response, or the last error if both fail.
+        """
+        limit = deadline if deadline is not None else time.monotonic() + self.timeout
+        executor = _get_hedge_executor()
+        primary = executor.submit(self._send, target_ip, port, command_string, deadline)
+        try:
+            return primary.result(timeout=max(0.0, min(delay, limit - time.monotonic())))
+        except FutureTimeout:
+            pass
+
+        pending = {primary}
+        backup = None
+        if self.bulkhead.try_acquire_nowait():
+            backup = executor.submit(self._send, target_ip, port, command_string, deadline)
+            backup.add_done_callback(lambda _: self.bulkhead.release())
+            pending.add(backup)
+        response = "ER Network error"
+        while pending:
+            remaining = limit - time.monotonic()
+            if remaining <= 0:
+                response = self._hedge_timed_out(target_ip, port, pending, deadline)
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                response = future.result()
+                if not response.startswith("ER"):
+                    if backup is not None:
+                        self.latency.record_hedge(target_ip, port, won=future is backup)
+                    return response
+        if backup is not None:
+            self.latency.record_hedge(target_ip, port, won=False)
+        return response
+
+    async def _send_hedged_async(self, target_ip: str, port: int, command_string: str, delay: float,
+                                 deadline: Optional[float]) -> str:
+        """
+        Awaitable counterpart of `_send_hedged`; the duplicate is a second task.
+        """
+        limit = deadline if deadline is not None else time.monotonic() + self.timeout
+        primary = asyncio.ensure_future(self._send_async(target_ip, port, command_string, deadline))
+        done, _ = await asyncio.wait({primary}, timeout=max(0.0, min(delay, limit - time.monotonic())))
+        if done:
+            return primary.result()
+
+        pending = {primary}
+        backup = None
+        if self.bulkhead.try_acquire_nowait():
+            backup = asyncio.ensure_future(self._send_async(target_ip, port, command_string, deadline))
+            backup.add_done_callback(lambda _: self.bulkhead.release())
+            pending.add(backup)
+        response = "ER Network error"
+        while pending:
+            remaining = limit - time.monotonic()
+            if remaining <= 0:
+                response = self._hedge_timed_out(target_ip, port, pending, deadline)
+                break
+            done, pending = await asyncio.wait(pending, timeout=remaining,
+                                               return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                response = task.result()
+                if not response.startswith("ER"):
+                    if backup is not None:
+                        self.latency.record_hedge(target_ip, port, won=task is backup)
+                    return response
+        if backup is not None:
+            self.latency.record_hedge(target_ip, port, won=False)
+        return response
+
+    def _hedge_timed_out(self, target_ip: str, port: int, pending: Set[Any],
+                         deadline: Optional[float]) -> str:
+        """
+        Give up on the unanswered exchanges of a hedged request.
+
+        Cancels exchanges that have not started (a started blocking one ends
+        with its own timeout).
+
+        Returns:
+            str: The `ER` response for the request.
+        """
+        for future in pending:
+            future.cancel()
+        if deadline is not None:
+            self.logger.warning(f"Deadline exceeded waiting for hedged request to {target_ip}:{port}")
+            return "ER Deadline exceeded"
+        self.logger.error(f"Timeout ({self.timeout:.2f}s) waiting for hedged request to {target_ip}:{port}")
+        return "ER Connection timed out"
+
+    def _send(self, target_ip: str, port: int, command_string: str, deadline: Optional[float]) -> str:
+        """
+        Perform one request/response exchange with a peer.
+
+        Args:
+            target_ip (str): The IP address of the target node.
+            port (int): The port number of the target node.
+            command_string (str): The raw command string to send.
+            deadline (Optional[float]): Absolute deadline of the request, if any.
+
+        Returns:
+            str: The response from the remote node, or an error message starting with 'ER'.
+        """
+        prepared = self._prepare_send(target_ip, port, command_string, deadline)
+        if prepared is None:
+            return "ER Deadline exceeded"
+        timeout, capped, command_string = prepared
+        try:
+            if self.transport is not None:
+                started = time.monotonic()
+                response = self.transport.send_command(target_ip, port, command_string, timeout)
+                return self._transport_reply(target_ip, port, response, started)
+
+            # Once a command has been sent, the peer may have applied it, so
+            # only reads are repeated after that point
+            retry_after_send = command_string[:2] in _READ_CODES
+            while True:
+                conn, reused = self.pool.acquire(target_ip, port, timeout)
+                started = time.monotonic()
+                sent = False
+                try:
+                    self._send_line(conn, command_string)
+                    sent = True
+                    response = self._read_response(conn)
+                except (ConnectionResetError, BrokenPipeError, ConnectionAbortedError):
+                    self.pool.discard(conn)
+                    if reused and (not sent or retry_after_send):
+                        # Stale keep-alive connection: retry on a fresh one
+                        continue
+                    raise
+                except BaseException:
+                    self.pool.discard(conn)
+                    raise
+
+                if response is None:
+                    # Peer closed the connection without answering
+                    self.pool.discard(conn)
+                    if reused and retry_after_send:
+                        continue
+                    self.peer_health.record_failure(target_ip, port)
+                    return "ER Connection closed by peer"
+
+                self.latency.record(target_ip, port, time.monotonic() - started)
+                self.pool.release(conn)
+                self.peer_health.record_success(target_ip, port)
                 return response
-        except socket.timeout:
-            self.logger.error(f"Timeout connecting to {target_ip}:{port}")
+        except Exception as e:
+            return self._send_failed(target_ip, port, e, timeout, capped)
+
+    async def _send_async(self, target_ip: str, port: int, command_string: str,
+                          deadline: Optional[float]) -> str:
+        """
+        Awaitable counterpart of `_send`, always on the async transport.
+        """
+        prepared = self._prepare_send(target_ip, port, command_string, deadline)
+        if prepared is None:
+            return "ER Deadline exceeded"
+        timeout, capped, command_string = prepared
+        try:
+            started = time.monotonic()
+            response = await self.transport.send_command_async(target_ip, port, command_string, timeout)
+            return self._transport_reply(target_ip, port, response, started)
+        except Exception as e:
+            return self._send_failed(target_ip, port, e, timeout, capped)
+
+    def _prepare_send(self, target_ip: str, port: int, command_string: str,
+                      deadline: Optional[float]) -> Optional[Tuple[float, bool, str]]:
+        """
+        Work out the timeout of one exchange and the command to send.
+
+        Returns:
+            Optional[Tuple[float, bool, str]]: The timeout, whether the
+            deadline capped it, and the command with the remaining budget
+            appended if deadlines are propagated; None if the deadline has passed.
+        """
+        if self.peer_health.is_probing(target_ip, port):
+            # A half-open probe decides whether the peer is back; give it the
+            # full ceiling rather than a timeout derived from older latency
+            timeout = self.timeout
+        else:
+            timeout = self.latency.timeout_for(target_ip, port, self.timeout)
+        capped = False
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            if remaining < timeout:
+                timeout, capped = remaining, True
+            if self.propagate_deadline:
+                command_string += format_deadline(remaining)
+        return timeout, capped, command_string
+
+    def _transport_reply(self, target_ip: str, port: int, response: Optional[str], started: float) -> str:
+        """
+        Record the outcome of an exchange on the transport.
+
+        Returns:
+            str: The reply, or an `ER` response if the peer closed the connection.
+        """
+        if response is None:
+            self.peer_health.record_failure(target_ip, port)
+            return "ER Connection closed by peer"
+        self.latency.record(target_ip, port, time.monotonic() - started)
+        self.peer_health.record_success(target_ip, port)
+        return response
+
+    def _send_failed(self, target_ip: str, port: int, error: Exception, timeout: float, capped: bool) -> str:
+        """
+        Record a failed exchange and translate it into an `ER` response.
+
+        Args:
+            target_ip (str): The IP address of the target node.
+            port (int): The port number of the target node.
+            error (Exception): What the exchange raised.
+            timeout (float): The timeout of the exchange.
+            capped (bool): Whether the request's deadline capped the timeout.
+
+        Returns:
+            str: The error message starting with 'ER'.
+        """
+        if isinstance(error, PoolExhaustedError):
+            # Local back-pressure, which says nothing about the peer
+            self.logger.warning(f"{error}, rejecting command")
+            return "ER Proxy capacity exceeded"
+        if isinstance(error, (socket.timeout, asyncio.TimeoutError)):
+            if capped:
+                # The client's budget ran out, which says nothing about the peer
+                self.logger.warning(f"Deadline exceeded waiting for {target_ip}:{port}")
+                return "ER Deadline exceeded"
+            self.logger.error(f"Timeout ({timeout:.2f}s) talking to {target_ip}:{port}")
+            self.latency.record_timeout(target_ip, port, timeout)
+            self.peer_health.record_failure(target_ip, port)
             return "ER Connection timed out"
-        except ConnectionRefusedError:
+        if isinstance(error, ConnectionRefusedError):
             self.logger.error(f"Connection refused by {target_ip}:{port}")
+            self.peer_health.record_failure(target_ip, port, refused=True)
             return "ER Connection refused"
-        except Exception as e:
-            self.logger.error(f"Error sending command to {target_ip}:{port}: {e}")
-            return f"ER Network error: {str(e)}"
+        self.logger.error(f"Error sending command to {target_ip}:{port}: {error}")
+        self.peer_health.record_failure(target_ip, port)
+        return f"ER Network error: {str(error)}"
+
+    def _send_line(self, conn: PeerConnection, command_string: str) -> None:
+        """
+        Send one command on a connection.
+
+        Args:
+            conn (PeerConnection): The connection to use.
+            command_string (str): The raw command string to send.
+        """
+        conn.sock.sendall(f"{command_string}\n".encode('utf-8'))
+
+    def _read_response(self, conn: PeerConnection) -> Optional[str]:
+        """
+        Read the response to a command sent with `_send_line`.
+
+        Args:
+            conn (PeerConnection): The connection the command was sent on.
+
+        Returns:
+            Optional[str]: The stripped response line, or None if the peer
+            closed the connection before answering.
+        """
+        response = conn.read_line()
+        if response is None:
+            return None
+        return response.strip()
@@ -0,0 +1,177 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Tuple, Optional, Any
+from bank_node.core.config_manager import ConfigManager
+
+CacheKey = Tuple[str, int, str]
+
+class ResponseCache:
+    """
+    Bounded TTL cache for replies to read-only commands forwarded to peers.
+
+    Entries are keyed by (host, port, command string) and live for the TTL
+    configured for their command code; codes without a positive TTL are never
+    cached. When a write to a remote account is forwarded, the matching `AB`
+    entry and the peer's `BA`/`BN` entries are invalidated, and a reply whose
+    request started before an invalidation is not stored.
+    """
+
+    def __init__(self, ttls: Dict[str, float], max_entries: int = 1024):
+        """
+        Initialize the ResponseCache.
+
+        Args:
+            ttls (Dict[str, float]): TTL in seconds per command code (e.g. {"AB": 1.0}).
+            max_entries (int): Maximum number of cached replies. Defaults to 1024.
+        """
+        self.ttls = {code.upper(): float(ttl) for code, ttl in ttls.items() if ttl and ttl > 0}
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def is_cacheable(self, command_string: str) -> bool:
+        """
+        Check whether replies to a command may be cached.
+
+        Args:
+            command_string (str): The raw command string.
+
+        Returns:
+            bool: True if the command code has a positive TTL.
+        """
+        return command_string.partition(" ")[0].upper() in self.ttls
+
+    def get(self, host: str, port: int, command_string: str) -> Optional[str]:
+        """
+        Return a fresh cached reply.
+
+        Args:
+            host (str): The peer's IP address.
+            port (int): The peer's port.
+            command_string (str): The raw command string.
+
+        Returns:
+            Optional[str]: The cached reply, or None on a miss or expired entry.
+        """
+        key = (host, port, command_string)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return entry[1]
+                del self._entries[key]
+            self._misses += 1
+            return None
+
+    def generation(self) -> int:
+        """
+        Return the invalidation generation, to be passed back to `put`.
+
+        Returns:
+            int: A counter bumped by every invalidation.
+        """
+        with self._lock:
+            return self._generation
+
+    def put(self, host: str, port: int, command_string: str, response: str, generation: int) -> None:
+        """
+        Store a reply unless an invalidation happened while it was in flight.
+
+        Args:
+            host (str): The peer's IP address.
+            port (int): The peer's port.
+            command_string (str): The raw command string.
+            response (str): The peer's reply.
+            generation (int): The value of `generation()` before the request was sent.
+        """
+        ttl = self.ttls.get(command_string.partition(" ")[0].upper())
+        if not ttl:
+            return
+        key = (host, port, command_string)
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (time.monotonic() + ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate_account(self, host: str, port: int, account_id: str) -> None:
+        """
+        Drop cached replies made stale by a write to a remote account.
+
+        Args:
+            host (str): The peer's IP address.
+            port (int): The peer's port.
+            account_id (str): The account address as forwarded, e.g. "10001/10.0.0.5".
+        """
+        with self._lock:
+            self._generation += 1
+            for command_string in (f"AB {account_id}", "BA", "BN"):
+                if self._entries.pop((host, port, command_string), None) is not None:
+                    self._invalidations += 1
+
+    def clear(self) -> None:
+        """
+        Drop all cached replies.
+
+        Side Effects:
+            Empties the cache.
+        """
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return cache statistics.
+
+        Returns:
+            Dict[str, Any]: Hit, miss, eviction and invalidation counts, current
+            size and capacity.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "size": len(self._entries),
+                "capacity": self.max_entries,
+            }
+
+_cache_lock = threading.Lock()
+_shared_cache: Optional[ResponseCache] = None
+
+def get_response_cache() -> ResponseCache:
+    """
+    Return the process-wide ResponseCache configured from `config.json`.
+
+    Caching is opt-in: only command codes listed in `network.response_cache_ttl`
+    with a positive TTL are cached.
+
+    Returns:
+        ResponseCache: The cache shared by all proxy clients.
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        with _cache_lock:
+            if _shared_cache is None:
+                network_config = ConfigManager().get("network", {})
+                _shared_cache = ResponseCache(
+                    ttls=network_config.get("response_cache_ttl", {}),
+                    max_entries=network_config.get("response_cache_size", 1024)
+                )
+    return _shared_cache
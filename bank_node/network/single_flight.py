@@ -0,0 +1,175 @@
+import asyncio
+import threading
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Any, Tuple
+
+class _Call:
+    """
+    An in-flight call whose result is shared by every waiter.
+    """
+
+    def __init__(self):
+        """
+        Initialize the _Call.
+        """
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        # Futures of callers waiting in `do_async`, with their event loops
+        self.waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+class SingleFlight:
+    """
+    Collapses identical concurrent calls into one execution.
+
+    The first caller for a key runs the function; callers arriving with the
+    same key while it is running wait for it and receive the same result (or
+    exception). Once the call completes the key is forgotten, so nothing is
+    cached beyond the lifetime of the call. Only idempotent, read-only work
+    may be passed through here.
+
+    Blocking callers (`do`) and event-loop callers (`do_async`) share the
+    same flights; coroutines wait for a call without holding a thread.
+    """
+
+    def __init__(self):
+        """
+        Initialize the SingleFlight.
+        """
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+        # Statistics
+        self._executed = 0
+        self._saved = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run `fn` once for all concurrent callers with the same key.
+
+        Args:
+            key (Hashable): Identifies identical calls, e.g. (host, port, command).
+            fn (Callable[[], Any]): The work to run if no identical call is in flight.
+
+        Returns:
+            Any: The result of the (possibly shared) call.
+
+        Raises:
+            Exception: Whatever `fn` raised, re-raised in every waiter.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self._saved += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self._executed += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            self._finish(key, call)
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await `fn()` once for all concurrent callers with the same key.
+
+        Args:
+            key (Hashable): Identifies identical calls, e.g. (host, port, command).
+            fn (Callable[[], Awaitable[Any]]): Returns the awaitable to run if
+                no identical call is in flight.
+
+        Returns:
+            Any: The result of the (possibly shared) call.
+
+        Raises:
+            Exception: Whatever the call raised, re-raised in every waiter.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self._saved += 1
+                waiter = loop.create_future()
+                call.waiters.append((loop, waiter))
+            else:
+                call = self._calls[key] = _Call()
+                self._executed += 1
+                waiter = None
+
+        if waiter is not None:
+            return await waiter
+
+        try:
+            call.result = await fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            self._finish(key, call)
+
+    def _finish(self, key: Hashable, call: _Call) -> None:
+        """
+        Forget a completed call and wake everyone waiting for it.
+        """
+        with self._lock:
+            del self._calls[key]
+            waiters, call.waiters = call.waiters, []
+        call.done.set()
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(_resolve, waiter, call)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return coalescing statistics.
+
+        Returns:
+            Dict[str, Any]: Calls executed, calls saved by joining an in-flight
+            call, and the number of calls currently in flight.
+        """
+        with self._lock:
+            return {
+                "executed": self._executed,
+                "saved": self._saved,
+                "in_flight": len(self._calls),
+            }
+
+def _resolve(waiter: asyncio.Future, call: _Call) -> None:
+    """
+    Complete an async waiter with a call's outcome. Runs on the waiter's loop.
+    """
+    if waiter.done():
+        return
+    if call.error is not None:
+        waiter.set_exception(call.error)
+    else:
+        waiter.set_result(call.result)
+
+_flight_lock = threading.Lock()
+_shared_flight: Optional[SingleFlight] = None
+
+def get_single_flight() -> SingleFlight:
+    """
+    Return the process-wide SingleFlight used for read-only forwards.
+
+    Returns:
+        SingleFlight: The instance shared by all proxy clients.
+    """
+    global _shared_flight
+    if _shared_flight is None:
+        with _flight_lock:
+            if _shared_flight is None:
+                _shared_flight = SingleFlight()
+    return _shared_flight
@@ -1,13 +1,21 @@
 import socket
-import threading
 import logging
-from typing import List
-from bank_node.network.client_handler import ClientHandler
+import time
+from typing import Dict, Any
+from bank_node.core.config_manager import ConfigManager
+from bank_node.network.client_handler import ClientHandler, encode_response
+from bank_node.network.worker_pool import WorkerPool
+from bank_node.network.bulkhead import get_proxy_bulkhead
+from bank_node.network.proxy_client import get_proxy_stats
 
 class TcpServer:
     """
     The main TCP Server that listens for incoming connections and delegates
-    handling to ClientHandler threads.
+    handling to ClientHandlers running on a bounded WorkerPool.
+
+    Proxied commands are bounded by the proxy bulkhead (own queue, `ER` on
+    overflow) and run inside `WorkerPool.blocking()`, so workers waiting on
+    peers never use up the workers that serve local commands.
     """
 
     def __init__(self, host: str, port: int):
@@ -19,15 +27,31 @@ class TcpServer:
             port (int): The port number to listen on.
 
         Side Effects:
-            Initializes the logger and internal state, but does not start listening.
+            Initializes the logger, internal state and worker pool, but does not
+            start listening.
         """
         self.host = host
         self.port = port
         self.server_socket = None
         self.is_running = False
-        self.client_threads = []
         self.logger = logging.getLogger("TcpServer")
 
+        config = ConfigManager()
+        server_config = config.get("server", {})
+        # Peers (machine clients) whose input skips Telnet cleaning
+        self.raw_clients = set(config.get("network", {}).get("raw_clients", []))
+        self.backlog = server_config.get("backlog", 1024)
+        self.stats_interval = server_config.get("stats_interval", 60.0)
+        self._last_stats_log = time.monotonic()
+        self.pool = WorkerPool(
+            min_workers=server_config.get("min_workers", 8),
+            max_workers=server_config.get("max_workers", 256),
+            queue_size=server_config.get("pending_queue_size", 64),
+            target_queue_wait=server_config.get("target_queue_wait_ms", 50) / 1000.0,
+            idle_timeout=server_config.get("worker_idle_timeout", 30.0),
+            name="TcpServer-worker"
+        )
+
     def start(self):
         """
         Start the TCP server to listen for incoming connections.
@@ -42,12 +66,13 @@ class TcpServer:
         Side Effects:
             - Binds to a network port.
             - Blocks the calling thread while running.
-            - Spawns new threads for handling clients.
+            - Starts the worker pool that handles clients.
         """
         self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self.server_socket.bind((self.host, self.port))
-        self.server_socket.listen(5)
+        self.server_socket.listen(self.backlog)
+        self.pool.start()
         self.is_running = True
         self.logger.info(f"Server started on {self.host}:{self.port}")
 
@@ -62,7 +87,7 @@ class TcpServer:
                 except OSError:
                     break
                 finally:
-                    self._cleanup_handlers()
+                    self._maintain_pool()
         except Exception as e:
             self.logger.error(f"Server error: {e}")
         finally:
@@ -70,29 +95,57 @@ class TcpServer:
 
     def _handle_client(self, client_socket: socket.socket, address):
         """
-        Handle a new client connection by spawning a handler thread.
+        Handle a new client connection by queueing it on the worker pool.
+
+        If the pool's pending queue is full the client is told the server is
+        busy and disconnected immediately.
 
         Args:
             client_socket (socket.socket): The connected client socket object.
             address (tuple): The (ip, port) tuple of the client.
 
         Side Effects:
-            - Creates and starts a new ClientHandler thread.
-            - Adds the thread to the `client_threads` list.
+            - Submits a ClientHandler to the worker pool, or
+            - Sends "ER Server busy" and closes the socket when admission fails.
         """
         self.logger.info(f"New connection from {address}")
-        handler = ClientHandler(client_socket, address)
-        handler.start()
-        self.client_threads.append(handler)
-
-    def _cleanup_handlers(self):
+        handler = ClientHandler(client_socket, address, clean_telnet=address[0] not in self.raw_clients,
+                                worker_pool=self.pool)
+        if not self.pool.submit(handler.run, on_cancel=client_socket.close):
+            self.logger.warning(f"Rejecting connection from {address}: server busy")
+            try:
+                client_socket.sendall(encode_response("ER Server busy"))
+            except OSError:
+                pass
+            finally:
+                client_socket.close()
+
+    def _maintain_pool(self):
         """
-        Remove terminated client handler threads from the list.
+        Let the worker pool resize itself and periodically log its statistics.
 
         Side Effects:
-            Modifies `self.client_threads` by filtering out dead threads.
+            - May grow the worker pool.
+            - Logs pool and proxy statistics every `stats_interval` seconds.
+        """
+        self.pool.adjust()
+        now = time.monotonic()
+        if self.stats_interval and now - self._last_stats_log >= self.stats_interval:
+            self._last_stats_log = now
+            self.logger.info(f"Worker pool stats: {self.pool.stats()}")
+            self.logger.info(f"Proxy stats: {get_proxy_stats()}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return worker pool occupancy and queue statistics for tuning.
+
+        Returns:
+            Dict[str, Any]: See `WorkerPool.stats`; the "proxy" key holds the
+            proxy bulkhead's `Bulkhead.stats`.
         """
-        self.client_threads = [t for t in self.client_threads if t.is_alive()]
+        stats = self.pool.stats()
+        stats["proxy"] = get_proxy_bulkhead().stats()
+        return stats
 
     def stop(self):
         """
@@ -103,12 +156,11 @@ class TcpServer:
 
         Side Effects:
             - Closes the server socket.
-            - Joins client handler threads.
+            - Closes queued connections and joins pool workers.
             - Sets `self.is_running` to False.
         """
         self.is_running = False
         if self.server_socket:
             self.server_socket.close()
-        for handler in self.client_threads:
-            handler.join(timeout=1.0) # Wait for handlers to finish
+        self.pool.shutdown(timeout=1.0) # Wait for handlers to finish
         self.logger.info("Server stopped")
@@ -0,0 +1,250 @@
+import threading
+import queue
+import time
+import logging
+from contextlib import contextmanager
+from typing import Callable, Optional, Dict, Any, Iterator, List
+
+class WorkerPool:
+    """
+    Bounded pool of worker threads fed from a bounded pending queue.
+
+    The pool keeps between `min_workers` and `max_workers` threads alive.
+    It grows when submitted work would have to wait (no idle worker, or the
+    measured queue wait exceeds `target_queue_wait`) and shrinks again by
+    retiring workers that stay idle for `idle_timeout` seconds.
+    When the pending queue is full, `submit` refuses the task immediately.
+
+    A task about to wait on something slow and separately bounded (proxied
+    commands, limited by the proxy bulkhead) wraps that wait in `blocking()`.
+    Workers inside it do not count against `max_workers`, so queued tasks
+    get a worker even while many are stuck waiting on peers, which keeps
+    local work ahead of proxied work.
+    """
+
+    def __init__(self, min_workers: int = 8, max_workers: int = 256, queue_size: int = 64,
+                 target_queue_wait: float = 0.05, idle_timeout: float = 30.0,
+                 name: str = "WorkerPool"):
+        """
+        Initialize the WorkerPool.
+
+        Args:
+            min_workers (int): Number of workers kept alive at all times.
+            max_workers (int): Upper bound on the number of workers.
+            queue_size (int): Capacity of the pending task queue.
+            target_queue_wait (float): Queue wait (seconds) above which the pool grows.
+            idle_timeout (float): Seconds an extra worker may stay idle before retiring.
+            name (str): Prefix used for worker thread names and the logger.
+        """
+        self.min_workers = max(1, min_workers)
+        self.max_workers = max(self.min_workers, max_workers)
+        self.target_queue_wait = target_queue_wait
+        self.idle_timeout = idle_timeout
+        self.name = name
+        self.logger = logging.getLogger(name)
+
+        # Items are (task, on_cancel, enqueued_at); None is a stop sentinel
+        self._tasks: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._workers: List[threading.Thread] = []
+        self._busy = 0
+        # Workers inside `blocking()`
+        self._blocked = 0
+        self._running = False
+        self._next_id = 0
+
+        # Statistics
+        self._wait_ewma = 0.0
+        self._max_wait = 0.0
+        self._completed = 0
+        self._rejected = 0
+
+    def start(self) -> None:
+        """
+        Start the minimum number of workers.
+
+        Side Effects:
+            Spawns `min_workers` daemon threads.
+        """
+        with self._lock:
+            self._running = True
+            while len(self._workers) < self.min_workers:
+                self._spawn_worker()
+
+    def submit(self, task: Callable[[], None], on_cancel: Optional[Callable[[], None]] = None) -> bool:
+        """
+        Queue a task for execution.
+
+        Args:
+            task (Callable[[], None]): The callable to run on a worker.
+            on_cancel (Optional[Callable[[], None]]): Called instead of `task` if the
+                pool shuts down before the task is started.
+
+        Returns:
+            bool: True if the task was queued, False if the pending queue is full
+            or the pool is not running.
+        """
+        if not self._running:
+            return False
+        try:
+            self._tasks.put_nowait((task, on_cancel, time.monotonic()))
+        except queue.Full:
+            with self._lock:
+                self._rejected += 1
+            return False
+
+        with self._lock:
+            idle = len(self._workers) - self._busy
+            if idle < self._tasks.qsize() and self._counted_workers() < self.max_workers:
+                self._spawn_worker()
+        return True
+
+    @contextmanager
+    def blocking(self) -> Iterator[None]:
+        """
+        Mark the calling worker as waiting on separately bounded work.
+
+        While inside, the worker does not count against `max_workers`, and a
+        replacement is started if tasks are queued with no idle worker.
+
+        Example:
+            >>> with pool.blocking():
+            ...     response = forward_to_peer()
+        """
+        with self._lock:
+            self._blocked += 1
+            if (self._running and not self._tasks.empty()
+                    and len(self._workers) == self._busy
+                    and self._counted_workers() < self.max_workers):
+                self._spawn_worker()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._blocked -= 1
+
+    def adjust(self) -> None:
+        """
+        Grow the pool if the measured queue wait is above target.
+
+        Intended to be called periodically by the owner (e.g. the accept loop).
+        Shrinking happens on its own as idle workers time out.
+
+        Side Effects:
+            May spawn an additional worker thread.
+        """
+        with self._lock:
+            if (self._running and self._wait_ewma > self.target_queue_wait
+                    and not self._tasks.empty() and self._counted_workers() < self.max_workers):
+                self._spawn_worker()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return a snapshot of pool occupancy and queue statistics.
+
+        Returns:
+            Dict[str, Any]: Worker counts (including busy workers inside
+            `blocking()`), queue depth/capacity, completed and rejected task
+            counts, and queue wait figures in milliseconds.
+        """
+        with self._lock:
+            return {
+                "workers": len(self._workers),
+                "busy": self._busy,
+                "blocked": self._blocked,
+                "idle": len(self._workers) - self._busy,
+                "queue_depth": self._tasks.qsize(),
+                "queue_capacity": self._tasks.maxsize,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "avg_queue_wait_ms": round(self._wait_ewma * 1000, 3),
+                "max_queue_wait_ms": round(self._max_wait * 1000, 3),
+            }
+
+    def shutdown(self, timeout: float = 1.0) -> None:
+        """
+        Stop accepting work, cancel pending tasks and wait for workers to exit.
+
+        Args:
+            timeout (float): Seconds to wait for each busy worker to finish.
+
+        Side Effects:
+            - Calls `on_cancel` for every task that never started.
+            - Joins worker threads (bounded by `timeout`).
+        """
+        with self._lock:
+            self._running = False
+            workers = list(self._workers)
+
+        while True:
+            try:
+                item = self._tasks.get_nowait()
+            except queue.Empty:
+                break
+            if item and item[1]:
+                try:
+                    item[1]()
+                except Exception:
+                    pass
+
+        for _ in workers:
+            try:
+                self._tasks.put_nowait(None)
+            except queue.Full:
+                break
+        for worker in workers:
+            worker.join(timeout=timeout)
+
+    def _counted_workers(self) -> int:
+        """
+        Return the number of workers counted against `max_workers`. Must be
+        called with `self._lock` held.
+        """
+        return len(self._workers) - self._blocked
+
+    def _spawn_worker(self) -> None:
+        """
+        Start a new worker thread. Must be called with `self._lock` held.
+        """
+        self._next_id += 1
+        worker = threading.Thread(target=self._worker_loop, name=f"{self.name}-{self._next_id}", daemon=True)
+        self._workers.append(worker)
+        worker.start()
+
+    def _worker_loop(self) -> None:
+        """
+        Main loop of a worker thread: take tasks, run them, retire when idle.
+        """
+        current = threading.current_thread()
+        while True:
+            try:
+                item = self._tasks.get(timeout=self.idle_timeout)
+            except queue.Empty:
+                with self._lock:
+                    if not self._running or len(self._workers) > self.min_workers:
+                        self._workers.remove(current)
+                        return
+                continue
+
+            if item is None or not self._running:
+                with self._lock:
+                    if current in self._workers:
+                        self._workers.remove(current)
+                if item and item[1]:
+                    item[1]()
+                return
+
+            task, _, enqueued_at = item
+            wait = time.monotonic() - enqueued_at
+            with self._lock:
+                self._busy += 1
+                self._wait_ewma = 0.8 * self._wait_ewma + 0.2 * wait
+                self._max_wait = max(self._max_wait, wait)
+            try:
+                task()
+            except Exception as e:
+                self.logger.error(f"Task failed: {e}", exc_info=True)
+            finally:
+                with self._lock:
+                    self._busy -= 1
+                    self._completed += 1
@@ -1,37 +1,249 @@
-from typing import Any
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
 from bank_node.core.account_repository import AccountRepository
+from bank_node.core.config_manager import ConfigManager
 
 class AutoSaver:
     """
     Observer class that automatically saves the account repository
     whenever a relevant bank event occurs.
+
+    Saves are group-committed: events only mark the repository dirty, and a
+    background flusher thread saves it at most once per `flush_interval_ms`,
+    or sooner once `max_batch` events have accumulated. A change is therefore
+    on disk at most `flush_interval_ms` after it was made; `close()` performs
+    the final flush on shutdown.
+
+    If the data store can persist single changes (`IDataStore.append_changes`,
+    e.g. the journal), events are handed to it directly and the repository
+    is never saved in full. A failed append is retried with backoff rather
+    than replaced by a full save, because the repository state already
+    contains changes whose events are still queued and would then be
+    journaled twice. A batch the store cannot encode is not retried: the
+    store reports it like a store without `append_changes` and the next
+    save writes it out.
     """
-    def __init__(self, account_repository: AccountRepository):
+    def __init__(self, account_repository: AccountRepository, flush_interval_ms: Optional[int] = None,
+                 max_batch: Optional[int] = None):
         """
-        Initialize the AutoSaver.
+        Initialize the AutoSaver and start its flusher thread.
 
         Args:
             account_repository (AccountRepository): The repository instance to save.
                 This instance is used to trigger persistence when updates occur.
+            flush_interval_ms (Optional[int]): Maximum milliseconds a change stays
+                unsaved; 0 saves as soon as possible. Defaults to
+                `persistence.flush_interval_ms`.
+            max_batch (Optional[int]): Number of pending events that triggers a
+                save before the interval has passed. Defaults to `persistence.max_batch`.
+
+        Side Effects:
+            - Reads persistence settings from the configuration.
+            - Starts the daemon flusher thread.
         """
         self.account_repository = account_repository
+        self.logger = logging.getLogger("AutoSaver")
+
+        persistence_config = ConfigManager().get("persistence", {})
+        if flush_interval_ms is None:
+            flush_interval_ms = persistence_config.get("flush_interval_ms", 100)
+        if max_batch is None:
+            max_batch = persistence_config.get("max_batch", 500)
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.max_batch = max_batch
+
+        self._cond = threading.Condition(threading.Lock())
+        self._pending = 0
+        # Monotonic time of the oldest unsaved event, None when clean
+        self._dirty_since: Optional[float] = None
+        self._running = True
+
+        # Statistics
+        self._started = time.monotonic()
+        self._flushes = 0
+        self._failures = 0
+        self._events_flushed = 0
+        self._events_journaled = 0
+        self._append_failures = 0
+        self._max_batch_seen = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+
+        self._thread = threading.Thread(target=self._run, name="AutoSaver", daemon=True)
+        self._thread.start()
 
     def update(self, event_type: str, data: Any):
         """
         React to a notification from the subject (Bank).
 
         This method is the event handler for the Observer pattern.
-        It triggers a save operation on the account repository.
+        It appends the change to the data store if supported, otherwise marks
+        the repository dirty for the flusher thread.
 
         Args:
             event_type (str): The type of event that occurred (e.g., "transaction", "account_created").
             data (Any): Additional data associated with the event (e.g., the account object).
-        
+        """
+        self.update_batch([(event_type, data)])
+
+    def update_batch(self, events: List[Tuple[str, Any]]):
+        """
+        React to a batch of notifications delivered by the Bank's event dispatcher.
+
+        Blocks, retrying, while the data store fails to append the batch, until
+        `close()` is called.
+
+        Args:
+            events (List[Tuple[str, Any]]): The (event_type, data) tuples of the batch.
+        """
+        if not events:
+            return
+        delay = 0.05
+        while True:
+            try:
+                if not self.account_repository.append_changes(events):
+                    self._mark_dirty(len(events))
+                    return
+                with self._cond:
+                    self._events_journaled += len(events)
+                return
+            except Exception as e:
+                self.logger.error(f"Appending changes failed, retrying in {delay:.2f}s: {e}", exc_info=True)
+
+            # Holding up delivery also holds up (blocks) further transactions
+            with self._cond:
+                self._append_failures += 1
+                if not self._running:
+                    self.logger.critical(f"Stopped with {len(events)} event(s) not journaled.")
+                    return
+                self._cond.wait(delay)
+            delay = min(delay * 2, 1.0)
+
+    def events_dropped(self, count: int):
+        """
+        React to bank events that were dropped before delivery.
+
+        The repository holds the changes, so a save is scheduled from it as
+        if the events had arrived. Stores persisting single changes (the
+        journal) cannot recover from this; they require the "block" policy.
+
+        Args:
+            count (int): Number of dropped events.
+        """
+        self._mark_dirty(count)
+
+    def flush(self) -> bool:
+        """
+        Save the repository now if it has unsaved changes.
+
+        Returns:
+            bool: True if nothing was pending or the save succeeded.
+
         Side Effects:
-            - Calls `self.account_repository.save()`, which writes data to storage.
-            - Prints a log message to stdout.
+            Calls `self.account_repository.save()`, which writes data to storage.
+        """
+        with self._cond:
+            pending = self._pending
+            if self._dirty_since is None:
+                return True
+            # Events arriving during the save start a new batch
+            self._pending = 0
+            self._dirty_since = None
+
+        started = time.monotonic()
+        try:
+            self.account_repository.save()
+        except Exception as e:
+            self.logger.error(f"Saving the repository failed: {e}", exc_info=True)
+            with self._cond:
+                self._failures += 1
+                self._pending += pending
+                # Retry one interval from now
+                if self._dirty_since is None:
+                    self._dirty_since = time.monotonic()
+            return False
+
+        latency = time.monotonic() - started
+        with self._cond:
+            self._flushes += 1
+            self._events_flushed += pending
+            self._max_batch_seen = max(self._max_batch_seen, pending)
+            self._total_latency += latency
+            self._max_latency = max(self._max_latency, latency)
+        return True
+
+    def close(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Stop the flusher thread and save any unsaved changes.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait for the flusher thread.
+
+        Returns:
+            bool: True if the final flush succeeded.
+        """
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        return self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return group-commit statistics.
+
+        Returns:
+            Dict[str, Any]: Number of flushes and failed flushes, flushes per
+            second since start, events saved, average/maximum events per flush,
+            average/maximum flush latency, events currently pending, and events
+            persisted through `append_changes` and failed append attempts.
+        """
+        with self._cond:
+            flushes = self._flushes
+            elapsed = max(time.monotonic() - self._started, 1e-9)
+            return {
+                "flushes": flushes,
+                "failures": self._failures,
+                "flushes_per_sec": round(flushes / elapsed, 3),
+                "events_flushed": self._events_flushed,
+                "avg_batch": round(self._events_flushed / flushes, 1) if flushes else 0.0,
+                "max_batch": self._max_batch_seen,
+                "avg_flush_ms": round(self._total_latency / flushes * 1000, 3) if flushes else 0.0,
+                "max_flush_ms": round(self._max_latency * 1000, 3),
+                "pending": self._pending,
+                "events_journaled": self._events_journaled,
+                "append_failures": self._append_failures,
+            }
+
+    def _mark_dirty(self, count: int) -> None:
+        """
+        Record `count` unsaved events and wake the flusher if needed.
+        """
+        with self._cond:
+            self._pending += count
+            if self._dirty_since is None:
+                self._dirty_since = time.monotonic()
+                self._cond.notify_all()
+            elif self._pending >= self.max_batch:
+                self._cond.notify_all()
+
+    def _run(self) -> None:
+        """
+        Flusher loop: save once the oldest change is `flush_interval` old or
+        `max_batch` events are pending, until closed.
         """
-        # For now, we save on every relevant event.
-        # In a real system, we might check event_type or debounce.
-        print(f"AutoSaver: Saving data due to event '{event_type}'")
-        self.account_repository.save()
+        while True:
+            with self._cond:
+                while self._running:
+                    if self._dirty_since is not None:
+                        remaining = self._dirty_since + self.flush_interval - time.monotonic()
+                        if remaining <= 0 or self._pending >= self.max_batch:
+                            break
+                        self._cond.wait(remaining)
+                    else:
+                        self._cond.wait()
+                if not self._running:
+                    return
+            self.flush()
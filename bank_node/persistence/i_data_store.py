@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 
 class IDataStore(ABC):
     """
@@ -50,3 +50,44 @@ class IDataStore(ABC):
             - Reads data from the configured storage medium.
         """
         pass
+
+    def save_changes(self, changed: Dict[str, Any], removed: List[str]) -> bool:
+        """
+        Saves only the accounts changed or removed since the last save.
+
+        Stores that can update single rows (e.g. SQLite) override this. The
+        default supports nothing, so callers fall back to `save_data`.
+
+        Args:
+            changed (Dict[str, Any]): {account_id: account_dict} of added or
+                modified accounts.
+            removed (List[str]): The account_ids of removed accounts.
+
+        Returns:
+            bool: True if the changes were saved, False if the store only
+            supports saving the entire state.
+        """
+        return False
+
+    def append_changes(self, changes: List[Tuple[str, Any]]) -> bool:
+        """
+        Persists individual changes instead of the entire state.
+
+        Stores that can record single mutations (e.g. a journal) override this.
+        The default supports nothing, so callers fall back to `save_data`.
+
+        Args:
+            changes (List[Tuple[str, Any]]): (event_type, data) tuples as
+                notified by the Bank.
+
+        Returns:
+            bool: True if the changes were persisted, False if the store only
+            supports saving the entire state.
+        """
+        return False
+
+    def close(self) -> None:
+        """
+        Releases files or connections held by the store. Defaults to no-op.
+        """
+        pass
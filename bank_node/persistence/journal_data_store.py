@@ -0,0 +1,377 @@
+import json
+import logging
+import os
+import struct
+import threading
+import zlib
+from typing import Dict, Any, List, Optional, Tuple
+from bank_node.persistence.i_data_store import IDataStore
+
+# Record frame: payload length and CRC-32 of the payload, then the payload
+_FRAME = struct.Struct(">II")
+# Payload: operation, account number, amount (generation for "G")
+_RECORD = struct.Struct(">BIq")
+
+_OP_GENERATION = ord("G")
+_OP_CREATE = ord("C")
+_OP_DEPOSIT = ord("D")
+_OP_WITHDRAW = ord("W")
+_OP_REMOVE = ord("R")
+
+class JournalDataStore(IDataStore):
+    """
+    Implementation of IDataStore using a write-ahead journal and snapshots.
+
+    Every mutation is appended to `<file_path>.wal` as one fixed-size,
+    CRC-checked record, so persisting a transaction costs the same no matter
+    how many accounts the bank holds. All records of one `append_changes`
+    call share a single fsync. Once `snapshot_every` records have been
+    written, the state is written to `file_path` as a JSON snapshot and the
+    journal is truncated.
+
+    Snapshots carry a generation number that the journal repeats in its
+    first record, so a journal left over from before the latest snapshot
+    (a crash between the two steps) is recognised and ignored. At startup
+    `load_data` replays the journal on top of the snapshot up to the first
+    incomplete or corrupt record (a torn tail), which is cut off.
+    """
+
+    def __init__(self, file_path: str, fsync: bool = True, snapshot_every: int = 10000):
+        """
+        Initialize the JournalDataStore with a snapshot path.
+
+        Args:
+            file_path (str): Path of the JSON snapshot; the journal is
+                `file_path + ".wal"`.
+            fsync (bool): Whether every appended batch is fsynced before
+                `append_changes` returns. Defaults to True.
+            snapshot_every (int): Journal records after which a snapshot is
+                written and the journal truncated. Defaults to 10000.
+        """
+        self.file_path = file_path
+        self.journal_path = file_path + ".wal"
+        self.fsync = fsync
+        self.snapshot_every = snapshot_every
+
+        self._lock = threading.Lock()
+        # Balances as of the end of the journal, the source of every snapshot
+        self._balances: Optional[Dict[int, int]] = None
+        self._generation = 0
+        self._records = 0
+        self._journal = None
+        # Set when a failed write could not be rolled back
+        self._write_error: Optional[Exception] = None
+        # Set when a batch could not be encoded and only a snapshot holds it
+        self._snapshot_due = False
+        self.logger = logging.getLogger("JournalDataStore")
+
+    def save_data(self, data: Dict[str, Any]) -> None:
+        """
+        Writes the given state as a new snapshot and truncates the journal.
+
+        Only consistent with the journal when no changes are in flight, e.g.
+        when importing data offline; `AccountRepository.save()` never calls
+        it, because `save_changes` reports the journal as already up to date.
+
+        Args:
+            data (Dict[str, Any]): The data to save.
+                Expected structure: {account_id: account_dict}
+
+        Raises:
+            IOError: If the snapshot or journal cannot be written.
+
+        Side Effects:
+            - Replaces the snapshot file.
+            - Truncates the journal.
+        """
+        balances = {}
+        for account_data in data.values():
+            balances[int(account_data["number"])] = account_data.get("balance", 0)
+        with self._lock:
+            self._balances = balances
+            self._snapshot()
+
+    def save_changes(self, changed: Dict[str, Any], removed: List[str]) -> bool:
+        """
+        Reports the changes as saved, writing a snapshot only if a batch
+        could not be journaled.
+
+        Every change reaches the journal through `append_changes`. A snapshot
+        of the repository could include changes whose events are still on
+        their way, which replay would then apply twice, so the snapshot is
+        taken from the journal's own state instead.
+
+        Args:
+            changed (Dict[str, Any]): Ignored.
+            removed (List[str]): Ignored.
+
+        Returns:
+            bool: Always True.
+
+        Raises:
+            IOError: If the due snapshot cannot be written.
+        """
+        with self._lock:
+            if self._snapshot_due:
+                self._snapshot()
+        return True
+
+    def load_data(self) -> Dict[str, Any]:
+        """
+        Loads the snapshot and replays the journal on top of it.
+
+        Returns:
+            Dict[str, Any]: The recovered data.
+                Structure: {account_id: {'number': ..., 'balance': ...}}
+                Returns an empty dictionary if neither file exists.
+
+        Raises:
+            IOError: If the files cannot be read.
+
+        Side Effects:
+            - Truncates a torn or corrupt tail off the journal.
+            - Opens the journal for appending.
+        """
+        with self._lock:
+            self._recover()
+            return {
+                str(number): {"number": number, "balance": balance}
+                for number, balance in self._balances.items()
+            }
+
+    def append_changes(self, changes: List[Tuple[str, Any]]) -> bool:
+        """
+        Appends one journal record per bank event.
+
+        Args:
+            changes (List[Tuple[str, Any]]): (event_type, data) tuples as
+                notified by the Bank.
+
+        Returns:
+            bool: True if the changes are persisted (and fsynced if enabled).
+            False if a record does not fit the journal format (an amount
+            outside the int64 range): nothing is written, the batch is
+            applied in memory only and the next `save_changes` writes a
+            snapshot, so the caller has to `save()` instead of retrying.
+
+        Raises:
+            IOError: If the journal cannot be written. The batch is then cut
+                off the journal again and not applied, so it can be retried
+                as a whole.
+
+        Side Effects:
+            - Appends to the journal file.
+            - Writes a snapshot and truncates the journal every `snapshot_every` records.
+        """
+        with self._lock:
+            if self._balances is None:
+                self._recover()
+
+            if self._write_error is not None:
+                raise IOError(f"Journal {self.journal_path} is unusable after a failed write") \
+                    from self._write_error
+
+            records = []
+            for event_type, data in changes:
+                record = self._to_record(event_type, data)
+                if record is not None:
+                    records.append(record)
+            if not records:
+                return True
+
+            try:
+                frames = b"".join(self._frame(*record) for record in records)
+            except struct.error as e:
+                # Retrying cannot help; nothing is written, so applying the
+                # batch keeps the state in event order for the snapshot
+                self.logger.error(f"Cannot journal a batch of {len(records)} record(s), "
+                                  f"saving a snapshot instead: {e}")
+                for record in records:
+                    self._apply(self._balances, *record)
+                self._snapshot_due = True
+                return False
+
+            self._write(frames)
+            # Only what is on disk enters the state snapshots are taken from
+            for record in records:
+                self._apply(self._balances, *record)
+            self._records += len(records)
+            if self._records >= self.snapshot_every:
+                self._snapshot()
+            return True
+
+    def close(self) -> None:
+        """
+        Close the journal file.
+        """
+        with self._lock:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+
+    def _write(self, frames: bytes) -> None:
+        """
+        Append frames to the journal, or leave it unchanged if that fails.
+        Caller holds the lock.
+
+        Raises:
+            IOError: If the frames cannot be written (and synced).
+        """
+        start = self._journal.tell()
+        try:
+            view = memoryview(frames)
+            while view:
+                view = view[self._journal.write(view):]
+            if self.fsync:
+                os.fsync(self._journal.fileno())
+        except Exception as e:
+            try:
+                self._journal.truncate(start)
+                self._journal.seek(start)
+            except Exception:
+                # Part of the batch may be on disk; retrying would repeat it
+                self._write_error = e
+            raise
+
+    @staticmethod
+    def _to_record(event_type: str, data: Any) -> Optional[Tuple[int, int, int]]:
+        """
+        Translate a bank event into an (operation, account, amount) record.
+
+        Returns:
+            Optional[Tuple[int, int, int]]: The record, or None for events
+            that do not change account state.
+        """
+        if event_type == "transaction":
+            op = _OP_DEPOSIT if data["type"] == "deposit" else _OP_WITHDRAW
+            return op, data["account"], data["amount"]
+        if event_type == "account_created":
+            return _OP_CREATE, data["account_number"], 0
+        if event_type == "account_removed":
+            return _OP_REMOVE, data["account_number"], 0
+        return None
+
+    @staticmethod
+    def _apply(balances: Dict[int, int], op: int, number: int, amount: int) -> None:
+        """
+        Apply one record to a balance map.
+
+        Deposits and withdrawals are stored as amounts, so their order within
+        an account does not matter; changes to unknown accounts are ignored.
+        """
+        if op == _OP_CREATE:
+            balances.setdefault(number, 0)
+        elif op == _OP_REMOVE:
+            balances.pop(number, None)
+        elif number in balances:
+            if op == _OP_DEPOSIT:
+                balances[number] += amount
+            elif op == _OP_WITHDRAW:
+                balances[number] -= amount
+
+    @staticmethod
+    def _frame(op: int, number: int, amount: int) -> bytes:
+        """
+        Encode a record with its length and checksum.
+        """
+        payload = _RECORD.pack(op, number, amount)
+        return _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+
+    def _recover(self) -> None:
+        """
+        Rebuild the state from the snapshot and journal and open the journal.
+        Caller holds the lock.
+        """
+        balances: Dict[int, int] = {}
+        generation = 0
+        if os.path.exists(self.file_path):
+            with open(self.file_path, "r") as f:
+                snapshot = json.load(f)
+            # A plain JsonDataStore file can serve as the first snapshot
+            accounts = snapshot["accounts"] if "generation" in snapshot else snapshot
+            generation = snapshot.get("generation", 0)
+            for account_data in accounts.values():
+                balances[int(account_data["number"])] = account_data.get("balance", 0)
+
+        records = 0
+        valid_end = 0
+        journal_generation = None
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, "rb") as f:
+                content = f.read()
+            offset = 0
+            replayed: List[Tuple[int, int, int]] = []
+            while offset + _FRAME.size <= len(content):
+                length, checksum = _FRAME.unpack_from(content, offset)
+                start = offset + _FRAME.size
+                payload = content[start:start + length]
+                if length != _RECORD.size or len(payload) != length or zlib.crc32(payload) != checksum:
+                    break
+                op, number, amount = _RECORD.unpack(payload)
+                offset = start + length
+                if journal_generation is None:
+                    if op != _OP_GENERATION:
+                        break
+                    journal_generation = amount
+                else:
+                    replayed.append((op, number, amount))
+                valid_end = offset
+
+            if journal_generation == generation:
+                for record in replayed:
+                    self._apply(balances, *record)
+                records = len(replayed)
+            else:
+                # Stale journal from before the snapshot, or no valid header
+                valid_end = 0
+
+        self._balances = balances
+        self._generation = generation
+        self._records = records
+        self._open_journal(valid_end)
+
+    def _open_journal(self, valid_end: int) -> None:
+        """
+        Open the journal for appending, cutting it at `valid_end` and writing
+        the generation header if it is empty. Caller holds the lock.
+        """
+        if self._journal is not None:
+            self._journal.close()
+        directory = os.path.dirname(self.journal_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        mode = "r+b" if os.path.exists(self.journal_path) else "w+b"
+        # Unbuffered, so a failed write leaves nothing behind in a buffer
+        self._journal = open(self.journal_path, mode, buffering=0)
+        self._journal.truncate(valid_end)
+        self._journal.seek(valid_end)
+        if valid_end == 0:
+            self._write(self._frame(_OP_GENERATION, 0, self._generation))
+
+    def _snapshot(self) -> None:
+        """
+        Write the current state as the next generation's snapshot, then start
+        an empty journal for that generation. Caller holds the lock.
+        """
+        generation = self._generation + 1
+        snapshot = {
+            "generation": generation,
+            "accounts": {
+                str(number): {"number": number, "balance": balance}
+                for number, balance in self._balances.items()
+            },
+        }
+        directory = os.path.dirname(self.file_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        temp_path = self.file_path + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump(snapshot, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.file_path)
+
+        self._generation = generation
+        self._records = 0
+        self._snapshot_due = False
+        self._open_journal(0)
@@ -1,52 +1,101 @@
 import sqlite3
 import json
-from typing import Dict, Any
+import threading
+from typing import Dict, Any, List, Optional, Tuple
 from bank_node.persistence.i_data_store import IDataStore
 
 class SqliteDataStore(IDataStore):
     """
     Implementation of IDataStore using SQLite for persistence.
+
+    Keeps one connection open in WAL mode for the lifetime of the store.
+    Besides full saves it supports incremental saves (`save_changes`), which
+    upsert and delete only the changed rows in a single transaction.
+
+    The account count and total capital are kept in a one-row 'bank_stats'
+    table maintained by triggers, and single accounts can be read on demand,
+    which lets `LazyAccountRepository` work without loading every account.
     """
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, synchronous: str = "NORMAL"):
         """
         Initialize the SqliteDataStore with a database path.
 
-        Automatically initializes the database schema if it doesn't exist.
+        Opens the connection and initializes the database schema if it doesn't exist.
 
         Args:
             db_path (str): The file path to the SQLite database.
-        
+            synchronous (str): SQLite `synchronous` setting ("OFF", "NORMAL",
+                "FULL" or "EXTRA"). With WAL, "NORMAL" only syncs at
+                checkpoints: a power loss may lose the latest commits but
+                never corrupts the database. Defaults to "NORMAL".
+
+        Raises:
+            ValueError: If `synchronous` is not a valid setting.
+            sqlite3.Error: If the database cannot be opened or initialized.
+
         Side Effects:
             - Creates a new SQLite database file if one doesn't exist.
+            - Switches the database to WAL journal mode.
             - Calls `_initialize_db` to set up tables.
         """
+        synchronous = synchronous.upper()
+        if synchronous not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+            raise ValueError(f"Invalid SQLite synchronous setting: {synchronous}")
         self.db_path = db_path
+        self.synchronous = synchronous
+        self._lock = threading.Lock()
+
+        # Autocommit mode; transactions are started explicitly
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row  # Access columns by name
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={synchronous}")
         self._initialize_db()
 
     def _initialize_db(self):
         """
         Creates the necessary tables if they don't exist.
 
-        Sets up the 'accounts' table with columns for account_id, balance, and history.
+        Sets up the 'accounts' table with columns for account_id, balance, and history,
+        and the 'bank_stats' aggregates with the triggers keeping them current.
 
         Raises:
             sqlite3.Error: If the table creation fails.
-            
+
         Side Effects:
             - Modifies the database schema.
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS accounts (
-                    account_id TEXT PRIMARY KEY,
-                    balance INTEGER NOT NULL,
-                    history TEXT
-                )
-            """)
-            conn.commit()
-            conn.close()
+            with self._lock:
+                self._conn.executescript("""
+                    BEGIN;
+                    CREATE TABLE IF NOT EXISTS accounts (
+                        account_id TEXT PRIMARY KEY,
+                        balance INTEGER NOT NULL,
+                        history TEXT
+                    );
+                    CREATE TABLE IF NOT EXISTS bank_stats (
+                        id INTEGER PRIMARY KEY CHECK (id = 0),
+                        account_count INTEGER NOT NULL,
+                        total_capital INTEGER NOT NULL
+                    );
+                    -- Computed once for databases created before the triggers
+                    INSERT OR IGNORE INTO bank_stats
+                        SELECT 0, COUNT(*), COALESCE(SUM(balance), 0) FROM accounts;
+                    CREATE TRIGGER IF NOT EXISTS accounts_stats_insert AFTER INSERT ON accounts BEGIN
+                        UPDATE bank_stats SET account_count = account_count + 1,
+                            total_capital = total_capital + NEW.balance WHERE id = 0;
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS accounts_stats_update AFTER UPDATE OF balance ON accounts BEGIN
+                        UPDATE bank_stats SET total_capital = total_capital + NEW.balance - OLD.balance
+                            WHERE id = 0;
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS accounts_stats_delete AFTER DELETE ON accounts BEGIN
+                        UPDATE bank_stats SET account_count = account_count - 1,
+                            total_capital = total_capital - OLD.balance WHERE id = 0;
+                    END;
+                    COMMIT;
+                """)
         except sqlite3.Error as e:
             print(f"Error initializing database {self.db_path}: {e}")
             raise e
@@ -65,45 +114,64 @@ class SqliteDataStore(IDataStore):
                 Expected structure: {account_id: account_dict}
 
         Raises:
+            ValueError: If a balance does not fit an SQLite INTEGER.
             sqlite3.Error: If the database operations fail.
-            
+
         Side Effects:
             - Deletes all rows in the 'accounts' table.
             - Inserts new rows for the current data.
             - Commits the transaction to disk.
         """
-        # Ensure tables exist (per requirements)
-        self._initialize_db()
-        
-        accounts = data
-        
+        rows = [self._account_row(acc_id, acc_data) for acc_id, acc_data in data.items()]
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Use a transaction
-            cursor.execute("BEGIN TRANSACTION")
-            
-            # Clear existing data to reflect current state (including deletions)
-            cursor.execute("DELETE FROM accounts")
-            
-            # Insert current accounts
-            for acc_id, acc_data in accounts.items():
-                balance = acc_data.get('balance', 0)
-                # Serialize history to JSON string
-                history = json.dumps(acc_data.get('history', []))
-                
-                cursor.execute(
-                    "INSERT INTO accounts (account_id, balance, history) VALUES (?, ?, ?)",
-                    (acc_id, balance, history)
+            with self._lock:
+                self._run_transaction(
+                    ("DELETE FROM accounts", None),
+                    ("INSERT INTO accounts (account_id, balance, history) VALUES (?, ?, ?)", rows)
                 )
-            
-            conn.commit()
-            conn.close()
         except sqlite3.Error as e:
             print(f"Error saving data to {self.db_path}: {e}")
             raise e
 
+    def save_changes(self, changed: Dict[str, Any], removed: List[str]) -> bool:
+        """
+        Saves only the changed and removed accounts to SQLite.
+
+        Changed accounts are written with one `executemany` UPSERT and removed
+        ones with one `executemany` DELETE, in a single transaction, so the
+        cost depends on the number of changed rows only.
+
+        Args:
+            changed (Dict[str, Any]): {account_id: account_dict} of added or
+                modified accounts.
+            removed (List[str]): The account_ids of removed accounts.
+
+        Returns:
+            bool: Always True.
+
+        Raises:
+            ValueError: If a balance does not fit an SQLite INTEGER.
+            sqlite3.Error: If the database operations fail.
+
+        Side Effects:
+            - Inserts, updates and deletes rows in the 'accounts' table.
+            - Commits the transaction.
+        """
+        if not changed and not removed:
+            return True
+        rows = [self._account_row(acc_id, acc_data) for acc_id, acc_data in changed.items()]
+        try:
+            with self._lock:
+                self._run_transaction(
+                    ("INSERT INTO accounts (account_id, balance, history) VALUES (?, ?, ?) "
+                     "ON CONFLICT(account_id) DO UPDATE SET balance = excluded.balance", rows),
+                    ("DELETE FROM accounts WHERE account_id = ?", [(acc_id,) for acc_id in removed])
+                )
+        except sqlite3.Error as e:
+            print(f"Error saving changes to {self.db_path}: {e}")
+            raise e
+        return True
+
     def load_data(self) -> Dict[str, Any]:
         """
         Loads the bank state from SQLite.
@@ -115,37 +183,26 @@ class SqliteDataStore(IDataStore):
         Returns:
             Dict[str, Any]: The loaded data.
                 Structure: {account_id: {'number': ..., 'balance': ..., 'history': ...}}
-                Returns an empty dictionary if the table does not exist.
+                Returns an empty dictionary if the table is empty.
 
         Raises:
             sqlite3.Error: If the database query fails.
-            
+
         Side Effects:
-            - Connects to the SQLite database.
             - executes SELECT queries.
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row  # Access columns by name
-            cursor = conn.cursor()
-            
-            # Check if table exists (in case file exists but empty or uninitialized)
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='accounts'")
-            if not cursor.fetchone():
-                conn.close()
-                return {}
-
-            cursor.execute("SELECT account_id, balance, history FROM accounts")
-            rows = cursor.fetchall()
-            
+            with self._lock:
+                rows = self._conn.execute("SELECT account_id, balance, history FROM accounts").fetchall()
+
             accounts = {}
             for row in rows:
                 acc_id = row['account_id']
                 try:
                     history = json.loads(row['history'])
-                except json.JSONDecodeError:
+                except (json.JSONDecodeError, TypeError):
                     history = []
-                
+
                 # Ensure the structure matches what BankAccount.from_dict expects
                 # BankAccount.from_dict expects 'number' and 'balance'
                 accounts[acc_id] = {
@@ -153,10 +210,119 @@ class SqliteDataStore(IDataStore):
                     'balance': row['balance'],
                     'history': history
                 }
-            
-            conn.close()
+
             return accounts
-            
+
         except sqlite3.Error as e:
             print(f"Error loading data from {self.db_path}: {e}")
             raise e
+
+    def load_account(self, account_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Loads a single account by its primary key.
+
+        Args:
+            account_id (str): The account number as stored.
+
+        Returns:
+            Optional[Dict[str, Any]]: {'number': ..., 'balance': ...}, or None
+            if there is no such account.
+
+        Raises:
+            sqlite3.Error: If the query fails.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT account_id, balance FROM accounts WHERE account_id = ?", (account_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {'number': int(row['account_id']), 'balance': row['balance']}
+
+    def load_account_ids(self) -> List[int]:
+        """
+        Loads the numbers of all stored accounts, without their data.
+
+        Returns:
+            List[int]: The account numbers.
+
+        Raises:
+            sqlite3.Error: If the query fails.
+        """
+        with self._lock:
+            # Plain tuples: sqlite3.Row is slow for a full column scan
+            cursor = self._conn.cursor()
+            cursor.row_factory = None
+            rows = cursor.execute("SELECT CAST(account_id AS INTEGER) FROM accounts "
+                                  "WHERE account_id GLOB '[0-9]*'").fetchall()
+        return [row[0] for row in rows]
+
+    def load_aggregates(self) -> Tuple[int, int]:
+        """
+        Returns the stored account count and total capital in O(1).
+
+        Returns:
+            Tuple[int, int]: (account_count, total_capital) of the saved state.
+
+        Raises:
+            sqlite3.Error: If the query fails.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT account_count, total_capital FROM bank_stats WHERE id = 0"
+            ).fetchone()
+        return row['account_count'], row['total_capital']
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+
+        Side Effects:
+            Checkpoints the WAL into the database file.
+        """
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _account_row(acc_id: str, acc_data: Dict[str, Any]) -> Tuple[str, int, str]:
+        """
+        Build the (account_id, balance, history) row of an account.
+
+        Raises:
+            ValueError: If the balance is outside the signed 64-bit range of
+                an SQLite INTEGER.
+        """
+        balance = acc_data.get('balance', 0)
+        if not -2 ** 63 <= balance < 2 ** 63:
+            raise ValueError(f"Balance of account {acc_id} does not fit an SQLite INTEGER")
+        # Serialize history to JSON string
+        return acc_id, balance, json.dumps(acc_data.get('history', []))
+
+    def _run_transaction(self, *statements) -> None:
+        """
+        Run statements in one transaction, rolling back on any failure, so
+        the long-lived connection is never left inside a transaction.
+        Caller holds the lock.
+
+        Args:
+            *statements: (sql, rows) pairs; rows None runs the statement once,
+                otherwise it is run with `executemany`.
+
+        Raises:
+            sqlite3.Error: If a statement fails.
+            Exception: Anything else raised while binding the rows (e.g.
+                OverflowError), after the rollback.
+        """
+        cursor = self._conn.cursor()
+        cursor.execute("BEGIN")
+        try:
+            for sql, rows in statements:
+                if rows is None:
+                    cursor.execute(sql)
+                elif rows:
+                    cursor.executemany(sql, rows)
+            cursor.execute("COMMIT")
+        except BaseException:
+            if self._conn.in_transaction:
+                cursor.execute("ROLLBACK")
+            raise
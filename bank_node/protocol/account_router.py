@@ -0,0 +1,163 @@
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Dict, Any
+from bank_node.core.config_manager import ConfigManager
+from bank_node.protocol.validator import Validator
+from bank_node.utils.ip_helper import is_local_ip, local_table_version
+
+class AccountRoute(NamedTuple):
+    """
+    Immutable routing decision for an account address `<number>/<ip>[:port]`.
+    """
+    account_number: int
+    host: str
+    port: int
+    is_local: bool
+
+class AccountRouter:
+    """
+    Parses account addresses into `AccountRoute`s and memoizes them.
+
+    Used by the AD, AW, AB and AR commands so an address is parsed, validated
+    and checked for locality once; repeated requests for the same account are
+    answered from a bounded LRU cache. The cache is dropped whenever the local
+    address table in `ip_helper` changes.
+    """
+
+    def __init__(self, local_port: int, cache_size: int = 4096):
+        """
+        Initialize the AccountRouter.
+
+        Args:
+            local_port (int): The port this node listens on; also the default
+                port for addresses that do not specify one.
+            cache_size (int): Maximum number of memoized routes. Defaults to 4096.
+        """
+        self.local_port = local_port
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, AccountRoute]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._table_version = local_table_version()
+
+    def resolve(self, account_address: str) -> AccountRoute:
+        """
+        Return the route for an account address, parsing it on a cache miss.
+
+        Args:
+            account_address (str): The address in the format `<number>/<ip>[:port]`.
+
+        Returns:
+            AccountRoute: The parsed account number, target host and port, and
+            whether the account is held by this node.
+
+        Raises:
+            ValueError: If the address format, account number, IP or port is invalid.
+        """
+        version = local_table_version()
+        with self._lock:
+            if version != self._table_version:
+                self._cache.clear()
+                self._table_version = version
+            route = self._cache.get(account_address)
+            if route is not None:
+                self._cache.move_to_end(account_address)
+                self._hits += 1
+                return route
+            self._misses += 1
+
+        route = self._parse(account_address)
+
+        with self._lock:
+            self._cache[account_address] = route
+            self._cache.move_to_end(account_address)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return route
+
+    def _parse(self, account_address: str) -> AccountRoute:
+        """
+        Parse and validate an account address without consulting the cache.
+
+        Args:
+            account_address (str): The address in the format `<number>/<ip>[:port]`.
+
+        Returns:
+            AccountRoute: The routing decision for the address.
+
+        Raises:
+            ValueError: If any part of the address is invalid.
+        """
+        parts = account_address.split("/")
+        if len(parts) != 2:
+            raise ValueError("Invalid account_id format. Expected: <number>/<ip>")
+
+        account_num_str, ip_address = parts
+
+        # Validate Account Number
+        if not account_num_str.isdigit():
+            raise ValueError("Account number must be an integer")
+
+        account_num = int(account_num_str)
+        if not Validator.validate_account_number(account_num):
+            raise ValueError("Invalid account number")
+
+        # Validate IP (handle port if present)
+        host, _, port_str = ip_address.partition(":")
+        if not Validator.validate_ip(host):
+            raise ValueError("Invalid IP address")
+
+        port = self.local_port
+        if port_str:
+            if not port_str.isdigit() or not 0 < int(port_str) <= 65535:
+                raise ValueError("Invalid port")
+            port = int(port_str)
+
+        is_local = port == self.local_port and is_local_ip(host)
+        return AccountRoute(account_num, host, port, is_local)
+
+    def clear(self) -> None:
+        """
+        Drop all memoized routes, e.g. after the local interfaces changed.
+
+        Side Effects:
+            Empties the route cache.
+        """
+        with self._lock:
+            self._cache.clear()
+
+    def cache_info(self) -> Dict[str, Any]:
+        """
+        Return cache statistics.
+
+        Returns:
+            Dict[str, Any]: Hit and miss counts, current size and capacity.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._cache),
+                "capacity": self.cache_size,
+            }
+
+_router_lock = threading.Lock()
+_shared_router: Optional[AccountRouter] = None
+
+def get_account_router() -> AccountRouter:
+    """
+    Return the process-wide AccountRouter configured from `config.json`.
+
+    Returns:
+        AccountRouter: The shared router instance.
+    """
+    global _shared_router
+    if _shared_router is None:
+        with _router_lock:
+            if _shared_router is None:
+                config = ConfigManager()
+                local_port = config.get("server", {}).get("port", 65525)
+                cache_size = config.get("network", {}).get("route_cache_size", 4096)
+                _shared_router = AccountRouter(local_port, cache_size)
+    return _shared_router
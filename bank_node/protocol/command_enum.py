@@ -24,4 +24,7 @@ class CommandType(Enum):
         Returns:
             bool: True if the command is in the Enum values, False otherwise.
         """
-        return any(command == item.value for item in CommandType)
+        return command in COMMAND_CODES
+
+# Frozen set of all command codes for O(1) validation
+COMMAND_CODES = frozenset(item.value for item in CommandType)
@@ -1,4 +1,5 @@
-from typing import List, Optional, Type, Dict
+from types import MappingProxyType
+from typing import List, Optional, Type, Dict, Mapping
 from bank_node.core.bank import Bank
 from bank_node.protocol.commands.base_command import BaseCommand
 from bank_node.protocol.command_enum import CommandType
@@ -6,6 +7,10 @@ from bank_node.protocol.command_enum import CommandType
 class CommandFactory:
     """
     Factory class to instantiate the correct Command object based on the input string.
+
+    Once all commands are registered the factory can be frozen: the code to
+    class mapping becomes read-only and stateless commands are pre-built so a
+    single instance is shared by every request and thread.
     """
 
     def __init__(self, bank: Bank):
@@ -17,7 +22,10 @@ class CommandFactory:
         """
         self.bank = bank
         # Mapping from command code string to Command class type
-        self._command_map: Dict[str, Type[BaseCommand]] = {}
+        self._command_map: Mapping[str, Type[BaseCommand]] = {}
+        # Shared instances of stateless commands, built by freeze()
+        self._shared_commands: Mapping[str, BaseCommand] = MappingProxyType({})
+        self._frozen = False
 
     def register_command(self, command_code: str, command_class: Type[BaseCommand]) -> None:
         """
@@ -27,11 +35,37 @@ class CommandFactory:
             command_code (str): The 2-letter command code (e.g., 'BC').
             command_class (Type[BaseCommand]): The class implementing the command.
 
+        Raises:
+            ValueError: If the command code is not a known protocol command.
+            RuntimeError: If the factory has already been frozen.
+
         Side Effects:
             Updates the internal `_command_map`.
         """
+        if self._frozen:
+            raise RuntimeError("Cannot register commands on a frozen CommandFactory.")
+        if not CommandType.is_valid(command_code):
+            raise ValueError(f"Unknown command code: {command_code}")
         self._command_map[command_code] = command_class
 
+    def freeze(self) -> None:
+        """
+        Make the dispatch table immutable and pre-build stateless commands.
+
+        Side Effects:
+            - Replaces `_command_map` with a read-only view.
+            - Instantiates one shared object per stateless command class.
+        """
+        if self._frozen:
+            return
+        self._command_map = MappingProxyType(dict(self._command_map))
+        self._shared_commands = MappingProxyType({
+            code: command_class(self.bank, [])
+            for code, command_class in self._command_map.items()
+            if command_class.stateless
+        })
+        self._frozen = True
+
     def get_command(self, command_code: str, args: List[str]) -> Optional[BaseCommand]:
         """
         Create and return an instance of the specific command class.
@@ -42,12 +76,15 @@ class CommandFactory:
 
         Returns:
             Optional[BaseCommand]: An instance of the command, or None if the code is invalid/unknown.
+                Argument-less calls of stateless commands return the shared instance.
         """
-        if not CommandType.is_valid(command_code):
-            return None
-
+        # Only valid, registered codes are in the map: one lookup validates and dispatches
         command_class = self._command_map.get(command_code)
         if command_class:
+            if not args:
+                shared = self._shared_commands.get(command_code)
+                if shared is not None:
+                    return shared
             return command_class(self.bank, args)
         
         return None
@@ -10,6 +10,8 @@ class ACCommand(BaseCommand):
     combined with the server's IP address.
     """
 
+    stateless = True
+
     def validate_args(self) -> None:
         """
         Validate the arguments.
@@ -30,6 +32,9 @@ class ACCommand(BaseCommand):
         Returns:
             str: The formatted response string.
 
+        Raises:
+            ValueError: If no account number is left ("Bank full").
+
         Side Effects:
             - Modifies Bank state by creating a new account.
             - Reads from configuration.
@@ -48,3 +53,18 @@ class ACCommand(BaseCommand):
             ip_address = "127.0.0.1"
             
         return f"AC {account_number}/{ip_address}"
+
+    def format_error(self, message: str) -> str:
+        """
+        Format an error response for the AC command.
+
+        Overrides the base method so a full bank is reported as the protocol's
+        "ER <message>" (e.g. "ER Bank full").
+
+        Args:
+            message (str): The error message.
+
+        Returns:
+            str: The formatted error string "ER <message>".
+        """
+        return f"ER {message}"
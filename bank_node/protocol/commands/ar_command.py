@@ -1,8 +1,7 @@
-from typing import Any
+from typing import Any, Optional
 from bank_node.protocol.commands.base_command import BaseCommand
-from bank_node.protocol.validator import Validator
-from bank_node.utils.ip_helper import is_local_ip
-from bank_node.network.proxy_client import ProxyClient
+from bank_node.protocol.account_router import get_account_router
+from bank_node.network.proxy_client import ProxyRequest
 
 class ARCommand(BaseCommand):
     """
@@ -17,7 +16,7 @@ class ARCommand(BaseCommand):
         Validate the arguments for the AR command.
 
         Expects exactly 1 argument:
-        1. `account_id` in the format `<number>/<ip>`.
+        1. `account_id` in the format `<number>/<ip>[:port]`.
 
         Raises:
             ValueError: If argument count is wrong, format is invalid, or values are out of range.
@@ -25,29 +24,8 @@ class ARCommand(BaseCommand):
         if len(self.args) != 1:
             raise ValueError("Invalid arguments count. Usage: AR <account_id>")
         
-        account_id = self.args[0]
-        
-        # Parse account_id
-        if "/" not in account_id:
-            raise ValueError("Invalid account_id format. Expected: <number>/<ip>")
-        
-        parts = account_id.split("/")
-        if len(parts) != 2:
-            raise ValueError("Invalid account_id format. Expected: <number>/<ip>")
-            
-        account_num_str, ip_address = parts
-        
-        # Validate Account Number
-        if not account_num_str.isdigit():
-             raise ValueError("Account number must be an integer")
-        
-        account_num = int(account_num_str)
-        if not Validator.validate_account_number(account_num):
-             raise ValueError("Invalid account number")
-             
-        # Validate IP
-        if not Validator.validate_ip(ip_address):
-            raise ValueError("Invalid IP address")
+        # Parse and route account_id (<number>/<ip>[:port])
+        self.route = get_account_router().resolve(self.args[0])
 
     def execute_logic(self) -> Any:
         """
@@ -66,30 +44,47 @@ class ARCommand(BaseCommand):
             - Removes account from persistence (local).
             - Initiates network connection (remote).
         """
-        account_id = self.args[0]
-        account_num = int(account_id.split("/")[0])
-        ip_address = account_id.split("/")[1]
+        route = self.route
         
-        if is_local_ip(ip_address):
+        if route.is_local:
             try:
                 # We use the bank's remove_account method which handles balance check safely
-                self.bank.remove_account(account_num)
+                self.bank.remove_account(route.account_number)
                 return "AR"
             except ValueError as e:
                 # Re-raise to be handled by BaseCommand
                 raise ValueError(str(e))
         else:
-            # Forward to remote bank
-            try:
-                client = ProxyClient()
-                # We send the same command "AR <account_id>" to the remote
-                # The remote will parse it, see the IP is local to itself, and execute.
-                # Assuming default port 65525 as we don't have port info in AR command
-                # Ideally we should look up port from known peers, but standard is 65525
-                response = client.send_command(ip_address, 65525, f"AR {account_id}")
-                
-                if response.startswith("ER"):
-                    raise ValueError(response[3:]) # Strip "ER "
-                return response
-            except Exception as e:
-                 raise ValueError(f"Remote execution failed: {str(e)}")
+            # Forward to remote bank; an ER reply is raised by `proxy_response`
+            return self.forward()
+
+    def proxy_request(self) -> Optional[ProxyRequest]:
+        """
+        Describe the forward of a remote account's removal.
+
+        Returns:
+            Optional[ProxyRequest]: The AR command for the remote node, or
+            None if the account is local.
+        """
+        route = self.route
+        if route.is_local:
+            return None
+        # The remote will parse it, see the IP is local to itself, and execute.
+        return ProxyRequest(route.host, route.port, f"AR {route.account_number}/{route.host}")
+
+    def proxy_response(self, response: str) -> Any:
+        """
+        Treat an `ER` reply from the remote node as a failed removal.
+
+        Args:
+            response (str): The peer's response.
+
+        Returns:
+            Any: The response on success.
+
+        Raises:
+            ValueError: If the remote node answered with an error.
+        """
+        if response.startswith("ER"):
+            raise ValueError(f"Remote execution failed: {response[3:]}") # Strip "ER "
+        return response
@@ -1,9 +1,8 @@
-from typing import Any
+from typing import Any, Optional
 from bank_node.protocol.commands.base_command import BaseCommand
-from bank_node.protocol.validator import Validator
-from bank_node.utils.ip_helper import is_local_ip
-from bank_node.network.proxy_client import ProxyClient
-from bank_node.core.config_manager import ConfigManager
+from bank_node.core.bank_account import MAX_BALANCE
+from bank_node.protocol.account_router import get_account_router
+from bank_node.network.proxy_client import ProxyRequest
 
 class AWCommand(BaseCommand):
     """
@@ -19,7 +18,7 @@ class AWCommand(BaseCommand):
 
         Expects exactly 2 arguments:
         1. `account_id` in the format `<number>/<ip>` (e.g., "12345/192.168.1.1").
-        2. `amount` as a positive integer.
+        2. `amount` as a positive integer of at most `MAX_BALANCE`.
 
         Raises:
             ValueError: If argument count is wrong, formats are invalid, or values are out of range.
@@ -27,31 +26,10 @@ class AWCommand(BaseCommand):
         if len(self.args) != 2:
             raise ValueError("Invalid arguments count. Usage: AW <account_id> <amount>")
         
-        account_id = self.args[0]
         amount_str = self.args[1]
         
-        # Parse account_id
-        if "/" not in account_id:
-            raise ValueError("Invalid account_id format. Expected: <number>/<ip>")
-        
-        parts = account_id.split("/")
-        if len(parts) != 2:
-            raise ValueError("Invalid account_id format. Expected: <number>/<ip>")
-            
-        account_num_str, ip_address = parts
-        
-        # Validate Account Number
-        if not account_num_str.isdigit():
-             raise ValueError("Account number must be an integer")
-        
-        account_num = int(account_num_str)
-        if not Validator.validate_account_number(account_num):
-             raise ValueError("Invalid account number")
-             
-        # Validate IP (handle port if present)
-        ip_to_validate = ip_address.split(":")[0] if ":" in ip_address else ip_address
-        if not Validator.validate_ip(ip_to_validate):
-            raise ValueError("Invalid IP address")
+        # Parse and route account_id (<number>/<ip>[:port])
+        self.route = get_account_router().resolve(self.args[0])
             
         # Foreign IP check removed to support Proxying
 
@@ -63,6 +41,8 @@ class AWCommand(BaseCommand):
             
         if amount <= 0:
             raise ValueError("Amount must be positive")
+        if amount > MAX_BALANCE:
+            raise ValueError("Amount is too large")
 
     def execute_logic(self) -> Any:
         """
@@ -81,41 +61,14 @@ class AWCommand(BaseCommand):
             - Modifies account balance (local).
             - Initiates network connection (remote).
         """
-        account_id = self.args[0]
+        route = self.route
         amount = int(self.args[1])
-        parts = account_id.split("/")
-        account_num = int(parts[0])
-        target_ip_full = parts[1]
-        
-        target_ip = target_ip_full
-        port = self.bank.config_manager.get("server", {}).get("port", 65525)
-        provided_port = None
-
-        if ":" in target_ip:
-            target_ip, port_str = target_ip.split(":")
-            try:
-                provided_port = int(port_str)
-                port = provided_port
-            except ValueError:
-                pass
-        
-        # Check if local
-        is_local = is_local_ip(target_ip)
-        if is_local and provided_port is not None:
-             local_port = self.bank.config_manager.get("server", {}).get("port", 65525)
-             if provided_port != local_port:
-                 is_local = False
-
-        if not is_local:
-            clean_account_id = f"{account_num}/{target_ip}"
-            command_string = f"AW {clean_account_id} {amount}"
-            config = ConfigManager()
-            proxy_timeout = config.get("network", {}).get("proxy_timeout", 5.0)
-            proxy = ProxyClient(timeout=proxy_timeout)
-            return proxy.send_command(target_ip, port, command_string)
+
+        if not route.is_local:
+            return self.forward()
         
         try:
-            self.bank.withdraw(account_num, amount)
+            self.bank.withdraw(route.account_number, amount)
             return "AW"
         except ValueError as e:
             # If the bank raises ValueError (e.g. insufficient funds), we catch it
@@ -127,6 +80,20 @@ class AWCommand(BaseCommand):
             # I should check BaseCommand.format_error.
             raise ValueError(str(e))
 
+    def proxy_request(self) -> Optional[ProxyRequest]:
+        """
+        Describe the forward of a withdrawal from a remote account.
+
+        Returns:
+            Optional[ProxyRequest]: The AW command for the remote node, or
+            None if the account is local.
+        """
+        route = self.route
+        if route.is_local:
+            return None
+        return ProxyRequest(route.host, route.port,
+                            f"AW {route.account_number}/{route.host} {int(self.args[1])}")
+
     def format_error(self, message: str) -> str:
         """
         Format an error response for the AW command.
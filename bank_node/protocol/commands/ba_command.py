@@ -9,6 +9,8 @@ class BACommand(BaseCommand):
     across all accounts.
     """
 
+    stateless = True
+
     def validate_args(self) -> None:
         """
         Validate the arguments for the BA command.
@@ -1,6 +1,10 @@
+import time
 from abc import ABC, abstractmethod
-from typing import List, Any
+from typing import List, Any, Optional
 from bank_node.core.bank import Bank
+from bank_node.core.config_manager import ConfigManager
+from bank_node.network.proxy_client import ProxyClient, ProxyRequest
+from bank_node.protocol.deadline import set_current_deadline, reset_current_deadline
 
 class BaseCommand(ABC):
     """
@@ -10,6 +14,10 @@ class BaseCommand(ABC):
     standard lifecycle methods for validation, execution, and response formatting.
     """
 
+    # True if an argument-less instance keeps no per-request state and may be
+    # shared between requests and threads (see CommandFactory.freeze).
+    stateless = False
+
     def __init__(self, bank: Bank, args: List[str]):
         """
         Initialize the command with a Bank instance and arguments.
@@ -44,21 +52,30 @@ class BaseCommand(ABC):
         """
         pass
 
-    def execute(self) -> str:
+    def execute(self, deadline: Optional[float] = None) -> str:
         """
         Execute the command following the standard lifecycle.
 
         Steps:
         1. Validate arguments (`validate_args`).
-        2. Execute business logic (`execute_logic`).
-        3. Format success response (`format_success`).
-        4. Catch and format errors (`format_error`).
+        2. Refuse the command if its deadline has already passed.
+        3. Execute business logic (`execute_logic`) with the deadline set as
+           the current one, so forwarded commands inherit the remaining budget.
+        4. Format success response (`format_success`).
+        5. Catch and format errors (`format_error`).
+
+        Args:
+            deadline (Optional[float]): Absolute `time.monotonic()` deadline of
+                the request, or None if it has none.
 
         Returns:
             str: The final response string to be sent to the client.
         """
+        token = set_current_deadline(deadline)
         try:
             self.validate_args()
+            if deadline is not None and time.monotonic() >= deadline:
+                return self.format_error("Deadline exceeded")
             result = self.execute_logic()
             return self.format_success(result)
         except ValueError as e:
@@ -66,6 +83,84 @@ class BaseCommand(ABC):
         except Exception as e:
             # In a real app, log the exception here
             return self.format_error("Internal error")
+        finally:
+            reset_current_deadline(token)
+
+    async def execute_async(self, deadline: Optional[float] = None) -> Optional[str]:
+        """
+        Execute a forwarded command on an event loop without blocking it.
+
+        Follows the lifecycle of `execute`, but the forward returned by
+        `proxy_request` is awaited through `ProxyClient.send_command_async`.
+
+        Args:
+            deadline (Optional[float]): Absolute `time.monotonic()` deadline of
+                the request, or None if it has none.
+
+        Returns:
+            Optional[str]: The final response string, or None if the command
+            is not forwarded and must be run with `execute` instead.
+        """
+        token = set_current_deadline(deadline)
+        try:
+            self.validate_args()
+            if deadline is not None and time.monotonic() >= deadline:
+                return self.format_error("Deadline exceeded")
+            request = self.proxy_request()
+            if request is None:
+                return None
+            response = await self._proxy_client().send_command_async(
+                request.host, request.port, request.command_string, hedge=request.hedge)
+            return self.format_success(self.proxy_response(response))
+        except ValueError as e:
+            return self.format_error(str(e))
+        except Exception as e:
+            return self.format_error("Internal error")
+        finally:
+            reset_current_deadline(token)
+
+    def proxy_request(self) -> Optional[ProxyRequest]:
+        """
+        Describe the forward this command makes. Valid after `validate_args`.
+
+        Returns:
+            Optional[ProxyRequest]: The command to send to the node holding
+            the account, or None if the command runs locally.
+        """
+        return None
+
+    def proxy_response(self, response: str) -> Any:
+        """
+        Turn the reply to a forwarded command into this command's result.
+
+        Args:
+            response (str): The peer's response, or an `ER` message.
+
+        Returns:
+            Any: The result passed to `format_success`; the response itself by default.
+
+        Raises:
+            ValueError: If a subclass treats the response as a failure.
+        """
+        return response
+
+    def forward(self) -> Any:
+        """
+        Forward the command described by `proxy_request`, blocking until the peer answers.
+
+        Returns:
+            Any: The result of `proxy_response`.
+        """
+        request = self.proxy_request()
+        response = self._proxy_client().send_command(
+            request.host, request.port, request.command_string, hedge=request.hedge)
+        return self.proxy_response(response)
+
+    def _proxy_client(self) -> ProxyClient:
+        """
+        Create a ProxyClient with the configured proxy timeout.
+        """
+        return ProxyClient(timeout=ConfigManager().get("network", {}).get("proxy_timeout", 5.0))
 
     def format_success(self, data: Any = None) -> str:
         """
@@ -10,6 +10,8 @@ class BCCommand(BaseCommand):
     Retrieves and returns the bank's IP address.
     """
 
+    stateless = True
+
     def validate_args(self) -> None:
         """
         Validate the arguments.
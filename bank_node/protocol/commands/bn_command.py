@@ -8,6 +8,8 @@ class BNCommand(BaseCommand):
     Retrieves and returns the total number of clients (accounts) in the bank.
     """
 
+    stateless = True
+
     def validate_args(self) -> None:
         """
         Validate the arguments for the BN command.
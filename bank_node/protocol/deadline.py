@@ -0,0 +1,75 @@
+import re
+import time
+from contextvars import ContextVar, Token
+from typing import Optional, Tuple
+
+# A request deadline travels as a trailing CSI-style escape sequence,
+# "<command>\x1b[<milliseconds>!T". Nodes that predate deadlines strip it
+# with the rest of the ANSI escapes during Telnet cleaning, so they simply
+# ignore it.
+_DEADLINE_SUFFIX = re.compile(r"\x1b\[(\d{1,9})!T\s*$")
+
+_current_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+def split_deadline(message: str, now: Optional[float] = None) -> Tuple[str, Optional[float]]:
+    """
+    Remove a deadline suffix from a received line.
+
+    Args:
+        message (str): The received line, before Telnet cleaning.
+        now (Optional[float]): The monotonic receive time. Defaults to now.
+
+    Returns:
+        Tuple[str, Optional[float]]: The line without the suffix, and the
+        absolute `time.monotonic()` deadline, or None if none was sent.
+    """
+    if "\x1b" not in message:
+        return message, None
+    match = _DEADLINE_SUFFIX.search(message)
+    if match is None:
+        return message, None
+    if now is None:
+        now = time.monotonic()
+    return message[:match.start()], now + int(match.group(1)) / 1000.0
+
+def format_deadline(remaining: float) -> str:
+    """
+    Build the suffix carrying a remaining time budget to the next hop.
+
+    Args:
+        remaining (float): Remaining budget in seconds.
+
+    Returns:
+        str: The escape sequence to append to a forwarded command.
+    """
+    return f"\x1b[{max(0, int(remaining * 1000))}!T"
+
+def get_current_deadline() -> Optional[float]:
+    """
+    Return the deadline of the command executing in the current context.
+
+    Returns:
+        Optional[float]: The absolute `time.monotonic()` deadline, or None.
+    """
+    return _current_deadline.get()
+
+def set_current_deadline(deadline: Optional[float]) -> Token:
+    """
+    Set the deadline for the current context.
+
+    Args:
+        deadline (Optional[float]): The absolute `time.monotonic()` deadline.
+
+    Returns:
+        Token: Pass to `reset_current_deadline` to restore the previous value.
+    """
+    return _current_deadline.set(deadline)
+
+def reset_current_deadline(token: Token) -> None:
+    """
+    Restore the deadline that was current before `set_current_deadline`.
+
+    Args:
+        token (Token): The token returned by `set_current_deadline`.
+    """
+    _current_deadline.reset(token)
@@ -0,0 +1,276 @@
+import sys
+import os
+
+# Add project root to sys.path to ensure 'bank_node' package is resolvable
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import argparse
+import random
+import socket
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from bank_node.network.line_framer import LineFramer
+from bank_node.network.proxy_client import ProxyClient
+from bank_node.network.connection_pool import ConnectionPool
+from bank_node.network.circuit_breaker import PeerHealthRegistry
+from bank_node.network.latency_tracker import LatencyTracker
+from bank_node.network.response_cache import ResponseCache
+from bank_node.network.single_flight import SingleFlight
+from bank_node.network.bulkhead import Bulkhead
+from bank_node.network.async_proxy_transport import AsyncProxyTransport
+
+def expected_reply(account_number: int) -> str:
+    """
+    Return the reply the stand-in peer sends to `AB <account_number>/...`.
+
+    Every seventh account answers with a non-ASCII error, so multibyte UTF-8
+    characters get split across segments as well.
+
+    Args:
+        account_number (int): The account asked for.
+
+    Returns:
+        str: The reply line without its CRLF.
+    """
+    if account_number % 7 == 0:
+        return f"ER Účet {account_number} neexistuje"
+    return f"AB {account_number}"
+
+class FragmentingPeer:
+    """
+    Local stand-in for a peer bank node that answers AB requests with
+    deliberately awkward TCP writes.
+
+    All replies to the requests completed by one received chunk are joined
+    (coalesced) and then written in random pieces of 1 to `max_fragment`
+    bytes, with `TCP_NODELAY` set and short random pauses in between, so the
+    client sees replies split mid-line, mid-CRLF and mid-character, as well
+    as several replies in one segment.
+    """
+
+    def __init__(self, max_fragment: int = 3, max_pause: float = 0.0005, seed: Optional[int] = None):
+        """
+        Initialize the FragmentingPeer.
+
+        Args:
+            max_fragment (int): Largest piece written at once, in bytes.
+            max_pause (float): Longest pause between two pieces, in seconds.
+            seed (Optional[int]): Seed of the fragmentation, for reproducible runs.
+        """
+        self.max_fragment = max_fragment
+        self.max_pause = max_pause
+        self.seed = seed
+        self.port = 0
+        self._server: Optional[socket.socket] = None
+        self._running = False
+        self._lock = threading.Lock()
+        self._connections = 0
+        self._replies = 0
+        self._writes = 0
+
+    def start(self) -> int:
+        """
+        Start listening on an ephemeral localhost port.
+
+        Returns:
+            int: The port the peer listens on.
+        """
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind(("127.0.0.1", 0))
+        self._server.listen(128)
+        self.port = self._server.getsockname()[1]
+        self._running = True
+        threading.Thread(target=self._accept_loop, name="FragmentingPeer", daemon=True).start()
+        return self.port
+
+    def stop(self) -> None:
+        """
+        Stop accepting connections.
+        """
+        self._running = False
+        if self._server is not None:
+            self._server.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return peer statistics.
+
+        Returns:
+            Dict[str, Any]: Connections accepted, replies sent and separate writes made.
+        """
+        with self._lock:
+            return {"connections": self._connections, "replies": self._replies, "writes": self._writes}
+
+    def _accept_loop(self) -> None:
+        """
+        Accept connections and serve each on its own thread.
+        """
+        while self._running:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            with self._lock:
+                self._connections += 1
+                rng = random.Random(None if self.seed is None else self.seed + self._connections)
+            threading.Thread(target=self._serve, args=(conn, rng), daemon=True).start()
+
+    def _serve(self, conn: socket.socket, rng: random.Random) -> None:
+        """
+        Answer every request line on a connection until the client closes it.
+        """
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        framer = LineFramer()
+        try:
+            while True:
+                data = conn.recv(4096)
+                if not data:
+                    return
+                replies = []
+                for line in framer.feed(data):
+                    parts = (line or "").split()
+                    if len(parts) >= 2 and parts[0] == "AB":
+                        replies.append(expected_reply(int(parts[1].split("/")[0])))
+                    else:
+                        replies.append("ER Invalid command format")
+                if replies:
+                    with self._lock:
+                        self._replies += len(replies)
+                    self._write_fragmented(conn, "".join(r + "\r\n" for r in replies).encode("utf-8"), rng)
+        except OSError:
+            pass
+        finally:
+            conn.close()
+
+    def _write_fragmented(self, conn: socket.socket, payload: bytes, rng: random.Random) -> None:
+        """
+        Write a payload in random small pieces.
+        """
+        view = memoryview(payload)
+        writes = 0
+        while view:
+            size = rng.randint(1, self.max_fragment)
+            conn.sendall(view[:size])
+            view = view[size:]
+            writes += 1
+            if self.max_pause and rng.random() < 0.5:
+                time.sleep(rng.random() * self.max_pause)
+        with self._lock:
+            self._writes += writes
+
+def run_stress(transport: str, threads: int, requests: int, max_fragment: int,
+               seed: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Forward AB requests through `ProxyClient` to a `FragmentingPeer` from
+    several threads and check that every request gets exactly its own reply.
+
+    The client gets private pool, breaker, latency, cache, single-flight and
+    bulkhead instances, so the run is independent of `config.json`. Every
+    request asks for a different account, so nothing is served from the
+    cache or coalesced.
+
+    Args:
+        transport (str): "pool" for pooled blocking connections, "async" for
+            the pipelined `AsyncProxyTransport`.
+        threads (int): Number of concurrent client threads.
+        requests (int): Requests sent by each thread.
+        max_fragment (int): Largest piece the peer writes at once, in bytes.
+        seed (Optional[int]): Seed of the peer's fragmentation.
+
+    Returns:
+        Dict[str, Any]: Request, mismatch and error counts, the first
+        mismatches, elapsed time, throughput and peer statistics.
+    """
+    peer = FragmentingPeer(max_fragment=max_fragment, seed=seed)
+    port = peer.start()
+    async_transport = AsyncProxyTransport() if transport == "async" else None
+    pool = ConnectionPool(max_idle_per_peer=threads)
+    client = ProxyClient(timeout=10.0, pool=pool, peer_health=PeerHealthRegistry(),
+                         latency=LatencyTracker(), cache=ResponseCache({}),
+                         single_flight=SingleFlight(), transport=async_transport,
+                         bulkhead=Bulkhead("stress", threads))
+    # Ignore `network.proxy_transport`: the transport under test is chosen here
+    client.transport = async_transport
+
+    lock = threading.Lock()
+    mismatches: List[Tuple[str, str]] = []
+    counts = {"ok": 0, "mismatched": 0, "errors": 0}
+
+    def worker(index: int) -> None:
+        for i in range(requests):
+            account_number = 10000 + (index * requests + i) % 90000
+            expected = expected_reply(account_number)
+            response = client.send_command("127.0.0.1", port, f"AB {account_number}/127.0.0.1")
+            with lock:
+                if response == expected:
+                    counts["ok"] += 1
+                else:
+                    # A reply meant for another request is a framing bug;
+                    # any other ER reply is a network error
+                    misframed = response.startswith("AB") or response.startswith("ER Účet")
+                    counts["mismatched" if misframed else "errors"] += 1
+                    if len(mismatches) < 5:
+                        mismatches.append((expected, response))
+
+    started = time.monotonic()
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.monotonic() - started
+
+    peer.stop()
+    pool.close_all()
+    if async_transport is not None:
+        async_transport.close()
+    total = threads * requests
+    return {
+        "transport": transport,
+        "requests": total,
+        "ok": counts["ok"],
+        "mismatched": counts["mismatched"],
+        "errors": counts["errors"],
+        "first_failures": mismatches,
+        "elapsed_s": round(elapsed, 3),
+        "requests_per_sec": round(total / max(elapsed, 1e-9), 1),
+        "peer": peer.stats(),
+    }
+
+def main() -> int:
+    """
+    Run the stress test from the command line.
+
+    Returns:
+        int: Process exit code, 0 if every request got its own reply.
+    """
+    parser = argparse.ArgumentParser(
+        description="Stress ProxyClient response framing against a local peer that fragments its writes.")
+    parser.add_argument("--transport", choices=["pool", "async", "both"], default="both",
+                        help="Proxy transport to test (default: both)")
+    parser.add_argument("--threads", type=int, default=8, help="Concurrent client threads (default: 8)")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per thread (default: 500)")
+    parser.add_argument("--max-fragment", type=int, default=3,
+                        help="Largest piece the peer writes at once, in bytes (default: 3)")
+    parser.add_argument("--seed", type=int, default=None, help="Seed of the fragmentation")
+    args = parser.parse_args()
+
+    transports = ["pool", "async"] if args.transport == "both" else [args.transport]
+    failed = False
+    for transport in transports:
+        result = run_stress(transport, args.threads, args.requests, args.max_fragment, args.seed)
+        print(f"[{transport}] {result['ok']}/{result['requests']} correct, "
+              f"{result['mismatched']} mismatched, {result['errors']} errors, "
+              f"{result['elapsed_s']}s ({result['requests_per_sec']} req/s), peer {result['peer']}")
+        for expected, response in result["first_failures"]:
+            print(f"    expected {expected!r}, got {response!r}")
+        failed = failed or result["ok"] != result["requests"]
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,46 +1,198 @@
 import socket
 import ipaddress
+import threading
+import time
+from typing import FrozenSet, Optional
 from bank_node.core.config_manager import ConfigManager
 
-def is_local_ip(ip_address: str) -> bool:
-    if not ip_address:
-        return False
-        
-    normalized_input = "127.0.0.1" if ip_address.lower() == "localhost" else ip_address
-    
-    if normalized_input == "127.0.0.1":
-        return True
-    
+# Cached table of addresses that belong to this node
+_local_lock = threading.Lock()
+# Serializes refreshes without blocking readers of the current table
+_refresh_lock = threading.Lock()
+_local_addresses: Optional[FrozenSet[str]] = None
+_primary_ip: Optional[str] = None
+_refreshed_at = 0.0
+_table_version = 0
+
+# Background thread that keeps the table current
+_refresher_lock = threading.Lock()
+_refresher: Optional[threading.Thread] = None
+_refresher_stop = threading.Event()
+
+def _probe_primary_ip() -> str:
+    """
+    Determine the address of the interface used for outbound traffic.
+
+    Returns:
+        str: The primary local IP, or the configured/loopback address on failure.
+
+    Side Effects:
+        - Opens a UDP socket (no packets are sent).
+        - Reads server configuration via ConfigManager.
+    """
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("8.8.8.8", 80))
+            return s.getsockname()[0]
+    except Exception:
+        config = ConfigManager()
+        server_config = config.get("server")
+        if server_config and "ip" in server_config and server_config["ip"] != "0.0.0.0":
+            return server_config["ip"]
+        return "127.0.0.1"
+
+def refresh_local_addresses() -> FrozenSet[str]:
+    """
+    Rebuild the cached table of local addresses.
+
+    The table contains the loopback address and the configured server IP.
+    When the server binds `0.0.0.0` it also contains every address the
+    hostname resolves to and the primary outbound address.
+
+    Returns:
+        FrozenSet[str]: The new set of local addresses.
+
+    Side Effects:
+        - Performs hostname resolution (may be slow on misconfigured DNS).
+        - Replaces the cached table and primary IP.
+    """
+    global _local_addresses, _primary_ip, _refreshed_at, _table_version
+
     config = ConfigManager()
     server_config = config.get("server")
-    
+
     configured_ip = "127.0.0.1"
     if server_config and "ip" in server_config:
         configured_ip = server_config["ip"]
-        
+
+    addresses = {"127.0.0.1"}
+    primary_ip = _probe_primary_ip()
+
     if configured_ip == "0.0.0.0":
+        addresses.add(primary_ip)
         try:
             hostname = socket.gethostname()
-            local_ips = socket.gethostbyname_ex(hostname)[2]
-            return normalized_input in local_ips
+            addresses.update(socket.gethostbyname_ex(hostname)[2])
+        except Exception:
+            pass
+    else:
+        addresses.add("127.0.0.1" if configured_ip.lower() == "localhost" else configured_ip)
+
+    table = frozenset(addresses)
+    with _local_lock:
+        if table != _local_addresses:
+            _table_version += 1
+        _local_addresses = table
+        _primary_ip = primary_ip
+        _refreshed_at = time.monotonic()
+    return table
+
+def start_local_address_refresher() -> Optional[threading.Thread]:
+    """
+    Start the background thread that rebuilds the local address table every
+    `network.local_ip_refresh` seconds. Does nothing if it is already running.
+
+    Returns:
+        Optional[threading.Thread]: The refresher thread, or None if periodic
+        refreshing is disabled (`local_ip_refresh` is 0).
+    """
+    global _refresher
+    interval = ConfigManager().get("network", {}).get("local_ip_refresh", 300.0)
+    if not interval:
+        return None
+    with _refresher_lock:
+        if _refresher is None or not _refresher.is_alive():
+            _refresher_stop.clear()
+            _refresher = threading.Thread(target=_refresh_loop, args=(interval,),
+                                          name="LocalAddressRefresher", daemon=True)
+            _refresher.start()
+        return _refresher
+
+def stop_local_address_refresher(timeout: Optional[float] = 1.0) -> None:
+    """
+    Stop the background refresher thread, if running.
+
+    Args:
+        timeout (Optional[float]): Maximum seconds to wait for the thread.
+    """
+    global _refresher
+    with _refresher_lock:
+        thread, _refresher = _refresher, None
+        _refresher_stop.set()
+    if thread is not None:
+        thread.join(timeout)
+
+def _refresh_loop(interval: float) -> None:
+    """
+    Refresher thread: rebuild the table every `interval` seconds until stopped.
+    """
+    while not _refresher_stop.wait(interval):
+        try:
+            with _refresh_lock:
+                refresh_local_addresses()
         except Exception:
+            # Keep serving the previous table; try again next interval
             pass
 
-    normalized_config = "127.0.0.1" if configured_ip.lower() == "localhost" else configured_ip
-    
-    return normalized_input == normalized_config
+def _get_local_addresses() -> FrozenSet[str]:
+    """
+    Return the cached local address table.
+
+    Only the very first call builds the table (and starts the background
+    refresher); every later call returns the cached table, so no request
+    ever waits for DNS or the interface probe.
+
+    Returns:
+        FrozenSet[str]: The set of local addresses.
+    """
+    table = _local_addresses
+    if table is not None:
+        return table
+    with _refresh_lock:
+        table = _local_addresses
+        if table is None:
+            table = refresh_local_addresses()
+    start_local_address_refresher()
+    return table
+
+def local_table_version() -> int:
+    """
+    Return a counter that changes whenever the set of local addresses changes.
+
+    Caches derived from locality (e.g. account routes) compare it to detect
+    that they must be invalidated.
+
+    Returns:
+        int: The current table version.
+    """
+    _get_local_addresses()
+    return _table_version
+
+def is_local_ip(ip_address: str) -> bool:
+    """
+    Check whether an IP address belongs to this node.
+
+    Args:
+        ip_address (str): The address to check ('localhost' is accepted).
+
+    Returns:
+        bool: True if the address is in the cached local address table.
+    """
+    if not ip_address:
+        return False
+        
+    normalized_input = "127.0.0.1" if ip_address.lower() == "localhost" else ip_address
+    return normalized_input in _get_local_addresses()
 
 def get_primary_local_ip() -> str:
-    try:
-        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
-            s.connect(("8.8.8.8", 80))
-            return s.getsockname()[0]
-    except Exception:
-        config = ConfigManager()
-        server_config = config.get("server")
-        if server_config and "ip" in server_config and server_config["ip"] != "0.0.0.0":
-            return server_config["ip"]
-        return "127.0.0.1"
+    """
+    Return the primary local IP address from the cached table.
+
+    Returns:
+        str: The address of the interface used for outbound traffic.
+    """
+    _get_local_addresses()
+    return _primary_ip
 
 def get_local_subnet_range(ip: str) -> tuple[str, str]:
     """